@@ -1,7 +1,9 @@
+from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update, or_, and_
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
-from .models import World, Team, Character, Match, TeamPlayer, Role, MatchStatus, Training, TrainingSession
+from .models import World, Team, Character, Match, MatchCheckpoint, MatchEvent, MatchSnapshot, MatchJob, JobStatus, TeamPlayer, Role, MatchStatus, Training, TrainingSession, InningHalf
 
 # World
 def create_world(db: Session, world_name: str) -> World:
@@ -194,6 +196,204 @@ def update_match_status(db: Session, match_id: int, status: MatchStatus) -> Opti
         db.refresh(match)
     return match
 
+def get_interrupted_matches(db: Session) -> List[Match]:
+    return list(db.execute(select(Match).where(Match.status == MatchStatus.IN_PROGRESS)).scalars().all())
+
+# Match Checkpoint
+def save_checkpoint(db: Session, match_id: int, pa_count: int, inning: int, half: str, state: dict) -> MatchCheckpoint:
+    checkpoint = MatchCheckpoint(match_id=match_id, pa_count=pa_count, inning=inning, half=InningHalf(half), state=state)
+    db.add(checkpoint)
+    db.commit()
+    return checkpoint
+
+def get_latest_checkpoint(db: Session, match_id: int) -> Optional[MatchCheckpoint]:
+    query = select(MatchCheckpoint).where(MatchCheckpoint.match_id == match_id).order_by(MatchCheckpoint.pa_count.desc())
+    return db.execute(query.limit(1)).scalar_one_or_none()
+
+def delete_checkpoints(db: Session, match_id: int):
+    db.query(MatchCheckpoint).filter(MatchCheckpoint.match_id == match_id).delete()
+    db.commit()
+
+# Match Event Log (event-sourced record: ordered events + half-inning snapshots)
+def add_match_events(db: Session, match_id: int, events: List[dict], snapshots: List[dict], start: Optional[dict] = None):
+    """
+    Stage new events/snapshots (GameEvent / GameSnapshot dumps); committed together with the caller's step.
+    start: the log's starting GameState, passed when `snapshots` begins with the record's first snapshot.
+    """
+    for event in events:
+        db.add(MatchEvent(match_id=match_id, seq=event["seq"], pa=event["pa"], event=event))
+    for i, snapshot in enumerate(snapshots):
+        db.add(MatchSnapshot(match_id=match_id, seq=snapshot["seq"], pa_count=snapshot["pa_count"], state=snapshot,
+                             start=start if i == 0 else None))
+
+def truncate_match_events(db: Session, match_id: int, pa_count: int):
+    """
+    Drop the record from plate appearance `pa_count` on (an interrupted run resumes from its checkpoint there).
+    Same rule as the engine's event_log.truncate: with no snapshot left the record starts over.
+    """
+    db.query(MatchEvent).filter(MatchEvent.match_id == match_id, MatchEvent.pa >= pa_count).delete()
+    kept = db.query(MatchEvent).filter(MatchEvent.match_id == match_id).count()
+    db.query(MatchSnapshot).filter(
+        MatchSnapshot.match_id == match_id, or_(MatchSnapshot.pa_count > pa_count, MatchSnapshot.seq > kept)
+    ).delete(synchronize_session=False)
+    if db.query(MatchSnapshot).filter(MatchSnapshot.match_id == match_id).count() == 0:
+        db.query(MatchEvent).filter(MatchEvent.match_id == match_id).delete()
+    db.commit()
+
+def get_match_events(db: Session, match_id: int, from_seq: int = 0, to_seq: Optional[int] = None) -> List[MatchEvent]:
+    query = select(MatchEvent).where(MatchEvent.match_id == match_id, MatchEvent.seq >= from_seq)
+    if to_seq is not None:
+        query = query.where(MatchEvent.seq < to_seq)
+    return list(db.execute(query.order_by(MatchEvent.seq)).scalars().all())
+
+def get_match_snapshots(db: Session, match_id: int) -> List[MatchSnapshot]:
+    query = select(MatchSnapshot).where(MatchSnapshot.match_id == match_id).order_by(MatchSnapshot.seq)
+    return list(db.execute(query).scalars().all())
+
+def get_replay_start(db: Session, match_id: int, seq: Optional[int]):
+    """(first snapshot, latest snapshot at or before seq) - the rows a replay to seq needs. (None, None) without a record."""
+    first = db.execute(select(MatchSnapshot).where(MatchSnapshot.match_id == match_id)
+                       .order_by(MatchSnapshot.seq).limit(1)).scalar_one_or_none()
+    query = select(MatchSnapshot).where(MatchSnapshot.match_id == match_id)
+    if seq is not None:
+        query = query.where(MatchSnapshot.seq <= seq)
+    latest = db.execute(query.order_by(MatchSnapshot.seq.desc()).limit(1)).scalar_one_or_none()
+    return first, latest
+
+def count_match_events(db: Session, match_id: int, before_pa: Optional[int] = None) -> int:
+    query = db.query(MatchEvent).filter(MatchEvent.match_id == match_id)
+    if before_pa is not None:
+        query = query.filter(MatchEvent.pa < before_pa)
+    return query.count()
+
+# Match Jobs (simulation worker queue)
+CLAIM_CANDIDATES = 5
+
+def _skip_locked(db: Session, query):
+    """
+    MariaDB/MySQL/PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED, so concurrent claimers never wait on or pick the same row.
+    SQLite has no row locks (single writer); there the compare-and-swap UPDATE in claim_match_job decides the winner.
+    """
+    if db.get_bind().dialect.name in ("mysql", "mariadb", "postgresql"):
+        return query.with_for_update(skip_locked=True)
+    return query
+
+def get_match_job(db: Session, match_id: int) -> Optional[MatchJob]:
+    return db.execute(select(MatchJob).where(MatchJob.match_id == match_id)).scalar_one_or_none()
+
+def enqueue_match_job(db: Session, match_id: int, live: bool = False) -> MatchJob:
+    """Queue a match for the workers (idempotent: a queued/running job is kept, a finished one is re-queued)."""
+    job = get_match_job(db, match_id)
+    if job is None:
+        try:
+            job = MatchJob(match_id=match_id, live=live, status=JobStatus.QUEUED)
+            db.add(job)
+            db.commit()
+            return job
+        except IntegrityError:
+            # Another request queued it first (unique match_id)
+            db.rollback()
+            job = get_match_job(db, match_id)
+    if job.status in (JobStatus.DONE, JobStatus.FAILED):
+        job.status = JobStatus.QUEUED
+        job.worker_id = None
+        job.lease_expires_at = None
+        job.fast_forward_requested = False
+        job.last_error = None
+        job.live = live
+    else:
+        job.live = job.live or live
+    db.commit()
+    return job
+
+def enqueue_next_scheduled_match(db: Session, world_id: Optional[int] = None, live: bool = False) -> Optional[MatchJob]:
+    """
+    Queue the next SCHEDULED match that has no job yet.
+    Concurrent callers get different matches (skip-locked select + unique match_id on insert).
+    """
+    query = select(Match).outerjoin(MatchJob).where(Match.status == MatchStatus.SCHEDULED, MatchJob.job_id.is_(None))
+    if world_id:
+        query = query.where(Match.world_id == world_id)
+    query = _skip_locked(db, query.order_by(Match.match_id).limit(1))
+    for _ in range(CLAIM_CANDIDATES):
+        match = db.execute(query).scalar_one_or_none()
+        if match is None:
+            db.rollback()
+            return None
+        try:
+            job = MatchJob(match_id=match.match_id, live=live, status=JobStatus.QUEUED)
+            db.add(job)
+            db.commit()
+            return job
+        except IntegrityError:
+            db.rollback()
+    return None
+
+def claim_match_job(db: Session, worker_id: str, lease_seconds: int, match_id: Optional[int] = None) -> Optional[MatchJob]:
+    """
+    Atomically take a queued job, or a running one whose lease expired (its worker died), for worker_id.
+    Live matches first, then oldest. Returns None if nothing is claimable.
+    """
+    now = datetime.utcnow()
+    claimable = or_(
+        MatchJob.status == JobStatus.QUEUED,
+        and_(MatchJob.status == JobStatus.RUNNING, MatchJob.lease_expires_at < now)
+    )
+    query = select(MatchJob).where(claimable)
+    if match_id is not None:
+        query = query.where(MatchJob.match_id == match_id)
+    query = _skip_locked(db, query.order_by(MatchJob.live.desc(), MatchJob.job_id).limit(CLAIM_CANDIDATES))
+    candidates = [(job.job_id, job.status, job.attempts) for job in db.execute(query).scalars().all()]
+    for job_id, status, attempts in candidates:
+        # Compare-and-swap on what we read: if another worker claimed it in between, no row matches
+        claimed = db.execute(
+            update(MatchJob)
+            .where(MatchJob.job_id == job_id, MatchJob.status == status, MatchJob.attempts == attempts)
+            .values(
+                status=JobStatus.RUNNING, worker_id=worker_id, attempts=attempts + 1,
+                lease_expires_at=now + timedelta(seconds=lease_seconds), heartbeat_at=now
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if claimed:
+            db.commit()
+            return db.get(MatchJob, job_id, populate_existing=True)
+    db.commit()
+    return None
+
+def heartbeat_match_job(db: Session, job_id: int, worker_id: str, lease_seconds: int) -> Optional[MatchJob]:
+    """Extend the lease. Returns None if worker_id no longer holds the job (lease expired and was re-claimed)."""
+    now = datetime.utcnow()
+    renewed = db.execute(
+        update(MatchJob)
+        .where(MatchJob.job_id == job_id, MatchJob.worker_id == worker_id, MatchJob.status == JobStatus.RUNNING)
+        .values(lease_expires_at=now + timedelta(seconds=lease_seconds), heartbeat_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return db.get(MatchJob, job_id, populate_existing=True) if renewed else None
+
+def complete_match_job(db: Session, job_id: int, worker_id: str, status: JobStatus, error: Optional[str] = None) -> bool:
+    done = db.execute(
+        update(MatchJob)
+        .where(MatchJob.job_id == job_id, MatchJob.worker_id == worker_id)
+        .values(status=status, lease_expires_at=None, last_error=error[:1024] if error else None)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return bool(done)
+
+def request_fast_forward(db: Session, match_id: int) -> Optional[MatchJob]:
+    """Flag a running job (live lease) for fast-forward; its worker picks it up on the next heartbeat."""
+    flagged = db.execute(
+        update(MatchJob)
+        .where(MatchJob.match_id == match_id, MatchJob.status == JobStatus.RUNNING, MatchJob.lease_expires_at >= datetime.utcnow())
+        .values(fast_forward_requested=True)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return get_match_job(db, match_id) if flagged else None
+
 
 # Training
 def create_training(db: Session, train_name: str, contact_delta: int = 0, power_delta: int = 0, speed_delta: int = 0) -> Training:
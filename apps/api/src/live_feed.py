@@ -0,0 +1,57 @@
+import asyncio
+import threading
+from typing import Any, Dict, List, Tuple
+
+# Per-subscriber buffer. Partial narration frames are superseded by the next one,
+# so a slow client drops them instead of growing the queue; final frames are always kept.
+QUEUE_SIZE = 256
+
+class LiveFeed:
+    """
+    Fan-out of the engine's live frames (NARRATION_PARTIAL / NARRATION_FINAL) to /ws/match subscribers.
+    publish() is called from the engine (worker thread or event loop); each subscriber gets
+    the frame on its own loop via call_soon_threadsafe.
+    """
+
+    def __init__(self, queue_size: int = QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    def subscribe(self, match_id: int) -> asyncio.Queue:
+        """Must be called from the subscriber's event loop."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(match_id, []).append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, match_id: int, queue: asyncio.Queue):
+        with self._lock:
+            subs = [s for s in self._subscribers.get(match_id, []) if s[1] is not queue]
+            if subs:
+                self._subscribers[match_id] = subs
+            else:
+                self._subscribers.pop(match_id, None)
+
+    def subscriber_count(self, match_id: int) -> int:
+        with self._lock:
+            return len(self._subscribers.get(match_id, []))
+
+    def publish(self, match_id: int, frame: Dict[str, Any]):
+        with self._lock:
+            subs = list(self._subscribers.get(match_id, []))
+        for loop, queue in subs:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, frame)
+            except RuntimeError:
+                # Subscriber's loop already closed
+                self.unsubscribe(match_id, queue)
+
+def _offer(queue: asyncio.Queue, frame: Dict[str, Any]):
+    if queue.full():
+        if not frame.get("final"):
+            return
+        queue.get_nowait() # make room for the final frame
+    queue.put_nowait(frame)
+
+live_feed = LiveFeed()
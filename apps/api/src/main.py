@@ -1,4 +1,6 @@
+import asyncio
 from fastapi import FastAPI, Depends, Header, WebSocket, WebSocketDisconnect
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from .db import get_db
@@ -6,6 +8,7 @@ from .auth_google import verify_google_id_token_from_header
 from .crud_accounts import upsert_account_from_google
 from .models import Base
 from .db import engine
+from .live_feed import live_feed
 
 from .routers import game, simulation_stream, stats
 
@@ -26,6 +29,19 @@ def startup_event():
     finally:
         db.close()
 
+@app.on_event("startup")
+async def match_worker_event():
+    # Matches interrupted by a restart are re-queued and continue from their latest checkpoint.
+    # The embedded worker runs queued matches unless dedicated workers do (python -m src.worker).
+    from .worker import requeue_interrupted, start_embedded_worker
+    requeue_interrupted()
+    start_embedded_worker()
+
+@app.on_event("shutdown")
+async def stop_match_worker_event():
+    from .worker import stop_embedded_worker
+    stop_embedded_worker()
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
@@ -42,6 +58,17 @@ app.include_router(simulation_stream.router, tags=["simulation"])
 def health():
     return {"ok": True}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    # Prometheus text exposition format (scrape target)
+    from .simulation_runner import metrics_text
+    return PlainTextResponse(metrics_text(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/llm/scheduler")
+def llm_scheduler_stats():
+    from .simulation_runner import scheduler_stats
+    return scheduler_stats()
+
 @app.get("/me")
 def me(db: Session = Depends(get_db), authorization: str | None = Header(default=None)):
     payload = verify_google_id_token_from_header(authorization)
@@ -65,12 +92,25 @@ async def ws_match(websocket: WebSocket, match_id: int):
         return
 
     await websocket.accept()
+    queue = live_feed.subscribe(match_id)
+
+    # 실시간 중계: 엔진의 NARRATION_PARTIAL(토큰 스트리밍) / NARRATION_FINAL(타석 확정) 프레임 전달
+    async def forward_live_frames():
+        while True:
+            await websocket.send_json(await queue.get())
+
+    forwarder = None
     try:
         await websocket.send_json({"type": "CONNECTED", "match_id": match_id})
+        forwarder = asyncio.create_task(forward_live_frames())
 
         # 데모: 클라이언트에서 보내는 메시지 echo
         while True:
             msg = await websocket.receive_text()
             await websocket.send_json({"type": "ECHO", "message": msg})
     except WebSocketDisconnect:
-        pass
\ No newline at end of file
+        pass
+    finally:
+        if forwarder:
+            forwarder.cancel()
+        live_feed.unsubscribe(match_id, queue)
\ No newline at end of file
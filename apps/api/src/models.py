@@ -3,7 +3,7 @@ from typing import List, Optional
 from datetime import datetime
 
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import BigInteger, String, DateTime, func, ForeignKey, Integer, Boolean, Enum, JSON
+from sqlalchemy import BigInteger, String, DateTime, func, ForeignKey, Integer, Boolean, Enum, JSON, UniqueConstraint
 
 class Base(DeclarativeBase):
     pass
@@ -18,6 +18,12 @@ class MatchStatus(str, PyEnum):
     FINISHED = "FINISHED"
     CANCELED = "CANCELED"
 
+class JobStatus(str, PyEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
 class InningHalf(str, PyEnum):
     TOP = "TOP"
     BOTTOM = "BOTTOM"
@@ -159,6 +165,71 @@ class Match(Base):
     home_team: Mapped["Team"] = relationship(foreign_keys=[home_team_id], back_populates="home_matches")
     away_team: Mapped["Team"] = relationship(foreign_keys=[away_team_id], back_populates="away_matches")
     plate_appearances: Mapped[List["PlateAppearance"]] = relationship(back_populates="match")
+    checkpoints: Mapped[List["MatchCheckpoint"]] = relationship(back_populates="match", cascade="all, delete-orphan")
+    job: Mapped[Optional["MatchJob"]] = relationship(back_populates="match", cascade="all, delete-orphan")
+    events: Mapped[List["MatchEvent"]] = relationship(back_populates="match", cascade="all, delete-orphan")
+    snapshots: Mapped[List["MatchSnapshot"]] = relationship(back_populates="match", cascade="all, delete-orphan")
+
+class MatchCheckpoint(Base):
+    """Engine checkpoint (GameState + director/manager contexts) so an interrupted match can resume."""
+    __tablename__ = "match_checkpoints"
+
+    checkpoint_id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    match_id: Mapped[int] = mapped_column(ForeignKey("matches.match_id"), nullable=False, index=True)
+    pa_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    inning: Mapped[int] = mapped_column(Integer, nullable=False)
+    half: Mapped[InningHalf] = mapped_column(Enum(InningHalf), nullable=False)
+    state: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(3), server_default=func.current_timestamp())
+
+    match: Mapped["Match"] = relationship(back_populates="checkpoints")
+
+class MatchEvent(Base):
+    """Event-sourced match record: one engine GameEvent (play / pitching change / director change) in order."""
+    __tablename__ = "match_events"
+    __table_args__ = (UniqueConstraint("match_id", "seq", name="uk_match_events_seq"),)
+
+    event_id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    match_id: Mapped[int] = mapped_column(ForeignKey("matches.match_id"), nullable=False)
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    pa: Mapped[int] = mapped_column(Integer, nullable=False)
+    event: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    match: Mapped["Match"] = relationship(back_populates="events")
+
+class MatchSnapshot(Base):
+    """Half-inning GameSnapshot of the event log; replays start from the latest one before the requested seq."""
+    __tablename__ = "match_snapshots"
+
+    snapshot_id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    match_id: Mapped[int] = mapped_column(ForeignKey("matches.match_id"), nullable=False, index=True)
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    pa_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    state: Mapped[dict] = mapped_column(JSON, nullable=False)
+    start: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True) # first snapshot only: GameState with rosters
+
+    match: Mapped["Match"] = relationship(back_populates="snapshots")
+
+class MatchJob(Base):
+    """
+    Simulation job for a match (one row per match), claimed by worker processes under a lease.
+    A worker that stops heartbeating loses the lease and the match is picked up again from its latest checkpoint.
+    """
+    __tablename__ = "match_jobs"
+
+    job_id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    match_id: Mapped[int] = mapped_column(ForeignKey("matches.match_id"), nullable=False, unique=True)
+    status: Mapped[JobStatus] = mapped_column(Enum(JobStatus), default=JobStatus.QUEUED, index=True)
+    live: Mapped[bool] = mapped_column(Boolean, default=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    worker_id: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(3), nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(3), nullable=True)
+    fast_forward_requested: Mapped[bool] = mapped_column(Boolean, default=False)
+    last_error: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(3), server_default=func.current_timestamp())
+
+    match: Mapped["Match"] = relationship(back_populates="job")
 
 class PlateAppearance(Base):
     __tablename__ = "plate_appearances"
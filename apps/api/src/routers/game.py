@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Header
+from fastapi import APIRouter, Depends, HTTPException, Header
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
@@ -8,7 +8,7 @@ from .. import crud_game
 from ..models import MatchStatus
 from ..auth_google import verify_google_id_token_from_header
 from ..crud_accounts import upsert_account_from_google
-from ..simulation_runner import run_match_background
+from ..simulation_runner import fast_forward_match, match_state_at
 
 router = APIRouter()
 
@@ -164,25 +164,72 @@ def get_match(match_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Match not found")
     return match
 
+@router.get("/matches/{match_id}/state")
+def get_match_state(match_id: int, seq: Optional[int] = None, pa: Optional[int] = None, db: Session = Depends(get_db)):
+    """
+    Match state after `seq` events of its event log, or right before plate appearance `pa` (0-based);
+    the latest recorded state if neither is given. Replays from the nearest half-inning snapshot.
+    """
+    if not crud_game.get_match(db, match_id):
+        raise HTTPException(status_code=404, detail="Match not found")
+    try:
+        state = match_state_at(db, match_id, seq=seq, pa=pa)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if state is None:
+        raise HTTPException(status_code=404, detail="Match has no event log")
+    return state
+
 class PlayRequest(BaseModel):
     world_id: Optional[int] = None
+    live: bool = True # a viewer is watching: LLM calls outrank background (NPC) simulations
 
 @router.post("/play")
-def play_match(body: PlayRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+def play_match(body: PlayRequest, db: Session = Depends(get_db)):
     """
-    Finds the next SCHEDULED match and starts the simulation in background.
+    Queues the next SCHEDULED match for the simulation workers.
+    Concurrent calls queue different matches; the job survives API restarts.
     """
-    # 1. Find a generic scheduled match (or create one for testing?)
-    # For now, just pick the first SCHEDULED match.
-    match = crud_game.get_next_scheduled_match(db, body.world_id)
-    if not match:
+    job = crud_game.enqueue_next_scheduled_match(db, body.world_id, body.live)
+    if not job:
         raise HTTPException(status_code=404, detail="No scheduled matches found")
-    
-    # 2. Start Background Task
-    background_tasks.add_task(run_match_background, match.match_id, db)
-    
-    return {"status": "started", "match_id": match.match_id, "message": "Simulation started in background"}
 
+    return {"status": "queued", "match_id": job.match_id, "job_id": job.job_id, "message": "Simulation queued for a worker"}
+
+
+@router.post("/matches/{match_id}/resume")
+def resume_match(match_id: int, db: Session = Depends(get_db)):
+    """
+    Restarts an interrupted (IN_PROGRESS / CANCELED) match from its latest checkpoint.
+    """
+    match = crud_game.get_match(db, match_id)
+    if not match:
+        raise HTTPException(status_code=404, detail="Match not found")
+    if match.status not in (MatchStatus.IN_PROGRESS, MatchStatus.CANCELED):
+        raise HTTPException(status_code=400, detail=f"Match is {match.status.value}")
+
+    checkpoint = crud_game.get_latest_checkpoint(db, match_id)
+    job = crud_game.enqueue_match_job(db, match.match_id, live=True)
+    return {"status": "resumed", "match_id": match.match_id, "job_id": job.job_id, "from_pa": checkpoint.pa_count if checkpoint else 0}
+
+@router.post("/matches/{match_id}/fast-forward")
+def fast_forward(match_id: int, db: Session = Depends(get_db)):
+    """
+    Simulates the rest of a scheduled / in-progress / interrupted match instantly
+    with the stat-based resolver instead of LLM calls.
+    A match running on this server switches over at its next plate appearance ("fast_forwarding");
+    otherwise the match is finished within this request ("finished", with the final score).
+    """
+    match = crud_game.get_match(db, match_id)
+    if not match:
+        raise HTTPException(status_code=404, detail="Match not found")
+    if match.status == MatchStatus.FINISHED:
+        raise HTTPException(status_code=400, detail=f"Match is {match.status.value}")
+
+    result = fast_forward_match(match_id, db)
+    if result is None:
+        raise HTTPException(status_code=503, detail="Simulation engine not available")
+    return result
 
 @router.get("/trainings")
 def list_trainings(db: Session = Depends(get_db)):
@@ -1,7 +1,12 @@
 import sys
 import os
+import time
+import asyncio
 import json
 import logging
+import functools
+import threading
+from typing import Any, Callable, NamedTuple, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -12,31 +17,50 @@ sys.path.append("/app/simulation_module")
 try:
     from simulation_module import engine
     from simulation_module import models as sim_models
+    from simulation_module import expectancy
+    from simulation_module import metrics
+    from simulation_module import event_log
 except ImportError as e:
     logging.warning(f"Simulation module not found. Is it mounted correctly? {e}")
     engine = None
     sim_models = None
+    expectancy = None
+    metrics = None
+    event_log = None
 
 from . import models as db_models
-from .models import MatchStatus, ResultCode, InningHalf
+from . import crud_game
+from .live_feed import live_feed
+from .models import MatchStatus, ResultCode, InningHalf, JobStatus
 
 logger = logging.getLogger(__name__)
 
-def run_match_background(match_id: int, db: Session):
+class PreparedMatch(NamedTuple):
+    match: Any
+    game_state: Any
+    on_step: Callable
+    on_narration: Callable
+    on_checkpoint: Callable
+    resume_from: Optional[Any] # latest engine checkpoint (None: start from the first pitch)
+    event_log: Any # engine GameEventLog, persisted to match_events / match_snapshots on every step
+
+def _prepare_match(match_id: int, db: Session):
     """
-    Background task to run the simulation for a given match_id.
+    Load the match, mark it IN_PROGRESS and build the simulation GameState.
+    If the match has a checkpoint (interrupted run), the engine resumes from it instead of replaying finished innings.
+    Returns a PreparedMatch or None if the match can't be simulated.
     """
     logger.info(f"Starting simulation for match_id={match_id}...")
     
     if not engine or not sim_models:
         logger.error("Simulation engine not loaded. Aborting.")
-        return
+        return None
 
     # 1. Load Match & Entities from DB
     match = db.query(db_models.Match).filter(db_models.Match.match_id == match_id).first()
     if not match:
         logger.error(f"Match {match_id} not found.")
-        return
+        return None
 
     # Update Status to IN_PROGRESS
     match.status = MatchStatus.IN_PROGRESS
@@ -153,6 +177,20 @@ def run_match_background(match_id: int, db: Session):
     }
     logs_history = []
 
+    # Resume: keep the broadcast logs up to the checkpoint, the engine replays nothing before it
+    resume_from = None
+    checkpoint_row = crud_game.get_latest_checkpoint(db, match.match_id)
+    if checkpoint_row:
+        resume_from = sim_models.MatchCheckpoint.model_validate(checkpoint_row.state)
+        previous_state["home_score"] = resume_from.game.home_score
+        previous_state["away_score"] = resume_from.game.away_score
+        logs_history = list((match.game_state or {}).get("logs", []))[:resume_from.pa_count]
+        logger.info(f"Resuming match {match.match_id} from PA {resume_from.pa_count}")
+
+    # Event-sourced record: keep what the checkpoint covers, the engine appends from there
+    game_log = _load_event_log(db, match.match_id, resume_from.pa_count if resume_from else 0)
+    persisted = {"events": len(game_log.events), "snapshots": len(game_log.snapshots)}
+
     # 3. Define Callback to Save Progress
     def on_step(updated_game: sim_models.GameState):
         logger.info(f"Stepped: {updated_game.inning} {updated_game.half} - Outs: {updated_game.outs}")
@@ -219,40 +257,249 @@ def run_match_background(match_id: int, db: Session):
             "current_pitcher": p_to_d(updated_game.get_current_pitcher()),
             "runners": runners,
             "result": sim_result,
-            "next_batter": updated_game.get_next_batter_info()
+            "next_batter": updated_game.get_next_batter_info(),
+            # Win probability / leverage from the precomputed expectancy tables (no simulation per step)
+            "win_probability": round(updated_game.win_probability, 4) if updated_game.win_probability is not None else None,
+            "leverage_index": round(updated_game.leverage_index, 2) if updated_game.leverage_index is not None else None,
+            "leverage_label": expectancy.leverage_label(updated_game.leverage_index) if updated_game.leverage_index is not None else None
         }
         
         logs_history.append(broadcast_data)
 
+        # New events / snapshots since the last step (committed with it)
+        new_events = game_log.events[persisted["events"]:]
+        new_snapshots = game_log.snapshots[persisted["snapshots"]:]
+        crud_game.add_match_events(
+            db, match.match_id, [e.model_dump(mode="json") for e in new_events], [s.model_dump(mode="json") for s in new_snapshots],
+            start=game_log.start.model_dump(mode="json") if new_snapshots and persisted["snapshots"] == 0 else None
+        )
+        persisted["events"] += len(new_events)
+        persisted["snapshots"] += len(new_snapshots)
+
         # Save to DB
         # We wrap it in a dict as expected by frontend: match.game_state.logs
         match.game_state = { "logs": logs_history }
         match.home_score = updated_game.home_score
         match.away_score = updated_game.away_score
         
+        commit_start = time.perf_counter()
         db.commit()
+        metrics.STEP_DB_COMMIT.observe(time.perf_counter() - commit_start)
+
+    # Batched narration arrives after the step was saved: patch the stored log in place.
+    # Called on the engine's thread; committed with the next step (or when the match finishes).
+    def on_narration(seq: int, description: str):
+        if seq < len(logs_history):
+            logs_history[seq]["result"]["description"] = description
+            match.game_state = { "logs": list(logs_history) }
     
-    # 4. Run Engine
-    try:
-        # [Phase 2] Injected DB session
-        final_state = engine.run_engine(game_state=game_state, db_session=db, on_step_callback=on_step)
-        
-        # Match Finished
-        match.status = MatchStatus.FINISHED
-        match.finished_at = datetime.utcnow()
-        if final_state.home_score > final_state.away_score:
-            match.winner_team_id = match.home_team_id
-            match.loser_team_id = match.away_team_id
-        elif final_state.away_score > final_state.home_score:
-            match.winner_team_id = match.away_team_id
-            match.loser_team_id = match.home_team_id
-            
-        db.commit()
-        logger.info(f"Simulation finished for match {match_id}")
+    def on_checkpoint(checkpoint: sim_models.MatchCheckpoint):
+        crud_game.save_checkpoint(
+            db, match.match_id, checkpoint.pa_count, checkpoint.game.inning, checkpoint.game.half.value,
+            checkpoint.model_dump(mode="json")
+        )
+
+    return PreparedMatch(match, game_state, on_step, on_narration, on_checkpoint, resume_from, game_log)
+
+def _load_event_log(db: Session, match_id: int, pa_count: int):
+    """Stored event log truncated to `pa_count` plate appearances (empty for a match starting from the first pitch)."""
+    crud_game.truncate_match_events(db, match_id, pa_count)
+    snapshots = crud_game.get_match_snapshots(db, match_id)
+    if not snapshots:
+        return sim_models.GameEventLog()
+    return sim_models.GameEventLog(
+        start=snapshots[0].start,
+        events=[row.event for row in crud_game.get_match_events(db, match_id)],
+        snapshots=[row.state for row in snapshots]
+    )
+
+def match_state_at(db: Session, match_id: int, seq: Optional[int] = None, pa: Optional[int] = None) -> Optional[dict]:
+    """
+    Rebuild the match state after `seq` events (or right before plate appearance `pa`; latest if neither)
+    from the nearest half-inning snapshot plus the events after it.
+    Returns None if the match has no event log; raises ValueError for a seq outside the log.
+    """
+    if pa is not None:
+        seq = crud_game.count_match_events(db, match_id, before_pa=pa)
+    first, snapshot = crud_game.get_replay_start(db, match_id, seq)
+    if first is None:
+        return None
+    if snapshot is None:
+        raise ValueError(f"seq {seq} is before the start of the log (seq {first.seq})")
+    log = sim_models.GameEventLog(
+        start=first.start,
+        events=[row.event for row in crud_game.get_match_events(db, match_id, snapshot.seq, seq)],
+        snapshots=[snapshot.state]
+    )
+    if seq is None:
+        seq = snapshot.seq + len(log.events)
+    game = event_log.replay(log, seq)
+    return {"match_id": match_id, "seq": seq, "from_snapshot": snapshot.seq, "game": game.model_dump(mode="json", exclude={"logs"})}
+
+def _finish_match(match, final_state, db: Session):
+    # Match Finished
+    match.status = MatchStatus.FINISHED
+    match.finished_at = datetime.utcnow()
+    if final_state.home_score > final_state.away_score:
+        match.winner_team_id = match.home_team_id
+        match.loser_team_id = match.away_team_id
+    elif final_state.away_score > final_state.home_score:
+        match.winner_team_id = match.away_team_id
+        match.loser_team_id = match.home_team_id
         
+    db.commit()
+    crud_game.delete_checkpoints(db, match.match_id)
+    logger.info(f"Simulation finished for match {match.match_id}")
+
+def _fail_match(match, db: Session, e: Exception):
+    logger.error(f"Simulation failed: {e}")
+    # db.rollback() # Safe to rollback or just log?
+    match.status = MatchStatus.CANCELED # Or keep as IN_PROGRESS to retry?
+    db.commit()
+
+# Engine mode / plate-appearance resolver for API-run matches (names of sim_models.EngineMode / ResolverBackend)
+ENGINE_MODE = os.environ.get("MATCH_ENGINE_MODE", "MULTI_AGENT")
+ENGINE_RESOLVER = os.environ.get("MATCH_RESOLVER", "LLM")
+
+def _engine_config(live: bool):
+    """
+    Engine settings for a match run.
+    Mode and resolver come from MATCH_ENGINE_MODE / MATCH_RESOLVER (e.g. SINGLE_CALL, STAT);
+    live matches (someone is watching) get LLM scheduler priority over background/NPC simulations.
+    """
+    priority = sim_models.LLMPriority.LIVE if live else sim_models.LLMPriority.BACKGROUND
+    return sim_models.EngineConfig(
+        mode=sim_models.EngineMode(ENGINE_MODE), resolver=sim_models.ResolverBackend(ENGINE_RESOLVER), priority=priority
+    )
+
+def metrics_text() -> str:
+    """Engine metrics (node latency, LLM calls/tokens, retries, PA/s, step commit time) in Prometheus text format."""
+    return metrics.render() if metrics else ""
+
+def scheduler_stats() -> dict:
+    """LLM scheduler queue depth / wait times (empty when the simulation module is missing)."""
+    return engine.get_llm_scheduler().stats() if engine else {}
+
+# match_id -> fast-forward request flag of the engine run currently simulating it (this process only)
+_fast_forward_events: dict = {}
+
+# Worker lease on a match job; a worker heartbeats every third of it
+JOB_LEASE_SECONDS = int(os.environ.get("MATCH_JOB_LEASE_SECONDS", "60"))
+
+class LeaseLost(Exception):
+    """The worker's job lease was taken over by another worker; this run must not write anything more."""
+
+def _guarded(stop: Optional[threading.Event], fn: Callable) -> Callable:
+    """fn, but raising LeaseLost instead of running once `stop` is set (checked before every DB write)."""
+    def call(*args):
+        if stop is not None and stop.is_set():
+            raise LeaseLost()
+        return fn(*args)
+    return call
+
+def _threaded(fn: Callable) -> Callable:
+    """Run a blocking (DB-committing) callback in a worker thread so it doesn't stall the event loop."""
+    return lambda *args: asyncio.to_thread(fn, *args)
+
+async def arun_match_background(
+    match_id: int, db: Session, live: bool = False, fast_forward: Optional[threading.Event] = None,
+    stop: Optional[threading.Event] = None
+):
+    """
+    Background task to run the simulation for a given match_id (called by the match worker that holds its job).
+    Awaits engine.arun_engine so many matches can share one event loop instead of a worker thread each;
+    the step/checkpoint commits run in a worker thread.
+    fast_forward: set by the match worker when a fast-forward was requested through the job table.
+    stop: set by the match worker when it lost the job lease. The run stops at its next write and leaves
+    the match (status, checkpoints, event log) to the worker that holds the lease now.
+    """
+    prepared = await asyncio.to_thread(_prepare_match, match_id, db)
+    if not prepared:
+        return
+
+    fast_forward = _fast_forward_events[match_id] = fast_forward or threading.Event()
+    try:
+        final_state = await engine.arun_engine(
+            game_state=prepared.game_state, db_session=db, on_step_callback=_threaded(_guarded(stop, prepared.on_step)),
+            config=_engine_config(live), on_narration_callback=prepared.on_narration,
+            on_checkpoint=_threaded(_guarded(stop, prepared.on_checkpoint)), resume_from=prepared.resume_from,
+            on_live_callback=functools.partial(live_feed.publish, match_id), fast_forward=fast_forward,
+            event_log=prepared.event_log
+        )
+        await asyncio.to_thread(_guarded(stop, _finish_match), prepared.match, final_state, db)
     except Exception as e:
-        logger.error(f"Simulation failed: {e}")
-        # db.rollback() # Safe to rollback or just log?
-        match.status = MatchStatus.CANCELED # Or keep as IN_PROGRESS to retry?
-        db.commit()
+        if stop is not None and stop.is_set():
+            logger.warning(f"Stopped simulating match {match_id}: job lease lost")
+            await asyncio.to_thread(db.rollback)
+        else:
+            await asyncio.to_thread(_fail_match, prepared.match, db, e)
+    finally:
+        if _fast_forward_events.get(match_id) is fast_forward:
+            _fast_forward_events.pop(match_id, None)
+
+_FAST_FORWARD_WORKER = "api:fast-forward"
+
+def fast_forward_match(match_id: int, db: Session) -> Optional[dict]:
+    """
+    Finish a match instantly with the engine's seeded statistical resolver (no LLM calls).
+    - Running (in this process or on a worker holding its job lease): the engine stops its LLM graph
+      at the next plate appearance and finishes the rest itself (same on_step / finish path as a normal run).
+    - Scheduled or interrupted: its job is claimed here and the match simulated from the latest checkpoint
+      (or the first pitch).
+    Returns None if the match can't be simulated.
+    """
+    running = _fast_forward_events.get(match_id)
+    if running:
+        running.set()
+        return {"status": "fast_forwarding", "match_id": match_id}
+    if crud_game.request_fast_forward(db, match_id):
+        return {"status": "fast_forwarding", "match_id": match_id}
+
+    # Hold the job so no worker starts the LLM simulation meanwhile
+    crud_game.enqueue_match_job(db, match_id)
+    job = crud_game.claim_match_job(db, _FAST_FORWARD_WORKER, JOB_LEASE_SECONDS, match_id=match_id)
+    if job is None:
+        # A worker claimed it first: let that run switch over
+        crud_game.request_fast_forward(db, match_id)
+        return {"status": "fast_forwarding", "match_id": match_id}
+
+    prepared = _prepare_match(match_id, db)
+    if not prepared:
+        crud_game.complete_match_job(db, job.job_id, _FAST_FORWARD_WORKER, JobStatus.FAILED, "match can't be simulated")
+        return None
 
+    game_state = prepared.resume_from.game if prepared.resume_from else prepared.game_state
+    from_pa = prepared.resume_from.pa_count if prepared.resume_from else 0
+    config = engine.fast_forward_config(_engine_config(False), game_state.match_id, from_pa)
+    # Drop the interrupted run's RNG state so the result depends only on the match and the checkpoint
+    resume_from = prepared.resume_from.model_copy(update={"rng_state": None}) if prepared.resume_from else None
+    try:
+        final_state = engine.run_engine(
+            game_state=prepared.game_state, db_session=db, on_step_callback=prepared.on_step, config=config,
+            on_narration_callback=prepared.on_narration, on_checkpoint=prepared.on_checkpoint, resume_from=resume_from,
+            on_live_callback=functools.partial(live_feed.publish, match_id), event_log=prepared.event_log
+        )
+        _finish_match(prepared.match, final_state, db)
+    except Exception as e:
+        _fail_match(prepared.match, db, e)
+        crud_game.complete_match_job(db, job.job_id, _FAST_FORWARD_WORKER, JobStatus.FAILED, str(e))
+        raise
+    crud_game.complete_match_job(db, job.job_id, _FAST_FORWARD_WORKER, JobStatus.DONE)
+    return {
+        "status": "finished", "match_id": match_id, "from_pa": from_pa,
+        "home_score": final_state.home_score, "away_score": final_state.away_score
+    }
+
+def enqueue_interrupted_matches(db: Session) -> int:
+    """
+    Matches left IN_PROGRESS without a live job (e.g. started before the job queue, or the job was lost)
+    are queued again; a worker continues them from their latest checkpoint.
+    """
+    queued = 0
+    for match in crud_game.get_interrupted_matches(db):
+        job = crud_game.get_match_job(db, match.match_id)
+        if job is None or job.status in (JobStatus.DONE, JobStatus.FAILED):
+            crud_game.enqueue_match_job(db, match.match_id)
+            logger.info(f"Re-queued interrupted match {match.match_id}")
+            queued += 1
+    return queued
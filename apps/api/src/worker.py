@@ -0,0 +1,181 @@
+"""
+Match simulation worker.
+
+Claims match jobs from the `match_jobs` table under a lease, runs them with the async engine
+and heartbeats until the match is done. Scale simulation throughput by starting more workers:
+
+    python -m src.worker --concurrency 4
+
+The API runs an embedded worker by default (EMBEDDED_MATCH_WORKERS, default 1). Set it to 0 only when
+dedicated workers are deployed, and note that the live feed (WebSocket token streaming), the engine
+metrics (/metrics) and the LLM scheduler stats (/llm/scheduler) are per process: the API process
+reports nothing for matches simulated by a separate worker.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import threading
+from typing import Optional
+
+from . import crud_game
+from .db import SessionLocal
+from .models import JobStatus, MatchStatus
+from .simulation_runner import JOB_LEASE_SECONDS, arun_match_background, enqueue_interrupted_matches
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = float(os.environ.get("MATCH_JOB_POLL_SECONDS", "2"))
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def _renew(job_id: int, worker_id: str):
+    db = SessionLocal()
+    try:
+        job = crud_game.heartbeat_match_job(db, job_id, worker_id, JOB_LEASE_SECONDS)
+        return (True, job.fast_forward_requested) if job else (False, False)
+    finally:
+        db.close()
+
+async def _heartbeat(job_id: int, worker_id: str, fast_forward: threading.Event, lease_lost: threading.Event):
+    """
+    Renew the lease every third of it; relay fast-forward requests made through the job table.
+    If the lease is gone (expired and re-claimed), set lease_lost so the run stops before its next write.
+    """
+    while True:
+        await asyncio.sleep(JOB_LEASE_SECONDS / 3)
+        try:
+            held, fast_forward_requested = await asyncio.to_thread(_renew, job_id, worker_id)
+        except Exception as e:
+            logger.warning(f"Heartbeat failed for job {job_id}: {e}")
+            continue
+        if not held:
+            logger.error(f"Worker {worker_id} lost the lease on job {job_id}; stopping its run")
+            lease_lost.set()
+            return
+        if fast_forward_requested:
+            fast_forward.set()
+
+def _complete(job_id: int, match_id: int, worker_id: str):
+    db = SessionLocal()
+    try:
+        match = crud_game.get_match(db, match_id)
+        db.refresh(match)
+        if match.status == MatchStatus.FINISHED:
+            crud_game.complete_match_job(db, job_id, worker_id, JobStatus.DONE)
+        else:
+            crud_game.complete_match_job(db, job_id, worker_id, JobStatus.FAILED, f"Match ended {match.status.value}")
+    finally:
+        db.close()
+
+def _fail(job_id: int, worker_id: str, error: str):
+    db = SessionLocal()
+    try:
+        crud_game.complete_match_job(db, job_id, worker_id, JobStatus.FAILED, error)
+    finally:
+        db.close()
+
+async def run_job(job_id: int, match_id: int, live: bool, worker_id: str):
+    fast_forward, lease_lost = threading.Event(), threading.Event()
+    heartbeat = asyncio.create_task(_heartbeat(job_id, worker_id, fast_forward, lease_lost))
+    db = SessionLocal()
+    try:
+        await arun_match_background(match_id, db, live, fast_forward=fast_forward, stop=lease_lost)
+        if lease_lost.is_set():
+            # The job belongs to another worker now: its run completes it
+            return
+        await asyncio.to_thread(_complete, job_id, match_id, worker_id)
+    except Exception as e:
+        logger.exception(f"Job {job_id} (match {match_id}) failed")
+        if not lease_lost.is_set():
+            await asyncio.to_thread(_fail, job_id, worker_id, str(e))
+    finally:
+        heartbeat.cancel()
+        await asyncio.to_thread(db.close)
+
+def _claim(worker_id: str):
+    db = SessionLocal()
+    try:
+        job = crud_game.claim_match_job(db, worker_id, JOB_LEASE_SECONDS)
+        return (job.job_id, job.match_id, job.live) if job else None
+    finally:
+        db.close()
+
+async def worker_loop(worker_id: str, concurrency: int, stop: asyncio.Event):
+    """Keep up to `concurrency` matches running; poll for new jobs while below it."""
+    running: set = set()
+    logger.info(f"Match worker {worker_id} started (concurrency {concurrency})")
+    while not stop.is_set():
+        while len(running) < concurrency:
+            try:
+                claimed = await asyncio.to_thread(_claim, worker_id)
+            except Exception as e:
+                logger.warning(f"Claiming a job failed: {e}")
+                claimed = None
+            if not claimed:
+                break
+            job_id, match_id, live = claimed
+            logger.info(f"Worker {worker_id} claimed job {job_id} (match {match_id})")
+            task = asyncio.create_task(run_job(job_id, match_id, live, worker_id))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        try:
+            await asyncio.wait_for(stop.wait(), POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+    # Finish the matches in hand; unstarted work stays queued for other workers
+    if running:
+        await asyncio.gather(*running, return_exceptions=True)
+    logger.info(f"Match worker {worker_id} stopped")
+
+# --- Embedded worker (API process) ---
+
+_embedded_stop: Optional[asyncio.Event] = None
+_embedded_task: Optional[asyncio.Task] = None
+
+def start_embedded_worker():
+    global _embedded_stop, _embedded_task
+    concurrency = int(os.environ.get("EMBEDDED_MATCH_WORKERS", "1"))
+    if concurrency <= 0:
+        logger.warning("Embedded match worker disabled: live token streaming, /metrics and /llm/scheduler "
+                       "on this process won't cover matches run by dedicated workers")
+        return
+    if _embedded_task:
+        return
+    _embedded_stop = asyncio.Event()
+    _embedded_task = asyncio.create_task(worker_loop(f"{default_worker_id()}:api", concurrency, _embedded_stop))
+
+def stop_embedded_worker():
+    if _embedded_stop:
+        _embedded_stop.set()
+
+def requeue_interrupted():
+    db = SessionLocal()
+    try:
+        return enqueue_interrupted_matches(db)
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Baseball simulation match worker")
+    parser.add_argument("--concurrency", type=int, default=int(os.environ.get("MATCH_WORKER_CONCURRENCY", "4")),
+                        help="matches simulated at once by this process")
+    parser.add_argument("--worker-id", default=default_worker_id())
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    async def run():
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        requeue_interrupted()
+        await worker_loop(args.worker_id, args.concurrency, stop)
+
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
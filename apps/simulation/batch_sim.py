@@ -0,0 +1,149 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .models import GameState, Half, PlayerState, Team
+from .rule_engine import N_BASE_STATES, TRANSITIONS, base_mask, play_index
+from .stat_resolver import OUTCOMES, defense_ratings, matchup_probabilities
+
+def build_transition_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    rule_engine.TRANSITIONS에서 OUTCOMES 행만 뽑아 NumPy 전이 표 생성.
+    반환: next_bases[outcome, mask], runs[outcome, mask], outs_added[outcome]
+    (현재 규칙은 아웃 수와 무관하므로 0아웃 칸을 사용)
+    """
+    next_bases = np.zeros((len(OUTCOMES), N_BASE_STATES), dtype=np.int8)
+    runs = np.zeros((len(OUTCOMES), N_BASE_STATES), dtype=np.int8)
+    outs_added = np.zeros(len(OUTCOMES), dtype=np.int8)
+
+    for o, code in enumerate(OUTCOMES):
+        for mask, move in enumerate(TRANSITIONS[play_index(code)][0]):
+            next_bases[o, mask] = move.bases
+            runs[o, mask] = move.runs
+            outs_added[o] = move.outs
+    return next_bases, runs, outs_added
+
+NEXT_BASES, RUNS, OUTS_ADDED = build_transition_tables()
+
+def lineup(team: Team) -> List[PlayerState]:
+    """타순 (Team.get_batter와 같은 순서)"""
+    return list(team.get_lineup())
+
+def matchup_table(offense: Team, defense: Team) -> np.ndarray:
+    """
+    공격 팀 타순 x 결과별 누적 확률 (상대 팀 현재 투수 + 수비 기준).
+    shape: (타자 수, len(OUTCOMES)), 각 행의 마지막 값은 1.0
+    """
+    pitcher = defense.get_pitcher().character
+    defense_stats = defense_ratings(defense)
+    rows = []
+    for batter in lineup(offense):
+        probs = matchup_probabilities(batter.character, pitcher, defense_stats)
+        rows.append([probs[o] for o in OUTCOMES])
+    table = np.cumsum(np.array(rows, dtype=np.float64), axis=1)
+    table[:, -1] = 1.0
+    return table
+
+class BatchResult:
+    """배치 시뮬레이션 결과 (경기별 배열)"""
+
+    def __init__(self, home_scores: np.ndarray, away_scores: np.ndarray, innings: np.ndarray):
+        self.home_scores = home_scores
+        self.away_scores = away_scores
+        self.innings = innings
+
+    def __len__(self) -> int:
+        return len(self.home_scores)
+
+    @property
+    def home_win_rate(self) -> float:
+        """홈 승률 (최대 이닝까지 동점이면 0.5승으로 계산)"""
+        wins = (self.home_scores > self.away_scores).sum() + 0.5 * (self.home_scores == self.away_scores).sum()
+        return float(wins / len(self))
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "games": len(self),
+            "home_win_rate": round(self.home_win_rate, 4),
+            "home_runs_avg": round(float(self.home_scores.mean()), 3),
+            "away_runs_avg": round(float(self.away_scores.mean()), 3),
+            "extra_innings_rate": round(float((self.innings > 9).mean()), 4),
+        }
+
+class BatchSimulator:
+    """
+    NumPy 벡터화 배치 경기 시뮬레이터.
+    수천~수십만 경기의 주자/아웃/점수/타순을 배열로 들고, 하프이닝마다 모든 경기를 한 번에 진행합니다.
+    - 타석 결과: 타순별 odds-ratio 확률 (stat_resolver와 동일, 작전/환경/투수 교체는 반영하지 않음)
+    - 진루/득점/아웃: BaseballRuleEngine과 같은 전이 표 (rule_engine.TRANSITIONS)
+    - 종료 조건: engine.check_inning_node와 동일 (9회 이후 말 공격 종료 시 점수가 다르면 종료)
+    """
+
+    def __init__(self, home_team: Team, away_team: Team, rng: Optional[np.random.Generator] = None, max_innings: int = 15):
+        self.rng = rng or np.random.default_rng()
+        self.max_innings = max_innings
+        # 초: 원정 공격 vs 홈 투수, 말: 홈 공격 vs 원정 투수
+        self.away_table = matchup_table(away_team, home_team)
+        self.home_table = matchup_table(home_team, away_team)
+
+    @classmethod
+    def from_game(cls, game: GameState, **kwargs) -> "BatchSimulator":
+        return cls(game.home_team, game.away_team, **kwargs)
+
+    def _play_half(self, table: np.ndarray, playing: np.ndarray, score: np.ndarray, pointer: np.ndarray,
+                   outs: np.ndarray, bases: np.ndarray):
+        """playing인 경기들의 하프이닝을 3아웃까지 진행 (배열 제자리 갱신)"""
+        n_batters, n_outcomes = table.shape
+        # 타순별 누적 확률을 한 줄로 펼침 (i번 타자는 [i, i+1) 구간) -> searchsorted 한 번으로 샘플링
+        flat = (table + np.arange(n_batters)[:, None]).ravel()
+        idx = np.flatnonzero(playing & (outs < 3))
+        while len(idx):
+            slot = pointer[idx] % n_batters
+            u = self.rng.random(len(idx)) + slot
+            outcome = np.searchsorted(flat, u, side="right") - slot * n_outcomes
+            current = bases[idx]
+            score[idx] += RUNS[outcome, current]
+            bases[idx] = NEXT_BASES[outcome, current]
+            half_outs = outs[idx] + OUTS_ADDED[outcome]
+            outs[idx] = half_outs
+            pointer[idx] += 1
+            idx = idx[half_outs < 3]
+
+    def simulate(self, n_games: int, start: Optional[GameState] = None) -> BatchResult:
+        """
+        n_games 경기를 진행. start가 주어지면 그 GameState 시점(이닝/초말/아웃/주자/점수/타순)부터 이어서 진행합니다.
+        """
+        inning, half = 1, Half.TOP
+        home = np.zeros(n_games, dtype=np.int32)
+        away = np.zeros(n_games, dtype=np.int32)
+        home_ptr = np.zeros(n_games, dtype=np.int64)
+        away_ptr = np.zeros(n_games, dtype=np.int64)
+        outs = np.zeros(n_games, dtype=np.int8)
+        bases = np.zeros(n_games, dtype=np.int8)
+
+        if start is not None:
+            inning, half = start.inning, start.half
+            home += start.home_score
+            away += start.away_score
+            # GameState의 타순 인덱스는 1부터 시작
+            home_ptr += start.current_batter_index_home - 1
+            away_ptr += start.current_batter_index_away - 1
+            outs += start.outs
+            bases += base_mask(start.bases)
+
+        playing = np.ones(n_games, dtype=bool)
+        innings = np.full(n_games, inning, dtype=np.int16)
+        while inning <= self.max_innings and playing.any():
+            if half == Half.TOP:
+                self._play_half(self.away_table, playing, away, away_ptr, outs, bases)
+                half = Half.BOTTOM
+            else:
+                self._play_half(self.home_table, playing, home, home_ptr, outs, bases)
+                half = Half.TOP
+                if inning >= 9:
+                    playing &= home == away
+                inning += 1
+                innings[playing] = inning
+            outs[:] = 0
+            bases[:] = 0
+        return BatchResult(home, away, np.minimum(innings, self.max_innings))
@@ -0,0 +1,79 @@
+"""
+카세트 재생 기반 엔진 벤치마크 (네트워크 없이 그래프/규칙 엔진/기록 오버헤드만 측정).
+
+    # 1. 실제 LLM으로 녹화 (OPENAI_API_KEY 필요)
+    python -m apps.simulation.benchmark --cassette cassettes/multi_agent.jsonl --record --games 1
+    # 2. 재생 (CI: --max-ms-per-pa 초과 시 exit 1)
+    python -m apps.simulation.benchmark --cassette cassettes/multi_agent.jsonl --games 5 --max-ms-per-pa 50
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from . import engine
+from .cassette import CassetteLLM
+from .dummy_generator import init_dummy_game, get_faker
+from .models import EngineConfig, EngineMode
+
+def seeded_game(seed: int):
+    """같은 seed면 같은 선수/능력치의 더미 경기 (재생 시 프롬프트가 녹화와 일치)"""
+    random.seed(seed)
+    get_faker().seed_instance(seed)
+    return init_dummy_game()
+
+def run_benchmark(games: int, config: EngineConfig, seed: int = 0) -> Dict[str, Any]:
+    """경기별 소요 시간 / 타석 수 측정"""
+    durations = []
+    plate_appearances = 0
+    for i in range(games):
+        game = seeded_game(seed + i)
+        steps = []
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.run_engine(game, config=config, on_step_callback=steps.append)
+        durations.append(time.perf_counter() - start)
+        plate_appearances += len(steps)
+
+    total = sum(durations)
+    return {
+        "mode": config.mode.value,
+        "games": games,
+        "plate_appearances": plate_appearances,
+        "seconds": round(total, 4),
+        "game_p50_seconds": round(statistics.median(durations), 4),
+        "ms_per_pa": round(total * 1000 / max(plate_appearances, 1), 3),
+    }
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cassette-backed engine benchmark")
+    parser.add_argument("--cassette", required=True, help="JSONL cassette path")
+    parser.add_argument("--record", action="store_true", help="record with the live LLM instead of replaying")
+    parser.add_argument("--games", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=[m.value for m in EngineMode], default=EngineMode.MULTI_AGENT.value)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per replayed call")
+    parser.add_argument("--max-ms-per-pa", type=float, default=None, help="fail when slower (CI regression gate)")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        engine.llm = CassetteLLM(args.cassette, mode="record", inner=engine._openai_llm())
+    else:
+        engine.llm = CassetteLLM(args.cassette, mode="replay", latency=args.latency)
+
+    report = run_benchmark(args.games, EngineConfig(mode=EngineMode(args.mode), seed=args.seed), seed=args.seed)
+    report["cassette"] = engine.llm.stats
+    print(json.dumps(report, ensure_ascii=False))
+
+    if args.max_ms_per_pa is not None and report["ms_per_pa"] > args.max_ms_per_pa:
+        print(f"Regression: {report['ms_per_pa']} ms/PA > {args.max_ms_per_pa}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
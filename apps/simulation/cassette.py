@@ -0,0 +1,172 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+class CassetteMiss(KeyError):
+    """재생 모드에서 녹화에 없는 요청 (strict=True일 때)"""
+
+def _prompt_text(prompt: Any) -> str:
+    if hasattr(prompt, "to_string"):
+        return prompt.to_string()
+    if isinstance(prompt, str):
+        return prompt
+    return json.dumps(prompt, ensure_ascii=False, sort_keys=True, default=str)
+
+def _schema_name(schema: Any) -> str:
+    return schema.__name__ if isinstance(schema, type) else str(schema.get("title", "schema"))
+
+def request_key(schema_name: str, prompt_text: str) -> str:
+    return hashlib.sha256(f"{schema_name}\n{prompt_text}".encode("utf-8")).hexdigest()
+
+class CassetteLLM:
+    """
+    `engine.llm` 자리에 끼우는 녹화/재생 LLM (with_structured_output만 지원).
+    - record: 내부 LLM(inner)을 호출하고 (출력 모델, 프롬프트, 응답, 지연 시간)을 JSONL 카세트에 추가
+    - replay: 네트워크 없이 카세트의 응답을 돌려줌.
+      같은 프롬프트(해시)가 있으면 그 응답을, 없으면 같은 출력 모델의 녹화분을 순서대로 재사용합니다 (strict=True면 CassetteMiss).
+    latency: 재생 시 호출마다 추가할 지연(초). use_recorded_latency=True면 녹화된 지연 x latency_scale.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        inner: Any = None,
+        latency: float = 0.0,
+        use_recorded_latency: bool = False,
+        latency_scale: float = 1.0,
+        strict: bool = False
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        if mode == "record" and inner is None:
+            raise ValueError("record mode requires an inner LLM")
+        self.path = path
+        self.mode = mode
+        self.inner = inner
+        self.latency = latency
+        self.use_recorded_latency = use_recorded_latency
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._by_key: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_schema: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self.stats = {"recorded": 0, "exact": 0, "fallback": 0}
+        if mode == "replay":
+            self._load()
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._by_key[entry["key"]].append(entry)
+                self._by_schema[entry["schema"]].append(entry)
+
+    # --- Record ---
+
+    def _record(self, schema_name: str, prompt_text: str, response: Any, elapsed: float):
+        entry = {
+            "schema": schema_name,
+            "key": request_key(schema_name, prompt_text),
+            "prompt": prompt_text,
+            "response": response.model_dump(mode="json") if hasattr(response, "model_dump") else response,
+            "latency": round(elapsed, 4)
+        }
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.stats["recorded"] += 1
+
+    # --- Replay ---
+
+    def _lookup(self, schema_name: str, prompt_text: str) -> Dict[str, Any]:
+        key = request_key(schema_name, prompt_text)
+        with self._lock:
+            exact = self._by_key.get(key)
+            if exact:
+                # 같은 프롬프트가 여러 번 녹화되었으면 순서대로 돌려가며 사용
+                idx = self._cursor[key] % len(exact)
+                self._cursor[key] += 1
+                self.stats["exact"] += 1
+                return exact[idx]
+            if self.strict or not self._by_schema.get(schema_name):
+                raise CassetteMiss(f"{schema_name} request not in cassette {self.path}")
+            entries = self._by_schema[schema_name]
+            idx = self._cursor[schema_name] % len(entries)
+            self._cursor[schema_name] += 1
+            self.stats["fallback"] += 1
+            return entries[idx]
+
+    def _delay(self, entry: Dict[str, Any]) -> float:
+        delay = self.latency
+        if self.use_recorded_latency:
+            delay += entry.get("latency", 0.0) * self.latency_scale
+        return delay
+
+    # --- LLM Interface ---
+
+    def with_structured_output(self, schema: Any, **kwargs):
+        from langchain_core.runnables import RunnableLambda
+
+        schema_name = _schema_name(schema)
+        parse: Callable[[Any], Any] = schema.model_validate if isinstance(schema, type) else (lambda payload: payload)
+
+        if self.mode == "record":
+            inner_chain = self.inner.with_structured_output(schema, **kwargs)
+
+            def record(prompt):
+                start = time.perf_counter()
+                response = inner_chain.invoke(prompt)
+                self._record(schema_name, _prompt_text(prompt), response, time.perf_counter() - start)
+                return response
+
+            async def arecord(prompt):
+                start = time.perf_counter()
+                response = await inner_chain.ainvoke(prompt)
+                self._record(schema_name, _prompt_text(prompt), response, time.perf_counter() - start)
+                return response
+
+            return RunnableLambda(record, afunc=arecord)
+
+        def replay(prompt):
+            entry = self._lookup(schema_name, _prompt_text(prompt))
+            delay = self._delay(entry)
+            if delay:
+                time.sleep(delay)
+            return parse(entry["response"])
+
+        async def areplay(prompt):
+            entry = self._lookup(schema_name, _prompt_text(prompt))
+            delay = self._delay(entry)
+            if delay:
+                await asyncio.sleep(delay)
+            return parse(entry["response"])
+
+        return RunnableLambda(replay, afunc=areplay)
+
+def cassette_from_env(inner_factory: Callable[[], Any]) -> Optional[CassetteLLM]:
+    """
+    LLM_CASSETTE(카세트 경로)가 설정되어 있으면 CassetteLLM 생성.
+    LLM_CASSETTE_MODE: replay (기본) / record, LLM_CASSETTE_LATENCY: 재생 지연(초) 또는 "recorded"
+    """
+    path = os.environ.get("LLM_CASSETTE")
+    if not path:
+        return None
+    mode = os.environ.get("LLM_CASSETTE_MODE", "replay")
+    latency = os.environ.get("LLM_CASSETTE_LATENCY", "0")
+    return CassetteLLM(
+        path,
+        mode=mode,
+        inner=inner_factory() if mode == "record" else None,
+        latency=0.0 if latency == "recorded" else float(latency),
+        use_recorded_latency=latency == "recorded",
+        strict=os.environ.get("LLM_CASSETTE_STRICT", "0") == "1"
+    )
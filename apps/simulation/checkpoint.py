@@ -0,0 +1,69 @@
+from typing import Any, Dict, Optional, Tuple
+
+from .models import CheckpointSchedule, EngineConfig, Half, MatchCheckpoint, SimulationStatus
+
+def make_checkpoint(state: Dict[str, Any]) -> MatchCheckpoint:
+    """그래프 상태 -> 체크포인트 (GameState는 깊은 복사: 엔진이 계속 제자리 수정하므로)"""
+    resolver = state.get("stat_resolver")
+    return MatchCheckpoint(
+        pa_count=state.get("pa_count", 0),
+        game=state["game"].model_copy(deep=True),
+        director_ctx=state["director_ctx"],
+        home_manager_decision=state["home_manager_decision"],
+        away_manager_decision=state["away_manager_decision"],
+        director_last_pa=state.get("director_last_pa"),
+        rng_state=list(resolver.rng.getstate()) if resolver else None
+    )
+
+def restore_checkpoint(state: Dict[str, Any], checkpoint: MatchCheckpoint) -> Dict[str, Any]:
+    """
+    _start_match가 만든 초기 상태에 체크포인트의 컨텍스트를 덮어씀 (끝난 이닝은 다시 시뮬레이션하지 않음).
+    state["game"]은 호출 측이 체크포인트 GameState의 복사본으로 채웁니다 (narrator가 같은 객체를 참조해야 하므로).
+    """
+    state.update({
+        "director_ctx": checkpoint.director_ctx,
+        "home_manager_decision": checkpoint.home_manager_decision,
+        "away_manager_decision": checkpoint.away_manager_decision,
+        "pa_count": checkpoint.pa_count,
+        "director_last_pa": checkpoint.director_last_pa,
+        # 하프이닝 시작 시점이면 Director 재판단
+        "director_pending": checkpoint.game.outs == 0 and not any(
+            (checkpoint.game.bases.basec1, checkpoint.game.bases.basec2, checkpoint.game.bases.basec3)
+        ),
+    })
+    if checkpoint.rng_state and state.get("stat_resolver"):
+        version, internal, gauss = checkpoint.rng_state
+        state["stat_resolver"].rng.setstate((version, tuple(internal), gauss))
+    return state
+
+class CheckpointTracker:
+    """
+    graph.stream(updates 모드)의 노드별 갱신을 모아 현재 그래프 상태를 유지하고,
+    check_inning 직후 EngineConfig.checkpoint 일정에 맞으면 체크포인트를 만듭니다.
+    """
+
+    def __init__(self, state: Dict[str, Any], config: EngineConfig):
+        self.state = dict(state)
+        self.config = config
+        self._last: Tuple[int, Half, int] = self._marker()
+
+    def _marker(self) -> Tuple[int, Half, int]:
+        game = self.state["game"]
+        return game.inning, game.half, self.state.get("pa_count", 0)
+
+    def _due(self) -> bool:
+        inning, half, pa_count = self._marker()
+        if self.config.checkpoint == CheckpointSchedule.EVERY_N_PA:
+            return pa_count - self._last[2] >= self.config.checkpoint_every_n
+        return (inning, half) != self._last[:2]
+
+    def observe(self, chunk: Dict[str, Any]) -> Optional[MatchCheckpoint]:
+        for update in chunk.values():
+            if update:
+                self.state.update(update)
+        if "check_inning" not in chunk or self.state["game"].status == SimulationStatus.FINISHED:
+            return None
+        if not self._due():
+            return None
+        self._last = self._marker()
+        return make_checkpoint(self.state)
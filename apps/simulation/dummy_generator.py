@@ -1,18 +1,25 @@
 import random
-from faker import Faker
 from uuid import uuid4
 from .models import Role, Character, PlayerState, Team, GameState, Half, SimulationStatus
 
-fake = Faker('ko_KR')
+_fake = None
+
+def get_faker():
+    """Faker는 import 비용이 커서 첫 사용 시 생성"""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker('ko_KR')
+    return _fake
 
 def create_random_stats():
-    """1~100 사이의 랜덤 능력치 생성 (정규 분포 느낌을 주기 위해 triangular 사용)"""
-    return int(random.triangular(30, 100, 60))
+    """DB와 같은 1~10 스케일의 기본 능력치(contact/power/speed) 생성 (정규 분포 느낌을 주기 위해 triangular 사용)"""
+    return round(random.triangular(3, 10, 6))
 
 def create_dummy_character(role: Role) -> Character:
     return Character(
         character_id=str(uuid4()),
-        name=fake.name(),
+        name=get_faker().name(),
         role=role,
         contact=create_random_stats(),
         power=create_random_stats(),
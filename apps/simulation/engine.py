@@ -1,30 +1,139 @@
 import os
 import random
 import json
-from typing import TypedDict, Annotated, List, Dict, Optional, Any
-from dotenv import load_dotenv
+import inspect
+import asyncio
+import contextvars
+import threading
+import time
+import zlib
+from typing import TypedDict, Annotated, List, Dict, Optional, Any, Tuple, Callable
 
-# LangChain / LangGraph
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langgraph.graph import StateGraph, END
+# LangChain / LangGraph / OpenAI 클라이언트와 .env는 첫 사용 시 로드합니다 (get_llm / get_chain / get_graph).
+# API 워커나 테스트가 엔진을 import만 할 때는 이 비용을 내지 않습니다.
 
 # Local Imports
 from .models import (
-    GameState, SimulationResult, Half, SimulationStatus, BroadcastData,
+    GameState, SimulationResult, Half, SimulationStatus, BroadcastData, PlayerState, Team,
     DirectorContext, ManagerDecision, PitcherDecision, BatterDecision,
+    PlateAppearancePlan, EngineConfig, EngineMode, DirectorSchedule, ValidatorMode, ResolverBackend,
+    NarrationMode, PlateOutcome, NarrationBatch, ManagerPolicy, LLMPriority, MatchCheckpoint, GameEventLog,
     Weather, UmpireZone, TeamStrategy,
-    PitchType, PitchLocation, BattingStyle, Role, ValidatorResult
+    PitchType, PitchLocation, BattingStyle, ValidatorResult
 )
-from .dummy_generator import init_dummy_game
 from .rule_engine import BaseballRuleEngine
+from .llm_cache import situation_fingerprint, cache_from_env
+from .rule_validator import validate_locally
+from .stat_resolver import StatResolver, scale_rating
+from .fast_state import FastGame, FastResolver
+from .narration import HalfInningNarrator, NarrationPlay
+from .cassette import cassette_from_env
+from . import expectancy
+from .manager_policy import rule_manager_decisions
+from .prompt_compaction import compact_batter_stats, defense_lineup, defense_summary, half_inning_context
+from .telemetry import TokenMeter
+from .llm_scheduler import scheduler_from_env
+from .checkpoint import CheckpointTracker, restore_checkpoint
+from . import event_log
+from . import metrics
+from .metrics import MatchRate, timed_node
 
-# Load Env
-load_dotenv()
+# --- LLM Setup (Lazy) ---
+_init_lock = threading.RLock()
+_env_loaded = False
 
-# --- LLM Setup ---
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+# 첫 사용 시 생성 (테스트/재생 시 `engine.llm = ...`으로 교체 가능)
+llm = None
+http_client = None
+http_async_client = None
+
+# 상황 지문 기반 결정 캐시 (프로세스 공용, EngineConfig.use_decision_cache로 경기별 사용)
+decision_cache = None
+
+# 노드별 LLM 호출/토큰/지연 집계 (프로세스 공용)
+token_meter = TokenMeter()
+
+# LLM 동시성/속도 제한 + 우선순위 스케줄러 (프로세스 공용)
+llm_scheduler = None
+# 현재 경기의 LLM 우선순위 (run_engine/arun_engine이 EngineConfig.priority로 설정, 그래프 노드 스레드/태스크로 전파)
+llm_priority: contextvars.ContextVar = contextvars.ContextVar("llm_priority", default=LLMPriority.NORMAL)
+
+def _load_env():
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+def get_llm():
+    """
+    프로세스 공용 LLM.
+    모든 경기가 하나의 httpx 커넥션 풀을 공유 (sync: run_engine / async: arun_engine)
+    LLM_CASSETTE가 설정되어 있으면 녹화/재생 카세트를 사용합니다 (cassette.py).
+    """
+    global llm
+    if llm is None:
+        with _init_lock:
+            if llm is None:
+                _load_env()
+                llm = cassette_from_env(_openai_llm) or _openai_llm()
+    return llm
+
+def _openai_llm():
+    global http_client, http_async_client
+    import httpx
+    from langchain_openai import ChatOpenAI
+
+    max_connections = int(os.environ.get("LLM_MAX_CONNECTIONS", "100"))
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    http_client = httpx.Client(limits=limits)
+    http_async_client = httpx.AsyncClient(limits=limits)
+    return ChatOpenAI(
+        model="gpt-4o-mini",
+        temperature=0.7,
+        http_client=http_client,
+        http_async_client=http_async_client
+    )
+
+def get_decision_cache():
+    global decision_cache
+    if decision_cache is None:
+        with _init_lock:
+            if decision_cache is None:
+                _load_env()
+                decision_cache = cache_from_env()
+    return decision_cache
+
+def _llm_metric_families() -> List[Any]:
+    """/metrics 수집 시점의 체인별 LLM 호출/토큰 집계 + 스케줄러 대기열"""
+    per_chain = token_meter.snapshot()
+    families = [
+        (f"sim_llm_{field}_total", "counter", f"LLM {field.replace('_', ' ')} per chain",
+         [({"chain": chain}, stats[field]) for chain, stats in sorted(per_chain.items())])
+        for field in TokenMeter.FIELDS
+    ]
+    if llm_scheduler is not None:
+        stats = llm_scheduler.stats()
+        families += [
+            ("sim_llm_in_flight", "gauge", "LLM requests in flight", [({}, stats["in_flight"])]),
+            ("sim_llm_rate_limited_total", "counter", "LLM requests delayed by the token bucket", [({}, stats["rate_limited"])]),
+            ("sim_llm_queue_depth", "gauge", "LLM requests waiting for a scheduler slot",
+             [({"priority": p}, s["queued"]) for p, s in stats["priorities"].items()]),
+            ("sim_llm_wait_seconds_max", "gauge", "Longest LLM scheduler wait",
+             [({"priority": p}, s["max_wait_seconds"]) for p, s in stats["priorities"].items()]),
+        ]
+    return families
+
+metrics.register_collector(_llm_metric_families)
+
+def get_llm_scheduler():
+    global llm_scheduler
+    if llm_scheduler is None:
+        with _init_lock:
+            if llm_scheduler is None:
+                _load_env()
+                llm_scheduler = scheduler_from_env()
+    return llm_scheduler
 
 # --- State for Graph ---
 class SimState(TypedDict):
@@ -43,6 +152,17 @@ class SimState(TypedDict):
     
     retry_count: int # 검증 실패 시 재시도 횟수 tracking
     db_session: Optional[Any] # DB Session for saving results
+    config: EngineConfig # 경기별 엔진 설정 (모드 등)
+    
+    pa_count: int # 완료된 타석 수
+    director_pending: bool # 이닝 교대 등으로 Director 재판단이 필요한지
+    director_last_pa: Optional[int] # Director가 마지막으로 호출된 시점의 pa_count (None: 미호출)
+    stat_resolver: Optional[StatResolver] # 통계 판정기 (경기별 난수 상태 보유)
+    narrator: Optional[HalfInningNarrator] # 배치 중계 (NarrationMode.BATCHED일 때만)
+    prompt_context: Dict[str, str] # 하프이닝 동안 재사용하는 프롬프트 문맥 (이닝 교대 시 초기화)
+    prevalidated: bool # 투기적 판정: resolver가 후보 검증까지 마쳤으면 validator는 결과만 반영
+    live_sink: Optional[Callable[[Dict[str, Any]], None]] # 실시간 중계 프레임 수신자 (run_engine의 on_live_callback)
+    event_log: Optional[GameEventLog] # 이벤트 소싱 기록 (run_engine의 event_log, 없으면 기록하지 않음)
 
 # --- Prompt Templates (Agents Thinking) ---
 
@@ -196,104 +316,511 @@ VALIDATOR_PROMPT = """
 문제가 있다면 `is_valid: false`와 `correction_suggestion`을 작성하세요. 문제 없으면 `is_valid: true`.
 """
 
+PLATE_APPEARANCE_PROMPT = """
+당신은 야구 경기의 **타석 에이전트(Plate Appearance Agent)**입니다.
+총괄 감독(Director), 양 팀 감독(Manager), 투수(Pitcher), 타자(Batter)의 역할을 한 번에 수행하여 이번 타석의 모든 의사결정을 내리세요.
+
+[경기 상황]
+- {inning}회 {half}, 아웃: {outs}, 주자: {runners}
+- 점수: {home_team_name}(홈) {home_score} : {away_score} {away_team_name}(원정)
+- 날씨: {current_weather}, 심판 판정: {current_zone}
+
+[수비 팀 투수 {pitcher_name}] 구속 {velocity}, 구위 {stuff}, 제구 {control}
+- 투구 수: {pitch_count}, 남은 체력: {current_stamina} / {max_stamina}
+
+[공격 팀 타자 {batter_name}] 컨택 {contact}, 파워 {power}, 스피드 {speed}
+
+[의사결정 순서]
+1. `director`: 경기 환경(날씨, 바람, 심판 존)을 결정하거나 유지하세요. 환경은 자주 바뀌지 않습니다.
+2. `home_manager` / `away_manager`: 각 팀 감독의 공격/수비 작전과 투수 교체 여부를 결정하세요.
+   - 작전: NORMAL, BUNT, HIT_AND_RUN, INFIELD_IN, LONG_BALL
+   - 수비 팀 투수의 체력이 30 이하로 떨어지거나 난타당하면 교체를 고려하세요.
+3. `pitcher`: 수비 팀 감독의 수비 작전을 따라 구종, 코스, 완급을 결정하세요. 제구력이 낮으면 실투가 나올 수 있습니다.
+4. `batter`: 공격 팀 감독의 공격 작전을 따라 노림수와 타격 스타일을 결정하세요.
+
+각 역할은 자신이 알 수 있는 정보만 사용하세요. (타자는 투수가 실제로 던질 공을 모릅니다.)
+"""
+
+# --- Helpers ---
+
+OUTCOME_PROMPT = """
+야구 타석의 **결과만** 판정하세요. 중계 멘트는 작성하지 마세요.
+평균 타율 0.250~0.280 수준의 현실적인 분포를 유지하고, 진루/득점은 계산하지 마세요.
+
+[환경] 심판 존: {zone} | [상황] 아웃: {outs}, {runners_status}
+[투수 {pitcher_name}] {pitch_type}({pitch_location}) | 구속 {velocity}, 구위 {stuff}, 제구 {control}
+[타자 {batter_name}] 노림수 {aim_type}, 코스 {aim_location} | 컨택 {contact}, 파워 {power}, 스피드 {speed}
+{validator_feedback}
+`result_code`: 1B, 2B, 3B, HR, BB, SO, GO, FO 중 하나
+`summary`: 10자 이내 결과 요약 (예: "중전 안타", "헛스윙 삼진", "유격수 땅볼")
+"""
+
+NARRATION_PROMPT = """
+당신은 야구 중계 캐스터입니다. 아래는 한 이닝(초/말)의 타석 결과 {count}개입니다.
+각 타석을 생생한 한국어 중계 멘트(1~2문장)로 작성하세요.
+
+**[규칙]**
+*   결과(안타 종류, 아웃 종류, 볼넷 등)를 절대 바꾸지 마세요.
+*   `lines`에 입력과 **같은 순서, 같은 개수({count}개)**로 담으세요.
+
+[타석 결과]
+{plays}
+"""
+
+RESOLVER_PROMPT_COMPACT = """
+야구 시뮬레이션 심판입니다. 아래 매치업의 타석 결과를 판정하세요.
+- reasoning: 매치업 -> 타구 -> 수비 순으로 2~3문장
+- 평균 타율 .250~.280 (약 70%는 아웃). 진루/득점은 계산하지 않음
+- result_code: 1B 2B 3B HR BB IBB HBP SO GO FO LO E 중 하나
+- description: 결과와 일치하는 1~2문장 중계 멘트 (예: 1B "중전 안타!", SO "헛스윙 삼진!")
+
+환경 {weather}/바람 {wind}/존 {zone} | {outs}아웃 {runners_status}
+수비 {defense_lineup}
+투수 {pitcher_name} {pitch_type}/{pitch_location} 구속{velocity} 구위{stuff} 제구{control} 멘탈{mental}
+타자 {batter_name} 노림 {aim_type}/{aim_location} 컨택{contact} 파워{power} 스피드{speed}
+{validator_feedback}
+"""
+
+MANAGER_PROMPT_COMPACT = """
+{team_name} 감독. {inning}회 {half}, {outs}아웃, 주자 {runners} | 우리 {my_score} : 상대 {opp_score}
+타자 {batter_name} ({batter_stats}) vs 투수 {opponent_name}
+우리 투수 {current_pitcher_name}: 투구수 {pitch_count}, 체력 {current_stamina}/{max_stamina} (30 이하면 교체 고려)
+공격/수비 작전(NORMAL, BUNT, HIT_AND_RUN, INFIELD_IN, LONG_BALL), 투수 교체 여부, 짧은 이유를 결정하세요.
+"""
+
+# --- Precompiled Chains ---
+# 노드 이름 -> (프롬프트, 출력 모델). 체인은 LLM별로 1회만 구성하여 모든 경기/타석이 재사용합니다.
+CHAIN_SPECS: Dict[str, Tuple[str, Any]] = {
+    "director": (DIRECTOR_PROMPT, DirectorContext),
+    "manager": (MANAGER_PROMPT, ManagerDecision),
+    "manager_compact": (MANAGER_PROMPT_COMPACT, ManagerDecision),
+    "pitcher": (PITCHER_PROMPT, PitcherDecision),
+    "batter": (BATTER_PROMPT, BatterDecision),
+    "plate_appearance": (PLATE_APPEARANCE_PROMPT, PlateAppearancePlan),
+    "resolver": (RESOLVER_PROMPT, SimulationResult),
+    "resolver_compact": (RESOLVER_PROMPT_COMPACT, SimulationResult),
+    "outcome": (OUTCOME_PROMPT, PlateOutcome),
+    "validator": (VALIDATOR_PROMPT, ValidatorResult),
+    "narration": (NARRATION_PROMPT, NarrationBatch),
+}
+_chains: Dict[str, Tuple[Any, Any]] = {} # name -> (llm, chain)
+
+def get_chain(name: str):
+    """프롬프트 | structured output 체인 (LLM이 교체되면 다시 구성)"""
+    current_llm = get_llm()
+    cached = _chains.get(name)
+    if cached is None or cached[0] is not current_llm:
+        from langchain_core.prompts import ChatPromptTemplate
+        prompt_text, model_cls = CHAIN_SPECS[name]
+        chain = (ChatPromptTemplate.from_template(prompt_text) | current_llm.with_structured_output(model_cls)).with_config(
+            run_name=name, tags=[f"node:{name}"]
+        )
+        cached = _chains[name] = (current_llm, chain)
+    return cached[1]
+
+def get_stream_chain(name: str):
+    """
+    토큰 스트리밍용 체인: prompt | llm(response_format) | 부분 JSON 파서 (청크마다 지금까지의 dict).
+    with_structured_output은 응답이 끝나야 파싱되므로 실시간 중계에는 이 체인을 씁니다.
+    채팅 모델이 아닌 LLM(카세트, 테스트용)이면 None (일반 체인 사용).
+    """
+    from langchain_core.language_models import BaseChatModel
+
+    current_llm = get_llm()
+    if not isinstance(current_llm, BaseChatModel):
+        return None
+    key = f"{name}:stream"
+    cached = _chains.get(key)
+    if cached is None or cached[0] is not current_llm:
+        from langchain_core.output_parsers import JsonOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+        prompt_text, model_cls = CHAIN_SPECS[name]
+        # 스키마는 dict로 넘김 (pydantic 클래스를 넘기면 응답 끝에 파싱된 객체가 붙어 부분 파서와 중복)
+        response_format = {"type": "json_schema", "json_schema": {"name": model_cls.__name__, "schema": model_cls.model_json_schema()}}
+        chain = (ChatPromptTemplate.from_template(prompt_text) | current_llm.bind(response_format=response_format) | JsonOutputParser()).with_config(
+            run_name=name, tags=[f"node:{name}"]
+        )
+        cached = _chains[key] = (current_llm, chain)
+    return cached[1]
+
+def _runners_str(game: GameState) -> str:
+    """주자 상황 요약 (예: "1루,3루" / "없음")"""
+    runners = []
+    if game.bases.basec1: runners.append("1루")
+    if game.bases.basec2: runners.append("2루")
+    if game.bases.basec3: runners.append("3루")
+    return ",".join(runners) if runners else "없음"
+
 # --- Nodes ---
+# LLM 노드는 (chain, inputs)를 만드는 준비 함수 하나와
+# 동기(`xxx_node`) / 비동기(`axxx_node`) 실행 래퍼로 구성됩니다.
+# 그래프에는 RunnableLambda(sync, afunc=async)로 등록되어 stream/astream 모두 지원합니다.
 
-def director_node(state: SimState):
-    """경기 환경 설정"""
+def _log_node_error(node_name: str, e: Exception):
+    import traceback
+    err_msg = traceback.format_exc()
+    with open("error_log.txt", "w", encoding="utf-8") as f:
+        f.write(err_msg)
+    print(f"Error in {node_name}: {e}")
+
+def _chain_name(chain) -> str:
+    return (getattr(chain, "config", None) or {}).get("run_name", "unknown")
+
+def _prompt_text(chain, inputs: Dict[str, Any]) -> str:
+    """토큰 추정용 렌더링 프롬프트"""
+    spec = CHAIN_SPECS.get(_chain_name(chain))
+    try:
+        return spec[0].format(**inputs) if spec else ""
+    except (KeyError, IndexError):
+        return ""
+
+def _run_config() -> Dict[str, Any]:
+    return {"callbacks": [token_meter.callback_handler()]}
+
+def _record(chain, inputs_list: List[Dict[str, Any]], start: float):
+    token_meter.record_call(_chain_name(chain), [_prompt_text(chain, i) for i in inputs_list], time.perf_counter() - start)
+
+def _invoke(chain, inputs: Dict[str, Any]):
+    with get_llm_scheduler().slot(llm_priority.get()):
+        start = time.perf_counter()
+        try:
+            return chain.invoke(inputs, config=_run_config())
+        finally:
+            _record(chain, [inputs], start)
+
+async def _ainvoke(chain, inputs: Dict[str, Any]):
+    async with get_llm_scheduler().aslot(llm_priority.get()):
+        start = time.perf_counter()
+        try:
+            return await chain.ainvoke(inputs, config=_run_config())
+        finally:
+            _record(chain, [inputs], start)
+
+def _batch(chain, inputs_list: List[Dict[str, Any]]) -> List[Any]:
+    with get_llm_scheduler().slot(llm_priority.get(), weight=len(inputs_list)):
+        start = time.perf_counter()
+        try:
+            return chain.batch(inputs_list, config=_run_config())
+        finally:
+            _record(chain, inputs_list, start)
+
+async def _abatch(chain, inputs_list: List[Dict[str, Any]]) -> List[Any]:
+    async with get_llm_scheduler().aslot(llm_priority.get(), weight=len(inputs_list)):
+        start = time.perf_counter()
+        try:
+            return await chain.abatch(inputs_list, config=_run_config())
+        finally:
+            _record(chain, inputs_list, start)
+
+def _stream(chain, inputs: Dict[str, Any], on_chunk: Callable[[Any], None]):
+    """스트리밍 호출 (청크마다 on_chunk, 마지막 청크 반환)"""
+    with get_llm_scheduler().slot(llm_priority.get()):
+        start = time.perf_counter()
+        try:
+            final = None
+            for chunk in chain.stream(inputs, config=_run_config()):
+                final = chunk
+                on_chunk(chunk)
+            return final
+        finally:
+            _record(chain, [inputs], start)
+
+async def _astream(chain, inputs: Dict[str, Any], on_chunk: Callable[[Any], None]):
+    async with get_llm_scheduler().aslot(llm_priority.get()):
+        start = time.perf_counter()
+        try:
+            final = None
+            async for chunk in chain.astream(inputs, config=_run_config()):
+                final = chunk
+                on_chunk(chunk)
+            return final
+        finally:
+            _record(chain, [inputs], start)
+
+class _NodeChain:
+    """
+    engine 밖(narration)에서 호출하는 체인도 chokepoint를 거치도록 감싸는 래퍼.
+    narration은 자체 스레드 풀에서 실행되므로 경기 우선순위를 생성 시점에 고정합니다.
+    """
+
+    def __init__(self, chain, priority: LLMPriority):
+        self.chain = chain
+        self.priority = priority
+
+    def invoke(self, inputs: Dict[str, Any]):
+        return contextvars.copy_context().run(self._invoke, inputs)
+
+    def _invoke(self, inputs: Dict[str, Any]):
+        llm_priority.set(self.priority)
+        return _invoke(self.chain, inputs)
+
+    async def ainvoke(self, inputs: Dict[str, Any]):
+        token = llm_priority.set(self.priority)
+        try:
+            return await _ainvoke(self.chain, inputs)
+        finally:
+            llm_priority.reset(token)
+
+def _compact(state: SimState) -> bool:
+    config = state.get("config") or EngineConfig()
+    return config.compact_prompts
+
+def _prompt_context(state: SimState) -> Dict[str, str]:
+    cache = state.get("prompt_context")
+    return cache if cache is not None else {}
+
+# --- Decision Cache ---
+# 반복되는 감독/투수/타자 프롬프트는 상황 지문(이닝 구간, 주자/아웃, 점수 차 구간, 능력치 구간)으로 캐시
+
+def _cache_enabled(state: SimState) -> bool:
+    config = state.get("config")
+    return bool(config and config.use_decision_cache)
+
+def _cached_invoke(state: SimState, chain, inputs: Dict[str, Any], key: Tuple[str, str], model_cls):
+    if not _cache_enabled(state):
+        return _invoke(chain, inputs)
+    hit = get_decision_cache().get(key[0], key[1], model_cls)
+    if hit is not None:
+        return hit
+    res = _invoke(chain, inputs)
+    get_decision_cache().put(key[0], key[1], res)
+    return res
+
+async def _acached_invoke(state: SimState, chain, inputs: Dict[str, Any], key: Tuple[str, str], model_cls):
+    if not _cache_enabled(state):
+        return await _ainvoke(chain, inputs)
+    hit = get_decision_cache().get(key[0], key[1], model_cls)
+    if hit is not None:
+        return hit
+    res = await _ainvoke(chain, inputs)
+    get_decision_cache().put(key[0], key[1], res)
+    return res
+
+def _cache_lookup_many(state: SimState, keys: List[Tuple[str, str]], model_cls) -> List[Any]:
+    if not _cache_enabled(state):
+        return [None] * len(keys)
+    return [get_decision_cache().get(ns, fp, model_cls) for ns, fp in keys]
+
+def _cache_fill_many(state: SimState, keys, results: List[Any], fresh: List[Any]) -> List[Any]:
+    """미스난 항목(results의 None)을 새 결과로 채우고 캐시에 저장"""
+    fresh_iter = iter(fresh)
+    for i, cached in enumerate(results):
+        if cached is None:
+            results[i] = next(fresh_iter)
+            if _cache_enabled(state):
+                get_decision_cache().put(keys[i][0], keys[i][1], results[i])
+    return results
+
+def _cached_batch(state: SimState, chain, inputs_list, keys, model_cls) -> List[Any]:
+    results = _cache_lookup_many(state, keys, model_cls)
+    missing = [inputs for inputs, cached in zip(inputs_list, results) if cached is None]
+    fresh = _batch(chain, missing) if missing else []
+    return _cache_fill_many(state, keys, results, fresh)
+
+async def _acached_batch(state: SimState, chain, inputs_list, keys, model_cls) -> List[Any]:
+    results = _cache_lookup_many(state, keys, model_cls)
+    missing = [inputs for inputs, cached in zip(inputs_list, results) if cached is None]
+    fresh = await _abatch(chain, missing) if missing else []
+    return _cache_fill_many(state, keys, results, fresh)
+
+def _matchup_fields(game: GameState) -> Dict[str, Any]:
+    """현재 투수-타자 매치업의 능력치 (캐시 지문용, 1-10 기본 능력치를 0-100으로 환산해야 구간이 나뉨)"""
+    pitcher = game.get_current_pitcher().character
+    batter = game.get_current_batter().character
+    return {
+        "p_velocity": scale_rating(pitcher.speed), "p_stuff": scale_rating(pitcher.power), "p_control": scale_rating(pitcher.contact),
+        "b_contact": scale_rating(batter.contact), "b_power": scale_rating(batter.power), "b_speed": scale_rating(batter.speed)
+    }
+
+def _offense_side(game: GameState) -> str:
+    return "away" if game.half == Half.TOP else "home"
+
+def _defense_side(game: GameState) -> str:
+    return "home" if game.half == Half.TOP else "away"
+
+def _manager_cache_keys(game: GameState) -> List[Tuple[str, str]]:
+    keys = []
+    for side, team in (("home", game.home_team), ("away", game.away_team)):
+        p = team.get_pitcher()
+        keys.append(("manager", situation_fingerprint(
+            game, perspective=side,
+            defending=side == _defense_side(game),
+            stamina=p.current_stamina,
+            **_matchup_fields(game)
+        )))
+    return keys
+
+def _pitcher_cache_key(game: GameState, strategy: TeamStrategy) -> Tuple[str, str]:
+    return ("pitcher", situation_fingerprint(game, perspective=_defense_side(game), strategy=strategy, **_matchup_fields(game)))
+
+def _batter_cache_key(game: GameState, strategy: TeamStrategy) -> Tuple[str, str]:
+    return ("batter", situation_fingerprint(game, perspective=_offense_side(game), strategy=strategy, **_matchup_fields(game)))
+
+def _director_due(state: SimState) -> bool:
+    """스케줄상 이번 타석에 Director를 호출해야 하는지"""
+    config = state.get("config") or EngineConfig()
+    last_pa = state.get("director_last_pa")
+    schedule = config.director_schedule
+
+    if schedule == DirectorSchedule.EVERY_PA or last_pa is None:
+        return True
+    if schedule == DirectorSchedule.HALF_INNING:
+        return state.get("director_pending", False)
+    if schedule == DirectorSchedule.EVERY_N_PA:
+        return state.get("pa_count", 0) - last_pa >= config.director_every_n
+    return False # GAME_START
+
+def _director_update(state: SimState, ctx: DirectorContext):
+    """새 DirectorContext 반영 (GameState.director에도 캐시)"""
+    log = state.get("event_log")
+    if log is not None and ctx != state["game"].director:
+        event_log.record_director(log, state.get("pa_count", 0), ctx)
+    state["game"].director = ctx
+    return {
+        "director_ctx": ctx,
+        "director_pending": False,
+        "director_last_pa": state.get("pa_count", 0)
+    }
+
+def _director_call(state: SimState):
     game = state["game"]
     ctx = state.get("director_ctx", DirectorContext())
-    
-    prompt = ChatPromptTemplate.from_template(DIRECTOR_PROMPT)
-    chain = prompt | llm.with_structured_output(DirectorContext)
-    
-    new_ctx = chain.invoke({
+
+    chain = get_chain("director")
+
+    return chain, {
         "inning": game.inning,
         "half": game.half,
         "current_weather": ctx.weather,
         "current_zone": ctx.umpire_zone
-    })
-    
-    return {"director_ctx": new_ctx}
+    }
+
+def director_node(state: SimState):
+    """경기 환경 설정 (스케줄된 시점에만 LLM 호출, 그 외에는 캐시된 DirectorContext 유지)"""
+    if not _director_due(state):
+        return {}
+    chain, inputs = _director_call(state)
+    return _director_update(state, _invoke(chain, inputs))
+
+async def adirector_node(state: SimState):
+    if not _director_due(state):
+        return {}
+    chain, inputs = _director_call(state)
+    return _director_update(state, await _ainvoke(chain, inputs))
+
+def _manager_call(state: SimState):
+    game = state["game"]
+
+    compact = _compact(state)
+    manager_chain = get_chain("manager_compact" if compact else "manager")
+
+    runners_str = _runners_str(game)
+    batter = game.get_current_batter().character
+    batter_stats = compact_batter_stats(batter) if compact else batter.batter_stats
+
+    # Home Manager Context
+    home_p = game.home_team.get_pitcher()
+    home_inputs = {
+        "team_name": game.home_team.name,
+        "score_diff": game.home_score - game.away_score,
+        "my_score": game.home_score,
+        "opp_score": game.away_score,
+        "inning": game.inning,
+        "half": game.half,
+        "outs": game.outs,
+        "runners": runners_str,
+        "batter_name": batter.name,
+        "batter_stats": batter_stats,
+        "opponent_name": game.get_current_pitcher().character.name,
+        "current_pitcher_name": home_p.character.name,
+        "pitch_count": home_p.pitch_count,
+        "current_stamina": home_p.current_stamina,
+        "max_stamina": home_p.character.stamina
+    }
+
+    # Away Manager Context
+    away_p = game.away_team.get_pitcher()
+    away_inputs = {
+        "team_name": game.away_team.name,
+        "score_diff": game.away_score - game.home_score,
+        "my_score": game.away_score,
+        "opp_score": game.home_score,
+        "inning": game.inning,
+        "half": game.half,
+        "outs": game.outs,
+        "runners": runners_str,
+        "batter_name": batter.name,
+        "batter_stats": batter_stats,
+        "opponent_name": game.get_current_pitcher().character.name,
+        "current_pitcher_name": away_p.character.name,
+        "pitch_count": away_p.pitch_count,
+        "current_stamina": away_p.current_stamina,
+        "max_stamina": away_p.character.stamina
+    }
+
+    return manager_chain, [home_inputs, away_inputs]
+
+def _rule_managers(state: SimState) -> Optional[Dict[str, ManagerDecision]]:
+    """
+    규칙 기반 감독으로 충분하면 결정을 반환, LLM 감독이 필요하면 None.
+    HYBRID: 현재 상황의 레버리지 지수가 기준 이상(승부처)일 때만 LLM
+    """
+    config = state.get("config") or EngineConfig()
+    game = state["game"]
+    if config.manager_policy == ManagerPolicy.LLM:
+        return None
+    if config.manager_policy == ManagerPolicy.HYBRID and expectancy.leverage_index(game) >= config.manager_leverage_threshold:
+        return None
+    home_decision, away_decision = rule_manager_decisions(game)
+    return {
+        "home_manager_decision": home_decision,
+        "away_manager_decision": away_decision
+    }
 
 def manager_node(state: SimState):
     """양 팀 감독의 작전 지시"""
-    import traceback
     try:
-        game = state["game"]
-        
-        # Home Manager
-        prompt = ChatPromptTemplate.from_template(MANAGER_PROMPT)
-        manager_chain = prompt | llm.with_structured_output(ManagerDecision)
-        
-        runners = []
-        if game.bases.basec1: runners.append("1루")
-        if game.bases.basec2: runners.append("2루")
-        if game.bases.basec3: runners.append("3루")
-        runners_str = ",".join(runners) if runners else "없음"
-        
-        # Home Manager Context
-        home_p = game.home_team.get_pitcher()
-        home_decision = manager_chain.invoke({
-            "team_name": game.home_team.name,
-            "score_diff": game.home_score - game.away_score,
-            "my_score": game.home_score,
-            "opp_score": game.away_score,
-            "inning": game.inning,
-            "half": game.half,
-            "outs": game.outs,
-            "runners": runners_str,
-            "batter_name": game.get_current_batter().character.name,
-            "batter_stats": game.get_current_batter().character.batter_stats,
-            "opponent_name": game.get_current_pitcher().character.name,
-            "current_pitcher_name": home_p.character.name,
-            "pitch_count": home_p.pitch_count,
-            "current_stamina": home_p.current_stamina,
-            "max_stamina": home_p.character.stamina
-        })
-
-        # Away Manager Context
-        away_p = game.away_team.get_pitcher()
-        away_decision = manager_chain.invoke({
-            "team_name": game.away_team.name,
-            "score_diff": game.away_score - game.home_score,
-            "my_score": game.away_score,
-            "opp_score": game.home_score,
-            "inning": game.inning,
-            "half": game.half,
-            "outs": game.outs,
-            "runners": runners_str,
-            "batter_name": game.get_current_batter().character.name,
-            "batter_stats": game.get_current_batter().character.batter_stats,
-            "opponent_name": game.get_current_pitcher().character.name,
-            "current_pitcher_name": away_p.character.name,
-            "pitch_count": away_p.pitch_count,
-            "current_stamina": away_p.current_stamina,
-            "max_stamina": away_p.character.stamina
-        })
+        rule_update = _rule_managers(state)
+        if rule_update:
+            return rule_update
+        chain, inputs_list = _manager_call(state)
+        # 두 감독의 판단은 서로 독립적이므로 동시에 호출 (batch = 병렬 invoke)
+        keys = _manager_cache_keys(state["game"])
+        home_decision, away_decision = _cached_batch(state, chain, inputs_list, keys, ManagerDecision)
+        return {
+            "home_manager_decision": home_decision,
+            "away_manager_decision": away_decision
+        }
+    except Exception as e:
+        _log_node_error("manager_node", e)
+        raise e
 
+async def amanager_node(state: SimState):
+    try:
+        rule_update = _rule_managers(state)
+        if rule_update:
+            return rule_update
+        chain, inputs_list = _manager_call(state)
+        keys = _manager_cache_keys(state["game"])
+        home_decision, away_decision = await _acached_batch(state, chain, inputs_list, keys, ManagerDecision)
         return {
             "home_manager_decision": home_decision,
             "away_manager_decision": away_decision
         }
     except Exception as e:
-        err_msg = traceback.format_exc()
-        with open("error_log.txt", "w", encoding="utf-8") as f:
-            f.write(err_msg)
-        print(f"Error in manager_node: {e}")
+        _log_node_error("manager_node", e)
         raise e
 
-def pitcher_node(state: SimState):
-    """투수 의사결정"""
+def _pitcher_call(state: SimState):
     game = state["game"]
     pitcher = game.get_current_pitcher()
     batter = game.get_current_batter()
-    
+
     strategy = state["home_manager_decision"].defense_strategy if game.half == Half.TOP else state["away_manager_decision"].defense_strategy
-    
-    prompt = ChatPromptTemplate.from_template(PITCHER_PROMPT)
-    chain = prompt | llm.with_structured_output(PitcherDecision)
-    
-    decision = chain.invoke({
+
+    chain = get_chain("pitcher")
+
+    return chain, {
         "name": pitcher.character.name,
         "velocity": pitcher.character.pitcher_stats["velocity"],
         "stuff": pitcher.character.pitcher_stats["stuff"],
@@ -303,22 +830,29 @@ def pitcher_node(state: SimState):
         "power": batter.character.batter_stats["power"],
         "speed": batter.character.batter_stats["speed"],
         "strategy": strategy
-    })
-    
-    return {"pitcher_decision": decision}
+    }
 
-def batter_node(state: SimState):
-    """타자 의사결정"""
+def pitcher_node(state: SimState):
+    """투수 의사결정"""
+    chain, inputs = _pitcher_call(state)
+    key = _pitcher_cache_key(state["game"], inputs["strategy"])
+    return {"pitcher_decision": _cached_invoke(state, chain, inputs, key, PitcherDecision)}
+
+async def apitcher_node(state: SimState):
+    chain, inputs = _pitcher_call(state)
+    key = _pitcher_cache_key(state["game"], inputs["strategy"])
+    return {"pitcher_decision": await _acached_invoke(state, chain, inputs, key, PitcherDecision)}
+
+def _batter_call(state: SimState):
     game = state["game"]
     pitcher = game.get_current_pitcher()
     batter = game.get_current_batter()
-    
+
     strategy = state["away_manager_decision"].offense_strategy if game.half == Half.TOP else state["home_manager_decision"].offense_strategy
-    
-    prompt = ChatPromptTemplate.from_template(BATTER_PROMPT)
-    chain = prompt | llm.with_structured_output(BatterDecision)
-    
-    decision = chain.invoke({
+
+    chain = get_chain("batter")
+
+    return chain, {
         "name": batter.character.name,
         "contact": batter.character.batter_stats["contact"],
         "power": batter.character.batter_stats["power"],
@@ -328,124 +862,492 @@ def batter_node(state: SimState):
         "stuff": pitcher.character.pitcher_stats["stuff"],
         "control": pitcher.character.pitcher_stats["control"],
         "strategy": strategy
-    })
-    
-    return {"batter_decision": decision}
+    }
+
+def batter_node(state: SimState):
+    """타자 의사결정"""
+    chain, inputs = _batter_call(state)
+    key = _batter_cache_key(state["game"], inputs["strategy"])
+    return {"batter_decision": _cached_invoke(state, chain, inputs, key, BatterDecision)}
+
+async def abatter_node(state: SimState):
+    chain, inputs = _batter_call(state)
+    key = _batter_cache_key(state["game"], inputs["strategy"])
+    return {"batter_decision": await _acached_invoke(state, chain, inputs, key, BatterDecision)}
+
+def _plate_appearance_call(state: SimState):
+    game = state["game"]
+    ctx = state.get("director_ctx") or DirectorContext()
+    pitcher = game.get_current_pitcher()
+    batter = game.get_current_batter()
+
+    chain = get_chain("plate_appearance")
+
+    return chain, {
+        "inning": game.inning,
+        "half": game.half,
+        "outs": game.outs,
+        "runners": _runners_str(game),
+        "home_team_name": game.home_team.name,
+        "away_team_name": game.away_team.name,
+        "home_score": game.home_score,
+        "away_score": game.away_score,
+        "current_weather": ctx.weather,
+        "current_zone": ctx.umpire_zone,
+        "pitcher_name": pitcher.character.name,
+        "velocity": pitcher.character.pitcher_stats["velocity"],
+        "stuff": pitcher.character.pitcher_stats["stuff"],
+        "control": pitcher.character.pitcher_stats["control"],
+        "pitch_count": pitcher.pitch_count,
+        "current_stamina": pitcher.current_stamina,
+        "max_stamina": pitcher.character.stamina,
+        "batter_name": batter.character.name,
+        "contact": batter.character.batter_stats["contact"],
+        "power": batter.character.batter_stats["power"],
+        "speed": batter.character.batter_stats["speed"]
+    }
+
+def _plate_appearance_update(state: SimState, plan: PlateAppearancePlan):
+    update = {
+        "home_manager_decision": plan.home_manager,
+        "away_manager_decision": plan.away_manager,
+        "pitcher_decision": plan.pitcher,
+        "batter_decision": plan.batter
+    }
+    # 환경은 Director 스케줄 시점에만 교체
+    if _director_due(state):
+        update.update(_director_update(state, plan.director))
+    return update
+
+def plate_appearance_node(state: SimState):
+    """타석 에이전트 (Single-Call 모드): Director/Manager/Pitcher/Batter 결정을 1회 호출로 수행"""
+    try:
+        chain, inputs = _plate_appearance_call(state)
+        return _plate_appearance_update(state, _invoke(chain, inputs))
+    except Exception as e:
+        _log_node_error("plate_appearance_node", e)
+        raise e
+
+async def aplate_appearance_node(state: SimState):
+    try:
+        chain, inputs = _plate_appearance_call(state)
+        return _plate_appearance_update(state, await _ainvoke(chain, inputs))
+    except Exception as e:
+        _log_node_error("plate_appearance_node", e)
+        raise e
+
+def _resolver_call(state: SimState):
+    game = state["game"]
+    pitcher = game.get_current_pitcher()
+    batter = game.get_current_batter()
+
+    ctx = state["director_ctx"]
+    p_dec = state["pitcher_decision"]
+    b_dec = state["batter_decision"]
+
+    compact = _compact(state)
+    chain = get_chain("resolver_compact" if compact else "resolver")
+
+    runners = {
+        "runner_1": game.bases.basec1.character.name if game.bases.basec1 else "없음",
+        "runner_2": game.bases.basec2.character.name if game.bases.basec2 else "없음",
+        "runner_3": game.bases.basec3.character.name if game.bases.basec3 else "없음"
+    }
+
+    # 수비 라인업은 하프이닝 동안 바뀌지 않으므로 이닝 교대까지 캐시
+    defense_team = game.get_defense_team()
+    if compact:
+        defense_lineup_str = half_inning_context(_prompt_context(state), "defense_summary", lambda: defense_summary(defense_team))
+    else:
+        defense_lineup_str = half_inning_context(_prompt_context(state), "defense_lineup", lambda: defense_lineup(defense_team))
+
+    val_res = state.get("validator_result")
+    feedback = ""
+    if val_res and not val_res.is_valid:
+        feedback = f"⚠️ [PREVIOUS FAILED]: {val_res.error_type} - {val_res.correction_suggestion}"
+
+    runners_status = f"주자: 1루[{runners['runner_1']}], 2루[{runners['runner_2']}], 3루[{runners['runner_3']}]"
+
+    return chain, {
+        "weather": ctx.weather,
+        "wind": ctx.wind_direction,
+        "zone": ctx.umpire_zone,
+        "outs": game.outs,
+        "runners_status": runners_status,
+        "defense_lineup": defense_lineup_str,
+        "pitcher_name": pitcher.character.name,
+        "pitch_type": p_dec.pitch_type,
+        "pitch_location": p_dec.location,
+        "velocity": pitcher.character.pitcher_stats["velocity"],
+        "stuff": pitcher.character.pitcher_stats["stuff"],
+        "control": pitcher.character.pitcher_stats["control"],
+        "mental": pitcher.character.pitcher_stats.get("mental", 50),
+        "batter_name": batter.character.name,
+        "aim_type": b_dec.aim_pitch_type,
+        "aim_location": b_dec.aim_location,
+        "contact": batter.character.batter_stats["contact"],
+        "power": batter.character.batter_stats["power"],
+        "speed": batter.character.batter_stats["speed"],
+        "eye": batter.character.batter_stats.get("eye", 50),
+        "clutch": batter.character.batter_stats.get("clutch", 50),
+        "validator_feedback": feedback
+    }
+
+def _narration_batched(state: SimState) -> bool:
+    config = state.get("config") or EngineConfig()
+    return config.narration == NarrationMode.BATCHED
+
+def _outcome_call(state: SimState):
+    """결과 우선 판정 (BATCHED 중계): 최소 입력 + 결과 코드/짧은 요약만 출력"""
+    _, inputs = _resolver_call(state)
+    return get_chain("outcome"), inputs
+
+def _outcome_result(state: SimState, outcome: PlateOutcome) -> SimulationResult:
+    p_dec = state.get("pitcher_decision")
+    b_dec = state.get("batter_decision")
+    return SimulationResult(
+        reasoning="[Outcome] 결과 우선 판정 (중계 멘트는 하프이닝 단위 배치 생성)",
+        result_code=outcome.result_code,
+        description=outcome.summary,
+        pitch_desc=f"{p_dec.pitch_type.value}/{p_dec.location.value}" if p_dec else "",
+        hit_desc=b_dec.style.value if b_dec else ""
+    )
+
+def _uses_stat_resolver(state: SimState) -> bool:
+    config = state.get("config") or EngineConfig()
+    return config.mode == EngineMode.STATISTICAL or config.resolver == ResolverBackend.STAT
+
+def _stat_resolve(state: SimState) -> SimulationResult:
+    """통계 판정기로 결과 샘플링 (LLM 호출 없음)"""
+    game = state["game"]
+    offense_dec = state.get("away_manager_decision") if game.half == Half.TOP else state.get("home_manager_decision")
+    return state["stat_resolver"].resolve(
+        game,
+        ctx=state.get("director_ctx"),
+        p_dec=state.get("pitcher_decision"),
+        b_dec=state.get("batter_decision"),
+        offense_strategy=offense_dec.offense_strategy if offense_dec else None
+    )
+
+def _llm_resolver_call(state: SimState):
+    """LLM 판정 체인 + 입력 (BATCHED 중계면 결과 우선 판정)"""
+    if _narration_batched(state):
+        return _outcome_call(state)
+    return _resolver_call(state)
+
+def _as_result(state: SimState, raw: Any) -> SimulationResult:
+    return _outcome_result(state, raw) if isinstance(raw, PlateOutcome) else raw
+
+def _speculative_k(state: SimState) -> int:
+    config = state.get("config") or EngineConfig()
+    return config.speculative_candidates
+
+def _speculative_local(state: SimState, candidates: List[SimulationResult]) -> Tuple[List[Optional[ValidatorResult]], List[int]]:
+    """
+    후보별 규칙 기반 검증. 반환: (판정 목록, LLM 검증이 필요한 후보 인덱스).
+    LLM 검증은 로컬에서 처음 통과한 후보보다 앞선 판단 보류 후보만 받습니다 (순차 재시도라면 그 후보들을 먼저 검증했을 것이므로).
+    """
+    verdicts = [_local_validation(state, c) for c in candidates]
+    first_pass = next((i for i, v in enumerate(verdicts) if v is not None and v.is_valid), len(verdicts))
+    return verdicts, [i for i, v in enumerate(verdicts[:first_pass]) if v is None]
+
+def _speculative_pick(candidates: List[SimulationResult], verdicts: List[Optional[ValidatorResult]]) -> Dict[str, Any]:
+    """
+    후보 순서대로 처음 채택되는 후보 선택 (응답 속도가 아닌 순서 기준이라 결과 분포가 순차 재시도와 같음).
+    통과 판정이거나, 검증하지 못한 후보(검증 오류: 순차 경로의 validator_node도 그대로 진행)면 채택합니다.
+    모두 실패면 첫 후보의 실패 판정으로 기존 재시도 경로를 탑니다.
+    """
+    for res, verdict in zip(candidates, verdicts):
+        if verdict is None or verdict.is_valid:
+            return {"last_result": res, "validator_result": verdict, "prevalidated": True}
+    return {"last_result": candidates[0], "validator_result": verdicts[0], "prevalidated": True}
+
+def _speculative_resolve(state: SimState, raw_candidates: List[Any]) -> Dict[str, Any]:
+    candidates = [_as_result(state, raw) for raw in raw_candidates]
+    verdicts, pending = _speculative_local(state, candidates)
+    if pending:
+        chain = get_chain("validator")
+        try:
+            for i, verdict in zip(pending, _batch(chain, [_validator_inputs(state, candidates[i]) for i in pending])):
+                verdicts[i] = verdict
+        except Exception as e:
+            print(f"Error in speculative validation: {e}")
+    return _speculative_pick(candidates, verdicts)
+
+async def _aspeculative_resolve(state: SimState, raw_candidates: List[Any]) -> Dict[str, Any]:
+    candidates = [_as_result(state, raw) for raw in raw_candidates]
+    verdicts, pending = _speculative_local(state, candidates)
+    if pending:
+        chain = get_chain("validator")
+        try:
+            for i, verdict in zip(pending, await _abatch(chain, [_validator_inputs(state, candidates[i]) for i in pending])):
+                verdicts[i] = verdict
+        except Exception as e:
+            print(f"Error in speculative validation: {e}")
+    return _speculative_pick(candidates, verdicts)
+
+def _publish_live(state: SimState, frame: Dict[str, Any]):
+    sink = state.get("live_sink")
+    if not sink:
+        return
+    try:
+        sink(frame)
+    except Exception as e:
+        print(f"Error in live sink: {e}")
+
+def _live_stream_call(state: SimState, chain):
+    """
+    실시간 중계: 판정 응답의 description을 토큰 단위로 NARRATION_PARTIAL 프레임으로 보낼 (스트리밍 체인, 청크 콜백).
+    수신자가 없거나, BATCHED 중계 / 투기적 판정이거나, LLM이 스트리밍을 지원하지 않으면 None.
+    """
+    if not state.get("live_sink") or _narration_batched(state) or _speculative_k(state) > 1:
+        return None
+    stream_chain = get_stream_chain(_chain_name(chain))
+    if stream_chain is None:
+        return None
+
+    game = state["game"]
+    frame = {"type": "NARRATION_PARTIAL", "match_id": game.match_id, "seq": state.get("pa_count", 0),
+             "attempt": state.get("retry_count", 0), "final": False}
+    last_text = [""]
+
+    def on_chunk(chunk: Any):
+        text = chunk.get("description") if isinstance(chunk, dict) else None
+        if text and text != last_text[0]:
+            last_text[0] = text
+            _publish_live(state, {**frame, "text": text})
+
+    return stream_chain, on_chunk
 
 def resolver_node(state: SimState):
-    """최종 결과 판정 (물리 엔진 역할)"""
-    import traceback
+    """
+    최종 결과 판정 (물리 엔진 역할).
+    speculative_candidates가 2 이상이면 후보 K개를 한 번에 요청해 동시에 검증하고 첫 통과 후보를 고릅니다.
+    실시간 중계 수신자가 있으면 중계 멘트를 토큰 단위로 스트리밍합니다.
+    """
     try:
-        game = state["game"]
-        pitcher = game.get_current_pitcher()
-        batter = game.get_current_batter()
-        
-        ctx = state["director_ctx"]
-        p_dec = state["pitcher_decision"]
-        b_dec = state["batter_decision"]
-        
-        prompt = ChatPromptTemplate.from_template(RESOLVER_PROMPT)
-        chain = prompt | llm.with_structured_output(SimulationResult)
-        
-        runners = {
-            "runner_1": game.bases.basec1.character.name if game.bases.basec1 else "없음",
-            "runner_2": game.bases.basec2.character.name if game.bases.basec2 else "없음",
-            "runner_3": game.bases.basec3.character.name if game.bases.basec3 else "없음"
-        }
-        
-        defense_team = game.get_defense_team()
-        defense_info_lines = []
-        for p in defense_team.roster:
-            if p.character.role == Role.BATTER:
-                d_stats = p.character.batter_stats.get("defense", {"range":50, "error":50, "arm":50})
-                info = f"- {p.character.position_main} {p.character.name}: 범위 {d_stats['range']}, 실책 {d_stats['error']}, 어깨 {d_stats['arm']}"
-                defense_info_lines.append(info)
-        defense_lineup_str = "\n".join(defense_info_lines)
-    
-        val_res = state.get("validator_result")
-        feedback = ""
-        if val_res and not val_res.is_valid:
-            feedback = f"⚠️ [PREVIOUS FAILED]: {val_res.error_type} - {val_res.correction_suggestion}"
-        
-        runners_status = f"주자: 1루[{runners['runner_1']}], 2루[{runners['runner_2']}], 3루[{runners['runner_3']}]"
-
-        res = chain.invoke({
-            "weather": ctx.weather,
-            "wind": ctx.wind_direction,
-            "zone": ctx.umpire_zone,
-            "outs": game.outs,
-            "runners_status": runners_status,
-            "defense_lineup": defense_lineup_str,
-            "pitcher_name": pitcher.character.name,
-            "pitch_type": p_dec.pitch_type,
-            "pitch_location": p_dec.location,
-            "velocity": pitcher.character.pitcher_stats["velocity"],
-            "stuff": pitcher.character.pitcher_stats["stuff"],
-            "control": pitcher.character.pitcher_stats["control"],
-            "mental": pitcher.character.pitcher_stats.get("mental", 50),
-            "batter_name": batter.character.name,
-            "aim_type": b_dec.aim_pitch_type,
-            "aim_location": b_dec.aim_location,
-            "contact": batter.character.batter_stats["contact"],
-            "power": batter.character.batter_stats["power"],
-            "speed": batter.character.batter_stats["speed"],
-            "eye": batter.character.batter_stats.get("eye", 50),
-            "clutch": batter.character.batter_stats.get("clutch", 50),
-            "validator_feedback": feedback
-        })
-        
-        return {"last_result": res}
+        if _uses_stat_resolver(state):
+            return {"last_result": _stat_resolve(state)}
+        chain, inputs = _llm_resolver_call(state)
+        k = _speculative_k(state)
+        if k > 1:
+            return _speculative_resolve(state, _batch(chain, [inputs] * k))
+        live = _live_stream_call(state, chain)
+        if live:
+            return {"last_result": SimulationResult.model_validate(_stream(live[0], inputs, live[1]))}
+        return {"last_result": _as_result(state, _invoke(chain, inputs))}
     except Exception as e:
-        err_msg = traceback.format_exc()
-        with open("error_log.txt", "w", encoding="utf-8") as f:
-            f.write(err_msg)
-        print(f"Error in resolver_node: {e}")
+        _log_node_error("resolver_node", e)
         raise e
 
-def validator_node(state: SimState):
-    """시뮬레이션 결과 검증 (Rule Expert)"""
+async def aresolver_node(state: SimState):
     try:
-        game = state["game"]
-        res = state["last_result"]
-        
-        prompt = ChatPromptTemplate.from_template(VALIDATOR_PROMPT)
-        validator_chain = prompt | llm.with_structured_output(ValidatorResult)
-        
-        prev_runners = []
-        if game.bases.basec1: prev_runners.append("1루")
-        if game.bases.basec2: prev_runners.append("2루")
-        if game.bases.basec3: prev_runners.append("3루")
-        prev_runners_str = ",".join(prev_runners) if prev_runners else "없음"
-        
-        val_res = validator_chain.invoke({
-            "outs": game.outs,
-            "runners_before": prev_runners_str,
-            "result_code": res.result_code,
-            "description": res.description
-        })
-        
-        current_retry = state.get("retry_count", 0)
-        
-        if not val_res.is_valid:
-            if current_retry < 3:
-                warn_msg = f"⚠️ [Validation Warning] {val_res.error_type}: {val_res.reasoning}. Retrying... ({current_retry+1}/3)"
-                print(warn_msg)
-                with open("simulation_log.txt", "a", encoding="utf-8") as f:
-                    f.write(warn_msg + "\n")
-                return {"validator_result": val_res, "retry_count": current_retry + 1}
-            else:
-                err_msg = f"❌ [Validation Failed] Max Retries Reached. Proceeding anyway. ({val_res.reasoning})"
-                print(err_msg)
-                with open("simulation_log.txt", "a", encoding="utf-8") as f:
-                    f.write(err_msg + "\n")
-                return {"validator_result": val_res, "retry_count": 0}
+        if _uses_stat_resolver(state):
+            return {"last_result": _stat_resolve(state)}
+        chain, inputs = _llm_resolver_call(state)
+        k = _speculative_k(state)
+        if k > 1:
+            return await _aspeculative_resolve(state, await _abatch(chain, [inputs] * k))
+        live = _live_stream_call(state, chain)
+        if live:
+            return {"last_result": SimulationResult.model_validate(await _astream(live[0], inputs, live[1]))}
+        return {"last_result": _as_result(state, await _ainvoke(chain, inputs))}
+    except Exception as e:
+        _log_node_error("resolver_node", e)
+        raise e
+
+def _validator_inputs(state: SimState, res: SimulationResult) -> Dict[str, Any]:
+    game = state["game"]
+    return {
+        "outs": game.outs,
+        "runners_before": _runners_str(game),
+        "result_code": res.result_code,
+        "description": res.description
+    }
+
+def _validator_call(state: SimState):
+    return get_chain("validator"), _validator_inputs(state, state["last_result"])
+
+def _validator_update(state: SimState, val_res: ValidatorResult):
+    current_retry = state.get("retry_count", 0)
+
+    if not val_res.is_valid:
+        if current_retry < 3:
+            metrics.VALIDATOR_RETRIES.inc()
+            warn_msg = f"⚠️ [Validation Warning] {val_res.error_type}: {val_res.reasoning}. Retrying... ({current_retry+1}/3)"
+            print(warn_msg)
+            with open("simulation_log.txt", "a", encoding="utf-8") as f:
+                f.write(warn_msg + "\n")
+            return {"validator_result": val_res, "retry_count": current_retry + 1}
         else:
+            metrics.VALIDATOR_FAILURES.inc()
+            err_msg = f"❌ [Validation Failed] Max Retries Reached. Proceeding anyway. ({val_res.reasoning})"
+            print(err_msg)
+            with open("simulation_log.txt", "a", encoding="utf-8") as f:
+                f.write(err_msg + "\n")
             return {"validator_result": val_res, "retry_count": 0}
-        
+    else:
+        return {"validator_result": val_res, "retry_count": 0}
+
+def _local_validation(state: SimState, result: Optional[SimulationResult] = None) -> Optional[ValidatorResult]:
+    """
+    규칙 기반 검증 (코드 표 + 키워드 사전). result를 주지 않으면 state["last_result"]를 검증합니다.
+    LLM 검증이 필요하면 None 반환.
+    """
+    config = state.get("config") or EngineConfig()
+    if _uses_stat_resolver(state):
+        return ValidatorResult(is_valid=True, reasoning="[Stat] 통계 판정기 결과 (코드/멘트 템플릿 일치)")
+    if config.validator_mode == ValidatorMode.LLM:
+        return None
+    local_res = validate_locally(result or state["last_result"])
+    if local_res is None and config.validator_mode == ValidatorMode.LOCAL:
+        local_res = ValidatorResult(is_valid=True, reasoning="[Local] 판단 보류 - 통과 처리")
+    return local_res
+
+def _prevalidated_update(state: SimState) -> Dict[str, Any]:
+    """투기적 판정에서 resolver가 이미 내린 검증 결과 반영"""
+    val_res = state.get("validator_result")
+    update = _validator_update(state, val_res) if val_res else {"validator_result": None}
+    update["prevalidated"] = False
+    return update
+
+def validator_node(state: SimState):
+    """시뮬레이션 결과 검증 (Rule Expert)"""
+    try:
+        if state.get("prevalidated"):
+            return _prevalidated_update(state)
+        local_res = _local_validation(state)
+        if local_res is not None:
+            return _validator_update(state, local_res)
+        chain, inputs = _validator_call(state)
+        return _validator_update(state, _invoke(chain, inputs))
     except Exception as e:
         print(f"Error in validator_node: {e}")
         return {"validator_result": None}
 
+async def avalidator_node(state: SimState):
+    try:
+        if state.get("prevalidated"):
+            return _prevalidated_update(state)
+        local_res = _local_validation(state)
+        if local_res is not None:
+            return _validator_update(state, local_res)
+        chain, inputs = _validator_call(state)
+        return _validator_update(state, await _ainvoke(chain, inputs))
+    except Exception as e:
+        print(f"Error in validator_node: {e}")
+        return {"validator_result": None}
+
+def _stat_managers(state: SimState) -> Dict[str, ManagerDecision]:
+    """
+    STATISTICAL 그래프(감독 노드 없음)의 감독 결정: 타석마다 규칙 기반 감독 (체력/투구 수 기준 투수 교체, 상황별 작전).
+    다른 모드는 감독 노드가 이미 결정했으므로 빈 dict.
+    """
+    config = state.get("config") or EngineConfig()
+    if config.mode != EngineMode.STATISTICAL:
+        return {}
+    home_decision, away_decision = rule_manager_decisions(state["game"])
+    return {"home_manager_decision": home_decision, "away_manager_decision": away_decision}
+
+def _stamina_cost(p_dec: Optional[PitcherDecision]) -> Optional[int]:
+    return (3 if p_dec.effort == "Full_Power" else 1) if p_dec else None
+
+def _broadcast_play(state: SimState, game: GameState, res: SimulationResult, runs_scored: int, leverage: float):
+    """타석 결과 중계: 로그 / simulation_log.txt / BroadcastData(jsonl 또는 배치 중계) / 실시간 프레임 / 콘솔"""
+    leverage_label = expectancy.leverage_label(leverage)
+    p_dec = state.get('pitcher_decision')
+
+    # Log (Console)
+    log_entry = f"[{game.inning}회{'초' if game.half==Half.TOP else '말'}] {res.description}"
+    
+    # 주자/점수 상황 로깅
+    runners_log = []
+    if game.bases.basec1: runners_log.append("1루: " + game.bases.basec1.character.name)
+    if game.bases.basec2: runners_log.append("2루: " + game.bases.basec2.character.name)
+    if game.bases.basec3: runners_log.append("3루: " + game.bases.basec3.character.name)
+    runners_str = ", ".join(runners_log) if runners_log else "없음"
+    
+    log_entry += f" (주자: {runners_str}, 득점: {runs_scored})"
+    if leverage_label == "HIGH":
+        log_entry += f" [승부처 LI {leverage:.1f}]"
+    game.logs.append(log_entry)
+    log_index = len(game.logs) - 1
+    
+    # --- Data Logging (File) ---
+    b_dec = state.get('batter_decision')
+    
+    with open("simulation_log.txt", "a", encoding="utf-8") as f:
+        f.write(log_entry + "\n")
+        if p_dec and b_dec:
+            f.write(f"   (P: {p_dec.pitch_type}/{p_dec.location}, B: {b_dec.style})\n")
+
+    # 2. JSON Data Log (Frontend Interface)
+    pitcher = game.get_current_pitcher()
+    batter = game.get_current_batter()
+    next_batter_info = game.get_next_batter_info()
+    
+    # Runners Info for Broadcast
+    runners_data = [None, None, None]
+    if game.bases.basec1: runners_data[0] = {"name": game.bases.basec1.character.name}
+    if game.bases.basec2: runners_data[1] = {"name": game.bases.basec2.character.name}
+    if game.bases.basec3: runners_data[2] = {"name": game.bases.basec3.character.name}
+
+    broadcast_data = BroadcastData(
+        match_id=game.match_id,
+        inning=game.inning,
+        half="TOP" if game.half == Half.TOP else "BOTTOM",
+        outs=game.outs,
+        home_score=game.home_score,
+        away_score=game.away_score,
+        current_batter={
+            "name": batter.character.name,
+            "role": "BATTER",
+            "stats": batter.character.batter_stats
+        },
+        current_pitcher={
+            "name": pitcher.character.name,
+            "role": "PITCHER",
+            "stats": pitcher.character.pitcher_stats
+        },
+        runners=runners_data,
+        result=res,
+        next_batter=next_batter_info,
+        win_probability=round(game.win_probability, 4),
+        leverage_index=round(leverage, 2),
+        leverage_label=leverage_label
+    )
+    
+    narrator = state.get("narrator")
+    if narrator:
+        # 중계 멘트는 하프이닝 종료 후 배치 생성 -> 완성되면 jsonl/로그에 반영
+        narrator.add(NarrationPlay(state.get("pa_count", 0), broadcast_data, log_index, log_entry, runs_scored))
+    else:
+        with open("broadcast_data.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(broadcast_data.model_dump(), ensure_ascii=False) + "\n")
+    _publish_live(state, {
+        "type": "NARRATION_FINAL", "match_id": game.match_id, "seq": state.get("pa_count", 0),
+        "attempt": state.get("retry_count", 0), "text": res.description, "final": True,
+        "data": broadcast_data.model_dump(mode="json")
+    })
+
+    # Console Output (Broadcast)
+    print(f"BROADCAST: {log_entry}")
+    if p_dec and b_dec:
+        print(f"   -> Pitcher: {p_dec.pitch_type} ({p_dec.effort})")
+        print(f"   -> Batter: {b_dec.style} (Aim: {b_dec.aim_pitch_type})")
+
+def _log_substitution(state: SimState, game: GameState, defense_team: Team, old_pitcher: PlayerState):
+    """투수 교체 기록 (이벤트 로그 / 경기 로그 / simulation_log.txt)"""
+    log = state.get("event_log")
+    if log is not None:
+        event_log.record_substitution(log, state.get("pa_count", 0), defense_team.team_id)
+    new_pitcher = defense_team.get_pitcher()
+    sub_log = f"🔄 [투수 교체] {defense_team.name}: {old_pitcher.character.name} -> {new_pitcher.character.name} (투구수: {old_pitcher.pitch_count}, 체력: {old_pitcher.current_stamina})"
+    game.logs.append(sub_log)
+    print(sub_log)
+    with open("simulation_log.txt", "a", encoding="utf-8") as f:
+        f.write(sub_log + "\n")
+
 def update_state_node(state: SimState):
     """상태 업데이트 및 준비 (Agent-Environment Pattern)"""
     import traceback
@@ -458,105 +1360,37 @@ def update_state_node(state: SimState):
         
         # [Data Integrity] Store the result
         game.last_result = res
+        leverage = expectancy.leverage_index(game) # 타석 직전 상황 기준
         
         # --- [Agent-Environment Transition] ---
         # Agent has spoken (res.result_code). Now Environment reacts.
         # Use Deterministic Rule Engine
         runs_scored = BaseballRuleEngine.apply_result(game, res)
+        stamina_cost = _stamina_cost(state.get('pitcher_decision'))
+        log = state.get("event_log")
+        if log is not None:
+            event_log.record_play(log, state.get("pa_count", 0), res.result_code, stamina_cost)
+        game.win_probability = expectancy.win_probability(game)
+        game.leverage_index = leverage
+        _broadcast_play(state, game, res, runs_scored, leverage)
         
-        # Log (Console)
-        log_entry = f"[{game.inning}회{'초' if game.half==Half.TOP else '말'}] {res.description}"
-        
-        # 주자/점수 상황 로깅
-        runners_log = []
-        if game.bases.basec1: runners_log.append("1루: " + game.bases.basec1.character.name)
-        if game.bases.basec2: runners_log.append("2루: " + game.bases.basec2.character.name)
-        if game.bases.basec3: runners_log.append("3루: " + game.bases.basec3.character.name)
-        runners_str = ", ".join(runners_log) if runners_log else "없음"
-        
-        log_entry += f" (주자: {runners_str}, 득점: {runs_scored})"
-        game.logs.append(log_entry)
+        # Prepare Next Batter + Pitcher Mechanics
+        current_pitcher = BaseballRuleEngine.finish_plate_appearance(game, stamina_cost)
         
-        # --- Data Logging (File) ---
-        p_dec = state.get('pitcher_decision')
-        b_dec = state.get('batter_decision')
-        
-        with open("simulation_log.txt", "a", encoding="utf-8") as f:
-            f.write(log_entry + "\n")
-            if p_dec and b_dec:
-                f.write(f"   (P: {p_dec.pitch_type}/{p_dec.location}, B: {b_dec.style})\n")
-    
-        # 2. JSON Data Log (Frontend Interface)
-        pitcher = game.get_current_pitcher()
-        batter = game.get_current_batter()
-        next_batter_info = game.get_next_batter_info()
-        
-        # Runners Info for Broadcast
-        runners_data = [None, None, None]
-        if game.bases.basec1: runners_data[0] = {"name": game.bases.basec1.character.name}
-        if game.bases.basec2: runners_data[1] = {"name": game.bases.basec2.character.name}
-        if game.bases.basec3: runners_data[2] = {"name": game.bases.basec3.character.name}
-    
-        broadcast_data = BroadcastData(
-            match_id=game.match_id,
-            inning=game.inning,
-            half="TOP" if game.half == Half.TOP else "BOTTOM",
-            outs=game.outs,
-            home_score=game.home_score,
-            away_score=game.away_score,
-            current_batter={
-                "name": batter.character.name,
-                "role": "BATTER",
-                "stats": batter.character.batter_stats
-            },
-            current_pitcher={
-                "name": pitcher.character.name,
-                "role": "PITCHER",
-                "stats": pitcher.character.pitcher_stats
-            },
-            runners=runners_data,
-            result=res,
-            next_batter=next_batter_info
-        )
-        
-        with open("broadcast_data.jsonl", "a", encoding="utf-8") as f:
-            f.write(json.dumps(broadcast_data.model_dump(), ensure_ascii=False) + "\n")
-    
-        # Console Output (Broadcast)
-        print(f"BROADCAST: {log_entry}")
-        if p_dec and b_dec:
-            print(f"   -> Pitcher: {p_dec.pitch_type} ({p_dec.effort})")
-            print(f"   -> Batter: {b_dec.style} (Aim: {b_dec.aim_pitch_type})")
-        
-        # Prepare Next Batter
-        game.next_batter()
-        
-        # --- Pitcher Mechanics & Substitution ---
-        current_pitcher = game.get_current_pitcher()
-        if current_pitcher and p_dec:
-            current_pitcher.pitch_count += 1
-            stamina_cost = 1
-            if p_dec.effort == "Full_Power":
-                stamina_cost = 3
-            current_pitcher.current_stamina = max(0, current_pitcher.current_stamina - stamina_cost)
-            
-        defense_manager_dec = state["home_manager_decision"] if game.half == Half.TOP else state["away_manager_decision"]
+        # --- Substitution ---
+        manager_update = _stat_managers(state)
+        decisions = manager_update or state
+        defense_manager_dec = decisions["home_manager_decision"] if game.half == Half.TOP else decisions["away_manager_decision"]
         
         if defense_manager_dec.change_pitcher:
             try:
                 defense_team = game.get_defense_team()
-                old_pitcher_name = current_pitcher.character.name
                 if defense_team.change_pitcher():
-                    new_pitcher = defense_team.get_pitcher()
-                    sub_log = f"🔄 [투수 교체] {defense_team.name}: {old_pitcher_name} -> {new_pitcher.character.name} (투구수: {current_pitcher.pitch_count}, 체력: {current_pitcher.current_stamina})"
-                    game.logs.append(sub_log)
-                    print(sub_log)
-                    with open("simulation_log.txt", "a", encoding="utf-8") as f:
-                        f.write(sub_log + "\n")
+                    _log_substitution(state, game, defense_team, current_pitcher)
             except Exception as e:
                 print(f"Substitution Error: {e}")
     
-        return {"game": game}
+        return {"game": game, "pa_count": state.get("pa_count", 0) + 1, **manager_update}
     except Exception as e:
         err_msg = traceback.format_exc()
         with open("error_log.txt", "w", encoding="utf-8") as f:
@@ -564,33 +1398,31 @@ def update_state_node(state: SimState):
         print(f"Error in update_state_node: {e}")
         raise e
 
+def _half_inning_update(state: SimState, game: GameState) -> Dict[str, Any]:
+    """공수 교대 직후 처리 (Director 재판단 표시, 배치 중계 flush, 프롬프트 문맥 초기화, 스냅샷, STATISTICAL 감독 결정)"""
+    update: Dict[str, Any] = {"director_pending": True}
+    if state.get("narrator"):
+        state["narrator"].flush()
+    if state.get("prompt_context") is not None:
+        state["prompt_context"].clear()
+    if state.get("event_log") is not None and game.status != SimulationStatus.FINISHED:
+        event_log.record_snapshot(state["event_log"], game, state.get("pa_count", 0))
+    # 공수 교대: 새 공격 팀의 작전을 교대 후 상황으로 다시 결정 (STATISTICAL)
+    update.update(_stat_managers(state))
+    return update
+
 def check_inning_node(state: SimState):
     """이닝/경기 종료 조건 체크"""
     import traceback
     try:
         game = state["game"]
+        update = {"game": game}
         
-        if game.outs >= 3:
-            game.outs = 0
-            game.bases.basec1 = None
-            game.bases.basec2 = None
-            game.bases.basec3 = None
-            
-            if game.half == Half.TOP:
-                game.half = Half.BOTTOM
-            else:
-                game.half = Half.TOP
-                game.inning += 1
-                
-        # Game Over Condition (9이닝 이상 & 말 공격 종료 후 승부 남)
-        if game.inning > 9:
-             if game.half == Half.TOP: # 말 종료 직후 inning이 올라가서 TOP이 됨
-                 # 이전 이닝(9회말, 10회말 등) 종료 시점의 점수 확인
-                 if game.home_score != game.away_score:
-                     game.status = SimulationStatus.FINISHED
-                     return {"game": game}
+        if BaseballRuleEngine.check_inning(game):
+            # 이닝 교대 -> Director 재판단 시점
+            update.update(_half_inning_update(state, game))
         
-        return {"game": game}
+        return update
     except Exception as e:
         err_msg = traceback.format_exc()
         with open("error_log.txt", "w", encoding="utf-8") as f:
@@ -612,60 +1444,201 @@ def route_validator(state: SimState):
         return "retry"
     return "continue"
 
-# --- Graph Construction ---
-workflow = StateGraph(SimState)
-
-# Add Nodes
-workflow.add_node("director", director_node)
-workflow.add_node("manager", manager_node)
-workflow.add_node("pitcher", pitcher_node)
-workflow.add_node("batter", batter_node)
-workflow.add_node("resolver", resolver_node)
-workflow.add_node("validator", validator_node)
-workflow.add_node("update_state", update_state_node)
-workflow.add_node("check_inning", check_inning_node)
-
-# Add Edges (Linear Pipeline)
-workflow.set_entry_point("director")
-workflow.add_edge("director", "manager")
-workflow.add_edge("manager", "pitcher")
-workflow.add_edge("pitcher", "batter")
-workflow.add_edge("batter", "resolver")
-workflow.add_edge("resolver", "validator")
-workflow.add_conditional_edges(
-    "validator",
-    route_validator,
-    {
-        "retry": "resolver",
-        "continue": "update_state"
-    }
-)
-workflow.add_edge("update_state", "check_inning")
-workflow.add_conditional_edges(
-    "check_inning",
-    check_game_end_condition,
-    {
-        "continue": "director",
-        "end": END
-    }
-)
+# --- STATISTICAL Loop (compact state) ---
+# STATISTICAL 경기는 그래프 대신 FastGame 위에서 타석을 진행합니다 (같은 규칙 / 같은 난수 소비 -> 그래프와 같은 경기).
+# GameState로는 시작할 때 한 번 읽고, 타석마다 중계(로그 / BroadcastData / on_step_callback)가 읽기 직전에만 되돌려 씁니다.
 
-app = workflow.compile()
+def _fast_resolve(state: SimState, resolver: FastResolver, fast: FastGame) -> Tuple[SimulationResult, float]:
+    """통계 판정 (규칙 기반 공격 작전), 타석 직전 레버리지와 함께 반환"""
+    players = resolver.roster.players
+    code, probs = resolver.sample(fast, fast.offense_strategy())
+    res = state["stat_resolver"].result(
+        code, probs, players[fast.batter()].character, players[fast.pitcher()].character,
+        state.get("pitcher_decision"), state.get("batter_decision")
+    )
+    return res, expectancy.get_tables().leverage_index(*fast.situation())
 
+def _fast_update(state: SimState, fast: FastGame, res: SimulationResult, leverage: float) -> Dict[str, Any]:
+    """update_state_node와 같은 처리 (결과 반영 -> 중계 -> 다음 타자 / 투구 수 -> 규칙 기반 투수 교체)"""
+    game = state["game"]
+    runs_scored = fast.apply(res.result_code)
+    stamina_cost = _stamina_cost(state.get("pitcher_decision"))
+    log = state.get("event_log")
+    if log is not None:
+        event_log.record_play(log, state.get("pa_count", 0), res.result_code, stamina_cost)
 
-# --- Execution Entry ---
-def run_engine(
-    game_state: GameState, 
-    db_session: Optional[Any] = None,
-    on_step_callback=None
-) -> GameState:
+    # 중계 경계: 결과 반영 직후 상태를 GameState에 씀
+    fast.write_to(game)
+    game.last_result = res
+    game.win_probability = expectancy.get_tables().win_probability(*fast.situation())
+    game.leverage_index = leverage
+    _broadcast_play(state, game, res, runs_scored, leverage)
+
+    pitcher = fast.finish_plate_appearance(stamina_cost)
+    side = fast.defense
+    changed = fast.should_change_pitcher(side) and fast.change_pitcher(side)
+    fast.write_to(game)
+    if changed:
+        _log_substitution(state, game, game.get_defense_team(), fast.roster.players[pitcher])
+    return {"game": game, "pa_count": state.get("pa_count", 0) + 1}
+
+def _fast_check_inning(state: SimState, fast: FastGame) -> Dict[str, Any]:
+    game = state["game"]
+    update: Dict[str, Any] = {"game": game}
+    if fast.check_inning():
+        fast.write_to(game)
+        update.update(_half_inning_update(state, game))
+    return update
+
+_timed_fast_resolve = timed_node("resolver", _fast_resolve)
+_timed_fast_update = timed_node("update_state", _fast_update)
+_timed_fast_check_inning = timed_node("check_inning", _fast_check_inning)
+
+def _stat_stream(state: SimState):
     """
-    API에서 호출 가능한 시뮬레이션 엔진 진입점.
+    STATISTICAL 경기 진행. graph.stream과 같은 모양의 갱신({"update_state": ...}, {"check_inning": ...})을 타석마다 냅니다.
+    판정기 난수는 state["stat_resolver"]의 것을 그대로 쓰므로 체크포인트의 rng_state로 이어서 진행할 수 있습니다.
     """
-    print(f"--- Engine Triggered for Match {game_state.match_id} ---")
-    
+    state = dict(state)
+    game = state["game"]
+    resolver = FastResolver(
+        game, state["stat_resolver"].rng,
+        state.get("director_ctx"), state.get("pitcher_decision"), state.get("batter_decision")
+    )
+    fast = FastGame.from_game(game, resolver.roster)
+    while not fast.finished:
+        res, leverage = _timed_fast_resolve(state, resolver, fast)
+        update = _timed_fast_update(state, fast, res, leverage)
+        state.update(update)
+        yield {"update_state": update}
+        update = _timed_fast_check_inning(state, fast)
+        state.update(update)
+        yield {"check_inning": update}
+
+def _run_chunks(mode: EngineMode, state: Dict[str, Any]):
+    """모드별 경기 진행 (노드별 갱신 스트림)"""
+    if mode == EngineMode.STATISTICAL:
+        return _stat_stream(state)
+    return get_graph(mode).stream(state, config={"recursion_limit": 1000})
+
+async def _arun_chunks(mode: EngineMode, state: Dict[str, Any]):
+    if mode == EngineMode.STATISTICAL:
+        for chunk in _stat_stream(state):
+            yield chunk
+            await asyncio.sleep(0) # 타석마다 이벤트 루프에 양보
+        return
+    async for chunk in get_graph(mode).astream(state, config={"recursion_limit": 1000}):
+        yield chunk
+
+# --- Graph Construction ---
+def build_workflow(mode: EngineMode = EngineMode.MULTI_AGENT):
+    """
+    모드별 StateGraph 구성.
+    - MULTI_AGENT: (director || manager -> pitcher || batter) -> resolver (에이전트별 개별 호출, 병렬 분기)
+    - SINGLE_CALL: plate_appearance -> resolver (타석 에이전트 1회 호출)
+    - STATISTICAL: resolver(통계 판정기) -> update_state (LLM 호출 없음). run_engine은 같은 규칙의 _stat_stream을 씁니다.
+    """
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.graph import StateGraph, START, END
+
+    workflow = StateGraph(SimState)
+
+    # Resolution & State Nodes (Shared)
+    workflow.add_node("resolver", RunnableLambda(timed_node("resolver", resolver_node), afunc=timed_node("resolver", aresolver_node)))
+    workflow.add_node("validator", RunnableLambda(timed_node("validator", validator_node), afunc=timed_node("validator", avalidator_node)))
+    workflow.add_node("update_state", timed_node("update_state", update_state_node))
+    workflow.add_node("check_inning", timed_node("check_inning", check_inning_node))
+
+    # Decision Nodes (Mode-specific)
+    if mode == EngineMode.STATISTICAL:
+        # 에이전트/검증 없이: resolver(통계) -> update_state
+        entry = ["resolver"]
+        workflow.add_edge(START, "resolver")
+    elif mode == EngineMode.SINGLE_CALL:
+        workflow.add_node("plate_appearance", RunnableLambda(timed_node("plate_appearance", plate_appearance_node), afunc=timed_node("plate_appearance", aplate_appearance_node)))
+        entry = ["plate_appearance"]
+        workflow.add_edge(START, "plate_appearance")
+        workflow.add_edge("plate_appearance", "resolver")
+    else:
+        workflow.add_node("director", RunnableLambda(timed_node("director", director_node), afunc=timed_node("director", adirector_node)))
+        workflow.add_node("manager", RunnableLambda(timed_node("manager", manager_node), afunc=timed_node("manager", amanager_node)))
+        workflow.add_node("pitcher", RunnableLambda(timed_node("pitcher", pitcher_node), afunc=timed_node("pitcher", apitcher_node)))
+        workflow.add_node("batter", RunnableLambda(timed_node("batter", batter_node), afunc=timed_node("batter", abatter_node)))
+        entry = ["director", "manager"]
+
+        # Add Edges (Parallel Fan-out / Join)
+        # director || manager -> (pitcher || batter) -> resolver
+        # director는 감독 결정과 무관하고, pitcher/batter는 서로의 결정을 읽지 않음
+        for node in entry:
+            workflow.add_edge(START, node)
+        workflow.add_edge("manager", "pitcher")
+        workflow.add_edge("manager", "batter")
+        workflow.add_edge(["director", "pitcher", "batter"], "resolver")
+
+    if mode == EngineMode.STATISTICAL:
+        workflow.add_edge("resolver", "update_state")
+    else:
+        workflow.add_edge("resolver", "validator")
+        workflow.add_conditional_edges(
+            "validator",
+            route_validator,
+            {
+                "retry": "resolver",
+                "continue": "update_state"
+            }
+        )
+    workflow.add_edge("update_state", "check_inning")
+
+    # 다음 타석: 모드별 진입 노드(들)로 다시 분기
+    def route_next_plate_appearance(state: SimState):
+        if check_game_end_condition(state) == "end":
+            return END
+        return entry
+
+    workflow.add_conditional_edges(
+        "check_inning",
+        route_next_plate_appearance,
+        entry + [END]
+    )
+    return workflow
+
+# 모드별 컴파일된 그래프 (첫 사용 시 컴파일)
+compiled_graphs: Dict[EngineMode, Any] = {}
+
+def get_graph(mode: EngineMode = EngineMode.MULTI_AGENT):
+    graph = compiled_graphs.get(mode)
+    if graph is None:
+        with _init_lock:
+            graph = compiled_graphs.get(mode)
+            if graph is None:
+                graph = compiled_graphs[mode] = build_workflow(mode).compile()
+    return graph
+
+def __getattr__(name: str):
+    # 기존 모듈 속성 호환 (engine.workflow / engine.app)
+    if name == "workflow":
+        return build_workflow(EngineMode.MULTI_AGENT)
+    if name == "app":
+        return get_graph(EngineMode.MULTI_AGENT)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# --- Execution Entry ---
+def _start_match(
+    game_state: GameState, db_session: Optional[Any], config: EngineConfig, resume_from: Optional[MatchCheckpoint] = None,
+    live_sink: Optional[Callable[[Dict[str, Any]], None]] = None, log: Optional[GameEventLog] = None
+) -> Dict[str, Any]:
+    """경기 시작 로그 + 그래프 초기 상태 구성 (resume_from이 있으면 체크포인트 시점의 상태)"""
+    if resume_from:
+        game_state = resume_from.game.model_copy(deep=True)
+        print(f"--- Engine Resumed for Match {game_state.match_id} at PA {resume_from.pa_count} "
+              f"({game_state.inning}{'초' if game_state.half == Half.TOP else '말'}, Mode: {config.mode.value}) ---")
+    else:
+        print(f"--- Engine Triggered for Match {game_state.match_id} (Mode: {config.mode.value}) ---")
+
     with open("simulation_log.txt", "a", encoding="utf-8") as f:
-        f.write(f"\n\n=== New Match (ID: {game_state.match_id}) Triggered at {os.environ.get('HOSTNAME', 'Local')} ===\n")
+        title = f"Resumed at PA {resume_from.pa_count}" if resume_from else "New Match"
+        f.write(f"\n\n=== {title} (ID: {game_state.match_id}) Triggered at {os.environ.get('HOSTNAME', 'Local')} ===\n")
 
     
     # Initialize Contexts
@@ -673,7 +1646,7 @@ def run_engine(
     home_manager_decision = ManagerDecision(description="초기화", offense_strategy=TeamStrategy.NORMAL, defense_strategy=TeamStrategy.NORMAL)
     away_manager_decision = ManagerDecision(description="초기화", offense_strategy=TeamStrategy.NORMAL, defense_strategy=TeamStrategy.NORMAL)
 
-    initial_state = {
+    state = {
         "game": game_state, 
         "db_session": db_session,
         "director_ctx": director_ctx,
@@ -683,18 +1656,216 @@ def run_engine(
         "batter_decision": BatterDecision(style=BattingStyle.CAUTIOUS, description="Initial"),
         "last_result": None,
         "validator_result": None,
-        "retry_count": 0
+        "retry_count": 0,
+        "config": config,
+        "pa_count": 0,
+        "director_pending": True,
+        "director_last_pa": None,
+        "stat_resolver": StatResolver(random.Random(config.seed)),
+        "narrator": _make_narrator(game_state, config),
+        "prompt_context": {},
+        "prevalidated": False,
+        "live_sink": live_sink,
+        "event_log": log
     }
-    
-    # Run Graph
-    step_count = 0
-    for s in app.stream(initial_state, config={"recursion_limit": 1000}):
-        if "update_state" in s:
-            updated_game = s["update_state"]["game"]
-            if on_step_callback:
-                on_step_callback(updated_game)
-            step_count += 1
-            
-    print(f"--- Simulation Finished (Steps: {step_count}) ---")
+    if resume_from:
+        restore_checkpoint(state, resume_from)
+    if log is not None:
+        # 이어서 진행: 체크포인트 이후 기록은 버리고 다시 씀 / 처음 기록: 시작 시점 스냅샷
+        if resume_from:
+            event_log.truncate(log, resume_from.pa_count)
+        if not log.snapshots:
+            event_log.record_snapshot(log, game_state, state["pa_count"])
+    return state
+
+def _make_narrator(game_state: GameState, config: EngineConfig) -> Optional[HalfInningNarrator]:
+    if config.narration != NarrationMode.BATCHED:
+        return None
+    return HalfInningNarrator(game_state, _NodeChain(get_chain("narration"), config.priority))
+
+def fast_forward_config(config: EngineConfig, match_id: str, pa_count: int) -> EngineConfig:
+    """
+    남은 경기를 통계 판정기로 즉시 끝내는 설정 (LLM 호출 없음).
+    seed가 없으면 경기 ID + 시작 타석 번호로 정하므로 같은 시점에서 빨리 감으면 항상 같은 결과입니다.
+    """
+    seed = config.seed if config.seed is not None else zlib.crc32(f"{match_id}:{pa_count}".encode())
+    return config.model_copy(update={"mode": EngineMode.STATISTICAL, "narration": NarrationMode.INLINE, "seed": seed})
+
+def _fast_forward_due(fast_forward: Optional[threading.Event], chunk: Dict[str, Any], tracker: Optional[CheckpointTracker]) -> bool:
+    """빨리 감기 요청이 있으면 타석 경계(check_inning 직후)에서 LLM 그래프를 멈춤"""
+    if fast_forward is None or not fast_forward.is_set() or "check_inning" not in chunk:
+        return False
+    state = tracker.state
+    return state["config"].mode != EngineMode.STATISTICAL and state["game"].status != SimulationStatus.FINISHED
+
+def _fast_forward_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """진행 중 그래프 상태 -> 같은 GameState를 이어서 진행할 STATISTICAL 그래프 초기 상태"""
+    game = state["game"]
+    config = fast_forward_config(state["config"], game.match_id, state.get("pa_count", 0))
+    print(f"--- Fast-forward: Match {game.match_id} from PA {state.get('pa_count', 0)} (seed {config.seed}) ---")
+    return {
+        **state,
+        "config": config,
+        "stat_resolver": StatResolver(random.Random(config.seed)),
+        "narrator": None, # 이미 쌓인 배치 중계는 기존 narrator가 경기 종료 시 마무리
+        "last_result": None,
+        "validator_result": None,
+        "retry_count": 0,
+        "prevalidated": False
+    }
+
+def _finish_match(game_state: GameState, step_count: int, rate: MatchRate):
+    print(f"--- Simulation Finished (Steps: {step_count}, {rate.finish():.2f} PA/s) ---")
     print(f"Final Score: {game_state.away_team.name} {game_state.away_score} : {game_state.home_score} {game_state.home_team.name}")
+
+def _deliver_narration(narrator: HalfInningNarrator, on_narration_callback=None):
+    """완성된 중계 멘트를 BroadcastData/로그에 반영하고 콜백으로 전달"""
+    for seq, description in narrator.drain():
+        if on_narration_callback:
+            on_narration_callback(seq, description)
+
+async def _adeliver_narration(narrator: HalfInningNarrator, on_narration_callback=None):
+    for seq, description in narrator.drain():
+        if on_narration_callback:
+            ret = on_narration_callback(seq, description)
+            if inspect.isawaitable(ret):
+                await ret
+
+def run_engine(
+    game_state: GameState, 
+    db_session: Optional[Any] = None,
+    on_step_callback=None,
+    config: Optional[EngineConfig] = None,
+    on_narration_callback=None,
+    on_checkpoint=None,
+    resume_from: Optional[MatchCheckpoint] = None,
+    on_live_callback=None,
+    fast_forward: Optional[threading.Event] = None,
+    event_log: Optional[GameEventLog] = None
+) -> GameState:
+    """
+    API에서 호출 가능한 시뮬레이션 엔진 진입점.
+    config.mode로 경기별 그래프(MULTI_AGENT / SINGLE_CALL)를 선택합니다. STATISTICAL은 그래프 대신 압축 상태(FastGame) 루프로 진행합니다.
+    config.narration이 BATCHED이면 중계 멘트가 나중에 채워지며, 완성될 때마다
+    on_narration_callback(seq, description)이 호출됩니다 (seq: 0부터 시작하는 타석 번호).
+    on_checkpoint(MatchCheckpoint): config.checkpoint 일정(기본 하프이닝 교대)마다 호출. 저장해 둔 체크포인트를
+    resume_from으로 넘기면 그 시점부터 이어서 진행하며, 이때 game_state 대신 체크포인트의 GameState를 사용/반환합니다.
+    on_live_callback(frame): 실시간 중계 프레임 (NARRATION_PARTIAL: 판정 중계 멘트 토큰 스트리밍,
+    NARRATION_FINAL: 타석 확정). 노드 안에서 호출되므로 빠르게 반환하는 일반 함수여야 합니다.
+    fast_forward: set()되면 다음 타석 경계에서 LLM 그래프를 멈추고 남은 경기를 통계 판정기로 즉시 끝냅니다
+    (fast_forward_config: 같은 GameState / 콜백 / 종료 처리를 그대로 사용).
+    event_log(GameEventLog): 주면 타석 결과 / 투수 교체 / Director 변경 이벤트와 하프이닝 스냅샷을 이 객체에 이어 붙입니다
+    (event_log.replay로 임의 시점 상태 재구성). resume_from과 함께 주면 체크포인트 이후 기록은 잘라내고 다시 씁니다.
+    """
+    config = config or EngineConfig()
+    priority_token = llm_priority.set(config.priority)
+    rate = None
+    try:
+        initial_state = _start_match(game_state, db_session, config, resume_from, on_live_callback, event_log)
+        game_state = initial_state["game"]
+        narrator = initial_state["narrator"]
+        tracker = CheckpointTracker(initial_state, config) if on_checkpoint or fast_forward else None
+
+        # Run Graph (빨리 감기 요청 시 같은 상태로 STATISTICAL 루프를 이어서 실행)
+        mode, stream_state = config.mode, initial_state
+        step_count = 0
+        rate = MatchRate(game_state.match_id)
+        while stream_state:
+            next_state = None
+            for s in _run_chunks(mode, stream_state):
+                if "update_state" in s:
+                    updated_game = s["update_state"]["game"]
+                    if on_step_callback:
+                        start = time.perf_counter()
+                        on_step_callback(updated_game)
+                        metrics.STEP_CALLBACK.observe(time.perf_counter() - start)
+                    step_count += 1
+                    rate.step()
+                if narrator:
+                    _deliver_narration(narrator, on_narration_callback)
+                checkpoint = tracker.observe(s) if tracker else None
+                if checkpoint and on_checkpoint:
+                    on_checkpoint(checkpoint)
+                if _fast_forward_due(fast_forward, s, tracker):
+                    next_state = _fast_forward_state(tracker.state)
+                    tracker.state = dict(next_state)
+                    break
+            mode, stream_state = EngineMode.STATISTICAL, next_state
+
+        if narrator:
+            narrator.close()
+            _deliver_narration(narrator, on_narration_callback)
+    finally:
+        llm_priority.reset(priority_token)
+        if rate:
+            rate.close()
+
+    _finish_match(game_state, step_count, rate)
+    return game_state
+
+async def arun_engine(
+    game_state: GameState, 
+    db_session: Optional[Any] = None,
+    on_step_callback=None,
+    config: Optional[EngineConfig] = None,
+    on_narration_callback=None,
+    on_checkpoint=None,
+    resume_from: Optional[MatchCheckpoint] = None,
+    on_live_callback=None,
+    fast_forward: Optional[threading.Event] = None,
+    event_log: Optional[GameEventLog] = None
+) -> GameState:
+    """
+    run_engine의 asyncio 버전.
+    모든 LLM 호출이 ainvoke로 이벤트 루프 위에서 실행되므로, 경기당 스레드 없이 여러 경기를 동시에 진행할 수 있습니다.
+    on_step_callback / on_narration_callback은 일반 함수 / 코루틴 함수 모두 허용합니다 (on_live_callback은 일반 함수만).
+    """
+    config = config or EngineConfig()
+    priority_token = llm_priority.set(config.priority)
+    rate = None
+    try:
+        initial_state = _start_match(game_state, db_session, config, resume_from, on_live_callback, event_log)
+        game_state = initial_state["game"]
+        narrator = initial_state["narrator"]
+        tracker = CheckpointTracker(initial_state, config) if on_checkpoint or fast_forward else None
+
+        # Run Graph (빨리 감기 요청 시 같은 상태로 STATISTICAL 루프를 이어서 실행)
+        mode, stream_state = config.mode, initial_state
+        step_count = 0
+        rate = MatchRate(game_state.match_id)
+        while stream_state:
+            next_state = None
+            async for s in _arun_chunks(mode, stream_state):
+                if "update_state" in s:
+                    updated_game = s["update_state"]["game"]
+                    if on_step_callback:
+                        start = time.perf_counter()
+                        ret = on_step_callback(updated_game)
+                        if inspect.isawaitable(ret):
+                            await ret
+                        metrics.STEP_CALLBACK.observe(time.perf_counter() - start)
+                    step_count += 1
+                    rate.step()
+                if narrator:
+                    await _adeliver_narration(narrator, on_narration_callback)
+                checkpoint = tracker.observe(s) if tracker else None
+                if checkpoint and on_checkpoint:
+                    ret = on_checkpoint(checkpoint)
+                    if inspect.isawaitable(ret):
+                        await ret
+                if _fast_forward_due(fast_forward, s, tracker):
+                    next_state = _fast_forward_state(tracker.state)
+                    tracker.state = dict(next_state)
+                    break
+            mode, stream_state = EngineMode.STATISTICAL, next_state
+
+        if narrator:
+            await asyncio.get_running_loop().run_in_executor(None, narrator.close)
+            await _adeliver_narration(narrator, on_narration_callback)
+    finally:
+        llm_priority.reset(priority_token)
+        if rate:
+            rate.close()
+
+    _finish_match(game_state, step_count, rate)
     return game_state
@@ -0,0 +1,121 @@
+"""
+이벤트 소싱 경기 기록 (GameEventLog).
+엔진이 타석 결과(정규 결과 코드) / 투수 교체 / 경기 환경 변경을 순서대로 남기고, 하프이닝 교대마다 스냅샷을 저장합니다.
+replay(log, seq)는 seq 이하의 마지막 스냅샷에서 출발해 그 뒤 이벤트만 BaseballRuleEngine으로 다시 적용하므로,
+임의 시점의 상태 조회 / 감사 / 재채점 비용이 전체 기록이 아니라 마지막 스냅샷 이후 이벤트 수에 비례합니다.
+"""
+from bisect import bisect_right
+from typing import Any, List, Optional
+
+from . import expectancy
+from .models import (
+    BaseState, DirectorContext, GameEvent, GameEventLog, GameEventType, GameSnapshot, GameState, PlayerState, SimulationResult
+)
+from .rule_engine import BaseballRuleEngine, PLAYS, play_index
+
+# --- 기록 (엔진 노드에서 호출) ---
+
+def record_play(log: GameEventLog, pa: int, result_code: str, stamina_cost: Optional[int]) -> GameEvent:
+    event = GameEvent(seq=len(log.events), pa=pa, type=GameEventType.PLAY, code=PLAYS[play_index(result_code)], stamina_cost=stamina_cost)
+    log.events.append(event)
+    return event
+
+def record_substitution(log: GameEventLog, pa: int, team_id: str) -> GameEvent:
+    event = GameEvent(seq=len(log.events), pa=pa, type=GameEventType.SUBSTITUTION, team_id=team_id)
+    log.events.append(event)
+    return event
+
+def record_director(log: GameEventLog, pa: int, ctx: DirectorContext) -> GameEvent:
+    event = GameEvent(seq=len(log.events), pa=pa, type=GameEventType.DIRECTOR, director=ctx)
+    log.events.append(event)
+    return event
+
+def _player_states(game: GameState) -> List[List[Any]]:
+    return [[p.pitch_count, p.current_stamina, p.condition] for team in (game.home_team, game.away_team) for p in team.roster]
+
+def record_snapshot(log: GameEventLog, game: GameState, pa_count: int) -> GameSnapshot:
+    """
+    현재 상태를 스냅샷으로 저장 (첫 스냅샷이면 로스터까지 담은 GameState를 log.start로 함께 저장).
+    로스터는 경기 중 바뀌지 않으므로 스냅샷에는 선수별 투구수/체력/컨디션과 주자 위치만 남깁니다.
+    """
+    if log.start is None:
+        log.start = game.model_copy(update={"logs": []}).model_copy(deep=True)
+    offense = game.get_offense_team().roster
+    # character_id로 찾음 (체크포인트 JSON에서 복원한 상태의 주자는 로스터 객체가 아니라 복사본)
+    runners = [next((i for i, p in enumerate(offense) if p.character.character_id == runner.character.character_id), None) if runner else None
+               for runner in (game.bases.basec1, game.bases.basec2, game.bases.basec3)]
+    frame = game.model_copy(update={
+        "logs": [], "bases": BaseState(),
+        "home_team": game.home_team.model_copy(update={"roster": []}),
+        "away_team": game.away_team.model_copy(update={"roster": []}),
+    }).model_copy(deep=True)
+    snapshot = GameSnapshot(seq=len(log.events), pa_count=pa_count, game=frame, players=_player_states(game), runners=runners)
+    log.snapshots.append(snapshot)
+    return snapshot
+
+def truncate(log: GameEventLog, pa_count: int) -> GameEventLog:
+    """pa_count번째 타석부터의 기록을 버림 (체크포인트에서 이어서 진행할 때, 중단된 실행이 남긴 뒷부분 제거)"""
+    log.events = [e for e in log.events if e.pa < pa_count]
+    log.snapshots = [s for s in log.snapshots if s.pa_count <= pa_count and s.seq <= len(log.events)]
+    if not log.snapshots:
+        # 출발할 스냅샷이 없으면 처음부터 다시 기록
+        log.start, log.events = None, []
+    return log
+
+# --- 재구성 ---
+
+def restore_snapshot(log: GameEventLog, snapshot: GameSnapshot) -> GameState:
+    """스냅샷 -> 새 GameState (log.start의 로스터에 스냅샷 시점 선수 상태를 입힘)"""
+    game = snapshot.game.model_copy(deep=True)
+    states = iter(snapshot.players)
+    for team, start in ((game.home_team, log.start.home_team), (game.away_team, log.start.away_team)):
+        roster = []
+        for player in start.roster:
+            pitch_count, stamina, condition = next(states)
+            roster.append(PlayerState(character=player.character.model_copy(), pitch_count=pitch_count, current_stamina=stamina, condition=condition))
+        team.roster = roster
+    offense = game.get_offense_team().roster
+    game.bases.basec1, game.bases.basec2, game.bases.basec3 = (offense[i] if i is not None else None for i in snapshot.runners)
+    return game
+
+def apply_event(game: GameState, event: GameEvent):
+    """이벤트 하나를 GameState에 적용 (update_state_node / check_inning_node / Director와 같은 규칙)"""
+    if event.type == GameEventType.PLAY:
+        game.last_result = SimulationResult(reasoning="", result_code=event.code, description="")
+        leverage = expectancy.leverage_index(game)
+        BaseballRuleEngine.apply_code(game, event.code)
+        game.win_probability = expectancy.win_probability(game)
+        game.leverage_index = leverage
+        BaseballRuleEngine.finish_plate_appearance(game, event.stamina_cost)
+        BaseballRuleEngine.check_inning(game)
+    elif event.type == GameEventType.SUBSTITUTION:
+        team = game.home_team if game.home_team.team_id == event.team_id else game.away_team
+        team.change_pitcher()
+    elif event.type == GameEventType.DIRECTOR:
+        game.director = event.director
+
+def replay(log: GameEventLog, seq: Optional[int] = None) -> GameState:
+    """
+    이벤트 seq개(None이면 전부)를 적용한 시점의 GameState (새 객체, logs는 비어 있음).
+    seq 이하의 마지막 스냅샷에서 출발하므로 그 뒤 이벤트만 적용합니다.
+    log.events는 그 스냅샷 이후만 담은 뒷부분이어도 됩니다 (DB에서 필요한 행만 읽은 경우, GameEvent.seq 기준).
+    """
+    if not log.snapshots:
+        raise ValueError("Event log has no snapshot to replay from")
+    offset = log.events[0].seq if log.events else log.snapshots[-1].seq
+    end = offset + len(log.events)
+    seq = end if seq is None else seq
+    if not log.snapshots[0].seq <= seq <= end:
+        raise ValueError(f"seq {seq} is outside the log ({log.snapshots[0].seq}..{end})")
+
+    snapshot = log.snapshots[bisect_right([s.seq for s in log.snapshots], seq) - 1]
+    if snapshot.seq < offset:
+        raise ValueError(f"Events {snapshot.seq}..{offset} are missing from the log")
+    game = restore_snapshot(log, snapshot)
+    for event in log.events[snapshot.seq - offset:seq - offset]:
+        apply_event(game, event)
+    return game
+
+def seq_at_pa(log: GameEventLog, pa: int) -> int:
+    """pa번째 타석(0부터)이 시작되기 직전까지의 이벤트 수 (replay(log, seq_at_pa(log, pa)) = 그 타석 직전 상태)"""
+    return sum(1 for e in log.events if e.pa < pa)
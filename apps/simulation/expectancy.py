@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from .models import GameState, Half
+from .rule_engine import base_mask
+
+# 테이블 구조/계산 방식이 바뀌면 올림 (디스크 캐시 무효화)
+TABLE_VERSION = 1
+
+MAX_RUNS = 25       # 하프이닝 득점 분포 상한 (마지막 칸은 잘림)
+MAX_DIFF = 20       # 점수 차(홈 - 원정) 범위 [-MAX_DIFF, MAX_DIFF], 바깥은 끝값으로 고정
+EXTRA_INNING = 10   # 10회 이상은 모두 같은 행 (연장)
+
+# 레버리지 구간 (Tango 기준)
+LEVERAGE_LABELS = ((2.0, "HIGH"), (0.85, "MEDIUM"), (0.0, "LOW"))
+
+# --- Tables (Cached) ---
+
+class ExpectancyTables:
+    """
+    RE24 (아웃 x 주자 기대 득점) + 이닝 x 점수 차 x 아웃/주자 홈 승리 확률 + 레버리지 지수.
+    모든 조회는 배열 인덱싱 (O(1)).
+    """
+
+    def __init__(self, arrays: Dict[str, Any], fingerprint: str):
+        self.arrays = arrays
+        self.fingerprint = fingerprint
+        self.re24 = arrays["run_expectancy"]
+        self.we = arrays["win_expectancy"]
+        self.half_end = arrays["half_end"]
+        self.leverage = arrays["leverage"]
+
+    @staticmethod
+    def _index(inning: int, half: Half, diff: int):
+        return min(max(inning, 1), EXTRA_INNING), 0 if half == Half.TOP else 1, min(max(int(diff), -MAX_DIFF), MAX_DIFF) + MAX_DIFF
+
+    def run_expectancy(self, outs: int, bases: int) -> float:
+        return float(self.re24[outs, bases])
+
+    def win_probability(self, inning: int, half: Half, outs: int, bases: int, diff: int) -> float:
+        """홈 팀 승리 확률 (diff = 홈 - 원정, outs >= 3이면 하프이닝 종료 직후)"""
+        i, h, d = self._index(inning, half, diff)
+        if outs >= 3:
+            return float(self.half_end[i, h, d])
+        return float(self.we[i, h, outs, bases, d])
+
+    def leverage_index(self, inning: int, half: Half, outs: int, bases: int, diff: int) -> float:
+        i, h, d = self._index(inning, half, diff)
+        return float(self.leverage[i, h, min(outs, 2), bases, d])
+
+    def save(self, path: str):
+        import numpy as np
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp.npz"
+        meta = json.dumps({"version": TABLE_VERSION, "fingerprint": self.fingerprint})
+        np.savez_compressed(tmp, meta=np.array(meta), **self.arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> Optional["ExpectancyTables"]:
+        import numpy as np
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("version") != TABLE_VERSION or meta.get("fingerprint") != fingerprint:
+                    return None
+                arrays = {name: data[name] for name in data.files if name != "meta"}
+        except (OSError, ValueError, KeyError):
+            return None
+        return cls(arrays, fingerprint)
+
+def default_cache_dir() -> str:
+    """EXPECTANCY_CACHE_DIR, 없으면 사용자 캐시 디렉터리 (패키지 디렉터리는 설치/컨테이너 이미지에서 읽기 전용일 수 있음)"""
+    configured = os.environ.get("EXPECTANCY_CACHE_DIR")
+    if configured:
+        return configured
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "baseball-sim")
+
+def table_path(fingerprint: str, cache_dir: Optional[str] = None) -> str:
+    return os.path.join(cache_dir or default_cache_dir(), f"expectancy_v{TABLE_VERSION}_{fingerprint}.npz")
+
+def build_tables(probs: Optional[Any] = None) -> Dict[str, Any]:
+    """리그 평균(probs가 None) 기준 테이블 계산 (expectancy_build, NumPy)"""
+    from .expectancy_build import build_tables as build
+    return build(probs)
+
+# 캐시 디렉터리별 테이블 (같은 디렉터리는 한 번만 읽거나 계산)
+_tables: Dict[str, ExpectancyTables] = {}
+_lock = threading.Lock()
+
+def get_tables(cache_dir: Optional[str] = None) -> ExpectancyTables:
+    """
+    디스크 캐시(버전 + 전이 표/확률 지문 일치)가 있으면 불러오고, 없으면 계산 후 저장 (저장할 수 없으면 메모리에만).
+    NumPy와 계산 모듈은 여기서 처음 불러옵니다.
+    """
+    cache_dir = os.path.abspath(cache_dir or default_cache_dir())
+    tables = _tables.get(cache_dir)
+    if tables is None:
+        with _lock:
+            tables = _tables.get(cache_dir)
+            if tables is None:
+                from .expectancy_build import build_tables as build, fingerprint, league_probs
+                probs = league_probs()
+                key = fingerprint(probs)
+                path = table_path(key, cache_dir)
+                tables = ExpectancyTables.load(path, key)
+                if tables is None:
+                    tables = ExpectancyTables(build(probs), key)
+                    try:
+                        tables.save(path)
+                    except OSError as e:
+                        print(f"Expectancy table cache not saved: {e}")
+                _tables[cache_dir] = tables
+    return tables
+
+# --- GameState Helpers ---
+
+def win_probability(game: GameState) -> float:
+    return get_tables().win_probability(game.inning, game.half, game.outs, base_mask(game.bases), game.home_score - game.away_score)
+
+def leverage_index(game: GameState) -> float:
+    return get_tables().leverage_index(game.inning, game.half, game.outs, base_mask(game.bases), game.home_score - game.away_score)
+
+def leverage_label(li: float) -> str:
+    for threshold, label in LEVERAGE_LABELS:
+        if li >= threshold:
+            return label
+    return "LOW"
@@ -0,0 +1,177 @@
+"""
+기대 득점 / 승리 확률 / 레버리지 테이블 계산 (NumPy).
+expectancy.get_tables()가 디스크 캐시가 없을 때만 불러오므로 엔진 import 시점에는 NumPy를 읽지 않습니다.
+"""
+import hashlib
+from typing import Dict, Optional
+
+import numpy as np
+
+from .batch_sim import NEXT_BASES, RUNS, OUTS_ADDED
+from .expectancy import TABLE_VERSION, MAX_RUNS, MAX_DIFF, EXTRA_INNING
+from .stat_resolver import OUTCOMES, LEAGUE_RATES
+
+def league_probs() -> np.ndarray:
+    p = np.array([LEAGUE_RATES[o] for o in OUTCOMES], dtype=np.float64)
+    return p / p.sum()
+
+def fingerprint(probs: np.ndarray) -> str:
+    h = hashlib.sha256()
+    for arr in (NEXT_BASES, RUNS, OUTS_ADDED, probs):
+        h.update(np.ascontiguousarray(arr).tobytes())
+    h.update(f"{TABLE_VERSION}:{MAX_RUNS}:{MAX_DIFF}:{EXTRA_INNING}".encode())
+    return h.hexdigest()[:12]
+
+def run_distribution(probs: np.ndarray) -> np.ndarray:
+    """
+    F[outs, bases, k] = (outs, bases) 상태에서 하프이닝이 끝날 때까지 k점을 낼 확률.
+    규칙 엔진 전이 표로 만든 마르코프 연쇄를 아웃 수가 많은 쪽부터 풀어서 계산합니다.
+    """
+    F = np.zeros((4, 8, MAX_RUNS))
+    F[3, :, 0] = 1.0  # 3아웃: 더 이상 득점 없음
+    for outs in (2, 1, 0):
+        # 같은 아웃 수 + 무득점 전이 (미지수끼리의 연립방정식)
+        A0 = np.zeros((8, 8))
+        for o, p in enumerate(probs):
+            if OUTS_ADDED[o] == 0:
+                for b in range(8):
+                    if RUNS[o, b] == 0:
+                        A0[b, NEXT_BASES[o, b]] += p
+        solve = np.linalg.inv(np.eye(8) - A0)
+        for k in range(MAX_RUNS):
+            rhs = np.zeros(8)
+            for o, p in enumerate(probs):
+                next_outs = min(outs + OUTS_ADDED[o], 3)
+                for b in range(8):
+                    r = RUNS[o, b]
+                    if next_outs == outs and r == 0:
+                        continue
+                    if k - r >= 0:
+                        rhs[b] += p * F[next_outs, NEXT_BASES[o, b], k - r]
+            F[outs, :, k] = solve @ rhs
+    F = F[:3]
+    return F / F.sum(axis=2, keepdims=True)
+
+def _shift(values: np.ndarray, k: int) -> np.ndarray:
+    """values[d + k] (점수 차 범위 밖은 끝값)"""
+    idx = np.clip(np.arange(len(values)) + k, 0, len(values) - 1)
+    return values[idx]
+
+def _half_inning_values(R: np.ndarray):
+    """
+    하프이닝 시작 시점의 홈 승리 확률.
+    top[i, d] : i회초 시작, 점수 차 d / bottom[i, d] : i회말 시작 / end[i, d] : i회말 종료 직후
+    종료 규칙은 engine.check_inning_node와 동일 (9회 이후 말 종료 시 점수가 다르면 종료, 9회말은 항상 진행)
+    """
+    n_diff = 2 * MAX_DIFF + 1
+    diffs = np.arange(-MAX_DIFF, MAX_DIFF + 1)
+    top = np.zeros((EXTRA_INNING + 1, n_diff))
+    bottom = np.zeros_like(top)
+    end = np.zeros_like(top)
+
+    def final(next_top_tied: float) -> np.ndarray:
+        return np.where(diffs > 0, 1.0, np.where(diffs < 0, 0.0, next_top_tied))
+
+    def play_bottom(end_row: np.ndarray) -> np.ndarray:
+        return sum(R[k] * _shift(end_row, k) for k in range(MAX_RUNS))
+
+    def play_top(bottom_row: np.ndarray) -> np.ndarray:
+        return sum(R[k] * _shift(bottom_row, -k) for k in range(MAX_RUNS))
+
+    # 연장: 동점으로 시작하는 연장 초의 승률 x에 대한 고정점
+    x = 0.5
+    for _ in range(200):
+        end[EXTRA_INNING] = final(x)
+        bottom[EXTRA_INNING] = play_bottom(end[EXTRA_INNING])
+        top[EXTRA_INNING] = play_top(bottom[EXTRA_INNING])
+        new_x = top[EXTRA_INNING, MAX_DIFF]
+        if abs(new_x - x) < 1e-12:
+            break
+        x = new_x
+
+    for inning in range(EXTRA_INNING - 1, 0, -1):
+        if inning >= 9:
+            end[inning] = final(top[inning + 1, MAX_DIFF])
+        else:
+            end[inning] = top[inning + 1]
+        bottom[inning] = play_bottom(end[inning])
+        top[inning] = play_top(bottom[inning])
+    return top, bottom, end
+
+def _state_values(F: np.ndarray, bottom: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """WE[inning, half, outs, bases, diff] (half: 0 = 초, 1 = 말)"""
+    we = np.zeros((EXTRA_INNING + 1, 2, 3, 8, 2 * MAX_DIFF + 1))
+    for inning in range(1, EXTRA_INNING + 1):
+        for outs in range(3):
+            for b in range(8):
+                we[inning, 0, outs, b] = sum(F[outs, b, k] * _shift(bottom[inning], -k) for k in range(MAX_RUNS))
+                we[inning, 1, outs, b] = sum(F[outs, b, k] * _shift(end[inning], k) for k in range(MAX_RUNS))
+    return we
+
+def _swings(probs: np.ndarray, we: np.ndarray, bottom: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """상태별 다음 타석의 기대 승률 변동폭 sum_o p(o) |WE(다음) - WE(현재)|"""
+    swing = np.zeros_like(we)
+    for inning in range(1, EXTRA_INNING + 1):
+        for half, half_end in ((0, bottom[inning]), (1, end[inning])):
+            sign = -1 if half == 0 else 1
+            for outs in range(3):
+                for b in range(8):
+                    current = we[inning, half, outs, b]
+                    for o, p in enumerate(probs):
+                        next_outs = outs + OUTS_ADDED[o]
+                        r = sign * RUNS[o, b]
+                        if next_outs >= 3:
+                            nxt = _shift(half_end, r)
+                        else:
+                            nxt = _shift(we[inning, half, next_outs, NEXT_BASES[o, b]], r)
+                        swing[inning, half, outs, b] += p * np.abs(nxt - current)
+    return swing
+
+def _state_weights(probs: np.ndarray, R: np.ndarray) -> np.ndarray:
+    """
+    평균 경기에서 각 상태가 나타나는 빈도 (레버리지 정규화용).
+    (이닝, 초/말) 시작 시 점수 차 분포 x 하프이닝 안에서의 (아웃, 주자) 방문 횟수로 근사합니다.
+    """
+    n_diff = 2 * MAX_DIFF + 1
+    visits = np.zeros((3, 8))
+    dist = np.zeros((3, 8))
+    dist[0, 0] = 1.0
+    for _ in range(60):
+        visits += dist
+        nxt = np.zeros((3, 8))
+        for o, p in enumerate(probs):
+            for outs in range(3):
+                if OUTS_ADDED[o] + outs >= 3:
+                    continue
+                for b in range(8):
+                    nxt[outs + OUTS_ADDED[o], NEXT_BASES[o, b]] += p * dist[outs, b]
+        dist = nxt
+
+    weights = np.zeros((EXTRA_INNING + 1, 2, 3, 8, n_diff))
+    start = np.zeros(n_diff)
+    start[MAX_DIFF] = 1.0
+    diffs = np.arange(-MAX_DIFF, MAX_DIFF + 1)
+    for inning in range(1, EXTRA_INNING + 1):
+        weights[inning, 0] = visits[:, :, None] * start[None, None, :]
+        after_top = sum(R[k] * _shift(start, k) for k in range(MAX_RUNS))
+        weights[inning, 1] = visits[:, :, None] * after_top[None, None, :]
+        start = sum(R[k] * _shift(after_top, -k) for k in range(MAX_RUNS))
+        if inning >= 9:
+            start = np.where(diffs == 0, start, 0.0)
+    return weights
+
+def build_tables(probs: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    probs = league_probs() if probs is None else probs
+    F = run_distribution(probs)
+    top, bottom, end = _half_inning_values(F[0, 0])
+    we = _state_values(F, bottom, end)
+    swing = _swings(probs, we, bottom, end)
+    weights = _state_weights(probs, F[0, 0])
+    leverage = swing / ((swing * weights).sum() / weights.sum())
+    return {
+        "run_distribution": F,
+        "run_expectancy": (F * np.arange(MAX_RUNS)).sum(axis=2),
+        "win_expectancy": we,
+        "half_end": np.stack([bottom, end], axis=1),  # [inning, half] 하프이닝 종료 직후 승률
+        "leverage": leverage,
+    }
@@ -0,0 +1,238 @@
+"""
+타석 루프용 압축 게임 상태 (__slots__ + 정수 선수 id).
+pydantic GameState/Team/PlayerState는 경계에서만 씁니다. STATISTICAL 경기(engine._stat_stream)는 시작할 때 GameState를
+FastGame으로 바꿔 제자리 갱신하고, 중계(로그 / 콜백 / 체크포인트)가 읽기 직전에만 write_to로 GameState에 되돌려 씁니다.
+복제는 정수 몇 개와 짧은 리스트 복사뿐이라 model_copy(deep=True)보다 훨씬 가볍습니다.
+"""
+import itertools
+import random
+from bisect import bisect
+from typing import Dict, List, Optional, Tuple
+
+from .models import (
+    GameState, Half, PlayerState, Role, SimulationStatus, TeamStrategy,
+    DirectorContext, PitcherDecision, BatterDecision
+)
+from .manager_policy import pitcher_tired, situational_offense
+from .rule_engine import N_OUT_STATES, TRANSITIONS, play_index
+from .stat_resolver import OUTCOMES, apply_decisions, defense_ratings, matchup_probabilities
+
+EMPTY = -1
+AWAY, HOME = 0, 1
+
+class Roster:
+    """경기 중 바뀌지 않는 선수 표: id -> PlayerState, 팀별 타순 / 투수 id (원정 = 0, 홈 = 1)"""
+    __slots__ = ("players", "lineups", "staffs")
+
+    def __init__(self, game: GameState):
+        players: List[PlayerState] = []
+        lineups, staffs = [], []
+        for team in (game.away_team, game.home_team):
+            lineup, staff = [], []
+            for player in team.roster:
+                if player.character.role == Role.BATTER:
+                    lineup.append(len(players))
+                elif player.character.role == Role.PITCHER:
+                    staff.append(len(players))
+                players.append(player)
+            lineups.append(tuple(lineup))
+            staffs.append(tuple(staff))
+        self.players: Tuple[PlayerState, ...] = tuple(players)
+        self.lineups: Tuple[Tuple[int, ...], ...] = tuple(lineups)
+        self.staffs: Tuple[Tuple[int, ...], ...] = tuple(staffs)
+
+class FastGame:
+    """
+    GameState의 타석 루프 부분 (이닝/아웃/점수/주자/타순/투수/투구수/체력).
+    팀별 값은 [원정, 홈] 리스트, 주자는 선수 id (없으면 EMPTY).
+    """
+    __slots__ = (
+        "roster", "inning", "top", "outs", "score", "batter_index", "pitcher_index",
+        "b1", "b2", "b3", "pitch_count", "stamina", "finished"
+    )
+
+    @classmethod
+    def from_game(cls, game: GameState, roster: Optional[Roster] = None) -> "FastGame":
+        """경계 변환: GameState -> FastGame (roster는 같은 경기끼리 재사용 가능)"""
+        roster = roster or Roster(game)
+        # 주자는 character_id로 찾음 (체크포인트 JSON에서 복원한 GameState의 주자는 로스터 객체의 복사본)
+        start = 0 if game.half == Half.TOP else len(game.away_team.roster)
+        offense = roster.players[start:start + len(game.get_offense_team().roster)]
+        ids = {p.character.character_id: start + i for i, p in enumerate(offense)}
+        fast = cls.__new__(cls)
+        fast.roster = roster
+        fast.inning = game.inning
+        fast.top = game.half == Half.TOP
+        fast.outs = game.outs
+        fast.score = [game.away_score, game.home_score]
+        fast.batter_index = [game.current_batter_index_away, game.current_batter_index_home]
+        fast.pitcher_index = [game.away_team.current_pitcher_index, game.home_team.current_pitcher_index]
+        fast.b1, fast.b2, fast.b3 = (ids.get(r.character.character_id, EMPTY) if r else EMPTY for r in (game.bases.basec1, game.bases.basec2, game.bases.basec3))
+        fast.pitch_count = [p.pitch_count for p in roster.players]
+        fast.stamina = [p.current_stamina for p in roster.players]
+        fast.finished = game.status == SimulationStatus.FINISHED
+        return fast
+
+    def clone(self) -> "FastGame":
+        fast = FastGame.__new__(FastGame)
+        fast.roster = self.roster
+        fast.inning = self.inning
+        fast.top = self.top
+        fast.outs = self.outs
+        fast.score = self.score[:]
+        fast.batter_index = self.batter_index[:]
+        fast.pitcher_index = self.pitcher_index[:]
+        fast.b1, fast.b2, fast.b3 = self.b1, self.b2, self.b3
+        fast.pitch_count = self.pitch_count[:]
+        fast.stamina = self.stamina[:]
+        fast.finished = self.finished
+        return fast
+
+    def write_to(self, game: GameState) -> GameState:
+        """
+        경계 변환: 진행 결과를 원래 GameState(같은 로스터)에 반영.
+        투구수/체력은 투수만 씁니다 (FastGame은 타자의 값을 바꾸지 않음).
+        """
+        players = self.roster.players
+        game.inning = self.inning
+        game.half = Half.TOP if self.top else Half.BOTTOM
+        game.outs = self.outs
+        game.away_score, game.home_score = self.score
+        game.current_batter_index_away, game.current_batter_index_home = self.batter_index
+        game.away_team.current_pitcher_index, game.home_team.current_pitcher_index = self.pitcher_index
+        game.bases.basec1, game.bases.basec2, game.bases.basec3 = (players[b] if b != EMPTY else None for b in (self.b1, self.b2, self.b3))
+        for staff in self.roster.staffs:
+            for i in staff:
+                players[i].pitch_count = self.pitch_count[i]
+                players[i].current_stamina = self.stamina[i]
+        if self.finished:
+            game.status = SimulationStatus.FINISHED
+        return game
+
+    # --- 조회 ---
+
+    @property
+    def offense(self) -> int:
+        return AWAY if self.top else HOME
+
+    @property
+    def defense(self) -> int:
+        return HOME if self.top else AWAY
+
+    @property
+    def bases_mask(self) -> int:
+        return (self.b1 != EMPTY) | (self.b2 != EMPTY) << 1 | (self.b3 != EMPTY) << 2
+
+    def situation(self) -> Tuple[int, Half, int, int, int]:
+        """(이닝, 초/말, 아웃, 주자 마스크, 홈 - 원정) = ExpectancyTables 조회 인자"""
+        return self.inning, Half.TOP if self.top else Half.BOTTOM, self.outs, self.bases_mask, self.score[HOME] - self.score[AWAY]
+
+    def batter(self) -> int:
+        side = AWAY if self.top else HOME
+        lineup = self.roster.lineups[side]
+        return lineup[(self.batter_index[side] - 1) % len(lineup)]
+
+    def pitcher(self, side: Optional[int] = None) -> int:
+        """side 팀(기본: 수비 팀)의 현재 투수 id"""
+        side = self.defense if side is None else side
+        staff = self.roster.staffs[side]
+        return staff[min(self.pitcher_index[side], len(staff) - 1)]
+
+    # --- 감독 규칙 (manager_policy와 같은 기준) ---
+
+    def offense_strategy(self) -> TeamStrategy:
+        diff = self.score[AWAY] - self.score[HOME]
+        return situational_offense(self.outs, self.bases_mask, self.inning, diff if self.top else -diff)
+
+    def should_change_pitcher(self, side: int) -> bool:
+        """체력 / 투구 수 기준 교체 (남은 투수가 있을 때만)"""
+        if self.pitcher_index[side] + 1 >= len(self.roster.staffs[side]):
+            return False
+        pitcher = self.pitcher(side)
+        return pitcher_tired(self.stamina[pitcher], self.pitch_count[pitcher])
+
+    def change_pitcher(self, side: int) -> bool:
+        """다음 투수로 교체 (Team.change_pitcher와 동일)"""
+        if self.pitcher_index[side] + 1 < len(self.roster.staffs[side]):
+            self.pitcher_index[side] += 1
+            return True
+        return False
+
+    # --- 진행 (BaseballRuleEngine / update_state / check_inning과 같은 규칙) ---
+
+    def apply(self, code: str) -> int:
+        """타석 결과 반영, 득점 반환 (BaseballRuleEngine.apply_result와 같은 전이 표)"""
+        b1, b2, b3, outs = self.b1, self.b2, self.b3, self.outs
+        row = TRANSITIONS[play_index(code)][outs if outs < N_OUT_STATES else N_OUT_STATES - 1]
+        _, runs, added_outs, sources, moves = row[(b1 != EMPTY) | (b2 != EMPTY) << 1 | (b3 != EMPTY) << 2]
+        if moves:
+            runners = (self.batter() if 0 in sources else EMPTY, b1, b2, b3)
+            s1, s2, s3 = sources
+            self.b1 = runners[s1] if s1 is not None else EMPTY
+            self.b2 = runners[s2] if s2 is not None else EMPTY
+            self.b3 = runners[s3] if s3 is not None else EMPTY
+        self.outs = outs + added_outs
+        self.score[AWAY if self.top else HOME] += runs
+        return runs
+
+    def finish_plate_appearance(self, stamina_cost: Optional[int] = 1) -> int:
+        """다음 타자 + 투수 투구수/체력 (BaseballRuleEngine.finish_plate_appearance와 동일), 투수 id 반환"""
+        self.batter_index[AWAY if self.top else HOME] += 1
+        pitcher = self.pitcher()
+        if stamina_cost is not None:
+            self.pitch_count[pitcher] += 1
+            self.stamina[pitcher] = max(0, self.stamina[pitcher] - stamina_cost)
+        return pitcher
+
+    def check_inning(self) -> bool:
+        """3아웃이면 공수 교대 (BaseballRuleEngine.check_inning과 동일), 교대했으면 True"""
+        changed = self.outs >= 3
+        if changed:
+            self.outs = 0
+            self.b1 = self.b2 = self.b3 = EMPTY
+            if self.top:
+                self.top = False
+            else:
+                self.top = True
+                self.inning += 1
+        if self.inning > 9 and self.top and self.score[HOME] != self.score[AWAY]:
+            self.finished = True
+        return changed
+
+class FastResolver:
+    """
+    FastGame 위의 통계 판정 (StatResolver와 같은 확률 / 같은 난수 소비).
+    환경 / 투타 의도는 경기 동안 고정이므로 (타자, 투수, 득점권, 공격 작전)마다 확률과 누적 확률을 한 번만 계산합니다.
+    """
+
+    def __init__(
+        self,
+        game: GameState,
+        rng: Optional[random.Random] = None,
+        ctx: Optional[DirectorContext] = None,
+        p_dec: Optional[PitcherDecision] = None,
+        b_dec: Optional[BatterDecision] = None,
+        roster: Optional[Roster] = None
+    ):
+        self.roster = roster or Roster(game)
+        self.rng = rng or random.Random()
+        self._decisions = (ctx, p_dec, b_dec)
+        self._defense = (defense_ratings(game.away_team), defense_ratings(game.home_team))
+        self._cache: Dict[Tuple[int, int, bool, TeamStrategy], Tuple[Dict[str, float], List[float]]] = {}
+
+    def probabilities(self, fast: FastGame, strategy: TeamStrategy) -> Tuple[Dict[str, float], List[float]]:
+        """현재 타석의 결과별 확률과 OUTCOMES 순서 누적 확률"""
+        batter, pitcher = fast.batter(), fast.pitcher()
+        key = (batter, pitcher, fast.b2 != EMPTY or fast.b3 != EMPTY, strategy)
+        cached = self._cache.get(key)
+        if cached is None:
+            players = self.roster.players
+            probs = matchup_probabilities(players[batter].character, players[pitcher].character, self._defense[fast.defense], key[2])
+            probs = apply_decisions(probs, *self._decisions, strategy)
+            cached = self._cache[key] = (probs, list(itertools.accumulate(probs[o] for o in OUTCOMES)))
+        return cached
+
+    def sample(self, fast: FastGame, strategy: TeamStrategy) -> Tuple[str, Dict[str, float]]:
+        """결과 코드 샘플링 (random.choices(OUTCOMES, weights)와 같은 값을 뽑음)"""
+        probs, cum = self.probabilities(fast, strategy)
+        return OUTCOMES[bisect(cum, self.rng.random() * cum[-1], 0, len(cum) - 1)], probs
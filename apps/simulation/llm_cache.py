@@ -0,0 +1,228 @@
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .models import GameState, Half
+
+# 능력치 구간 폭 (넓을수록 캐시 적중률 ↑, 상황 구분력 ↓)
+DEFAULT_BAND_WIDTH = int(os.environ.get("LLM_CACHE_BAND", "20"))
+
+# --- Situation Fingerprint ---
+
+def inning_bucket(inning: int) -> str:
+    """이닝 구간 (초반/중반/후반/마지막)"""
+    if inning <= 3:
+        return "early"
+    if inning <= 6:
+        return "mid"
+    if inning <= 8:
+        return "late"
+    return "final"
+
+def score_diff_band(diff: int) -> str:
+    """점수 차 구간 (부호 유지): 동점 / 1점 / 2-3점 / 4점 이상"""
+    if diff == 0:
+        return "0"
+    sign = "+" if diff > 0 else "-"
+    gap = abs(diff)
+    if gap == 1:
+        return f"{sign}1"
+    if gap <= 3:
+        return f"{sign}2-3"
+    return f"{sign}4+"
+
+def stat_band(value: Any, width: int = DEFAULT_BAND_WIDTH) -> Any:
+    """능력치를 width 단위 구간으로 정규화 (숫자가 아니면 그대로)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value.value if hasattr(value, "value") else value
+    return int(value) // width * width
+
+def base_out_state(game: GameState) -> str:
+    """주자/아웃 상태 (예: "1-3/2" = 1,3루 2아웃)"""
+    bases = "".join(
+        str(i + 1) if runner else "-"
+        for i, runner in enumerate([game.bases.basec1, game.bases.basec2, game.bases.basec3])
+    )
+    return f"{bases}/{game.outs}"
+
+def situation_fingerprint(game: GameState, perspective: Optional[str] = None, band_width: int = DEFAULT_BAND_WIDTH, **fields) -> str:
+    """
+    비슷한 상황의 프롬프트가 같은 키를 갖도록 정규화한 상황 지문.
+    perspective: "home" / "away" 이면 점수 차를 해당 팀 기준으로 계산합니다.
+    fields: 노드별 추가 요소 (능력치는 band_width 단위로 구간화, 문자열/Enum은 그대로)
+    """
+    diff = game.home_score - game.away_score
+    if perspective == "away":
+        diff = -diff
+    parts = [
+        f"inn={inning_bucket(game.inning)}",
+        f"half={'T' if game.half == Half.TOP else 'B'}",
+        f"bo={base_out_state(game)}",
+        f"diff={score_diff_band(diff)}",
+    ]
+    if perspective:
+        parts.append(f"side={perspective}")
+    for name in sorted(fields):
+        parts.append(f"{name}={stat_band(fields[name], band_width)}")
+    return "|".join(parts)
+
+
+# --- Cache ---
+
+class DecisionCache:
+    """
+    상황 지문 -> Structured Decision 캐시.
+    - 메모리: TTL이 있는 LRU (OrderedDict)
+    - 디스크 (선택): 메모리에서 밀려난 항목을 SQLite 파일로 내려보내고, 메모리 미스 시 다시 불러옴
+    - 다양성: 키마다 최대 max_variants개의 결정을 모아두고 그 중 하나를 샘플링.
+      아직 다 모이지 않았으면 explore_rate 확률로 일부러 미스를 내어 새 결정을 수집합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl_seconds: float = 3600.0,
+        max_variants: int = 3,
+        explore_rate: float = 0.2,
+        disk_path: Optional[str] = None,
+        rng: Optional[random.Random] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_variants = max_variants
+        self.explore_rate = explore_rate
+        self.disk_path = disk_path
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        # key -> (created_at, [payload dict, ...])
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self.stats = {"hits": 0, "misses": 0, "explores": 0, "expired": 0, "evictions": 0, "disk_hits": 0}
+
+        if disk_path:
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS decision_cache ("
+                " cache_key TEXT PRIMARY KEY, created_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def _full_key(namespace: str, fingerprint: str) -> str:
+        return f"{namespace}::{fingerprint}"
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - created_at > self.ttl_seconds
+
+    # --- Disk Spill ---
+
+    def _spill(self, key: str, created_at: float, variants: List[Dict[str, Any]]):
+        if not self._db:
+            return
+        self._db.execute(
+            "REPLACE INTO decision_cache (cache_key, created_at, payload) VALUES (?, ?, ?)",
+            (key, created_at, json.dumps(variants, ensure_ascii=False))
+        )
+        self._db.commit()
+
+    def _load_from_disk(self, key: str) -> Optional[Tuple[float, List[Dict[str, Any]]]]:
+        if not self._db:
+            return None
+        row = self._db.execute(
+            "SELECT created_at, payload FROM decision_cache WHERE cache_key = ?", (key,)
+        ).fetchone()
+        if not row:
+            return None
+        if self._expired(row[0]):
+            self._db.execute("DELETE FROM decision_cache WHERE cache_key = ?", (key,))
+            self._db.commit()
+            return None
+        self.stats["disk_hits"] += 1
+        return row[0], json.loads(row[1])
+
+    def _store(self, key: str, entry: Tuple[float, List[Dict[str, Any]]]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            old_key, (old_created, old_variants) = self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+            self._spill(old_key, old_created, old_variants)
+
+    # --- Public API ---
+
+    def get(self, namespace: str, fingerprint: str, model_cls: Type[BaseModel]) -> Optional[BaseModel]:
+        """캐시된 결정 반환 (미스/탐색 시 None)"""
+        key = self._full_key(namespace, fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and self._expired(entry[0]):
+                del self._entries[key]
+                self.stats["expired"] += 1
+                entry = None
+            if entry is None:
+                entry = self._load_from_disk(key)
+                if entry:
+                    self._store(key, entry)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            variants = entry[1]
+            if len(variants) < self.max_variants and self._rng.random() < self.explore_rate:
+                self.stats["explores"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits"] += 1
+            payload = self._rng.choice(variants)
+        return model_cls.model_validate(payload)
+
+    def put(self, namespace: str, fingerprint: str, decision: BaseModel):
+        """결정 저장 (키당 max_variants개까지 누적, 가득 차면 가장 오래된 것을 교체; 디스크로 내려간 키는 디스크 변형에 이어 붙임)"""
+        key = self._full_key(namespace, fingerprint)
+        payload = decision.model_dump(mode="json")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[0]):
+                entry = self._load_from_disk(key) or (time.time(), [])
+            created_at, variants = entry
+            variants = (variants + [payload])[-self.max_variants:]
+            self._store(key, (created_at, variants))
+
+    def persist(self):
+        """메모리의 모든 항목을 디스크로 기록 (종료 시 호출)"""
+        with self._lock:
+            for key, (created_at, variants) in self._entries.items():
+                self._spill(key, created_at, variants)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for name in self.stats:
+                self.stats[name] = 0
+
+    def hit_rate(self) -> float:
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cache_from_env() -> DecisionCache:
+    """환경 변수 기반 프로세스 공용 캐시 생성"""
+    return DecisionCache(
+        max_entries=int(os.environ.get("LLM_CACHE_SIZE", "2048")),
+        ttl_seconds=float(os.environ.get("LLM_CACHE_TTL", "3600")),
+        max_variants=int(os.environ.get("LLM_CACHE_VARIANTS", "3")),
+        explore_rate=float(os.environ.get("LLM_CACHE_EXPLORE", "0.2")),
+        disk_path=os.environ.get("LLM_CACHE_PATH") or None
+    )
@@ -0,0 +1,196 @@
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import LLMPriority
+
+# 숫자가 작을수록 먼저 처리
+PRIORITY_RANK = {LLMPriority.LIVE: 0, LLMPriority.NORMAL: 1, LLMPriority.BACKGROUND: 2}
+
+class _Waiter:
+    """대기열 항목. 동기 호출은 Event, 비동기 호출은 이벤트 루프의 Future로 깨웁니다."""
+
+    def __init__(self, weight: int, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.weight = weight
+        self.loop = loop
+        self.event = None if loop else threading.Event()
+        self.future = loop.create_future() if loop else None
+        self.granted = False
+        self.cancelled = False
+
+    def grant(self):
+        self.granted = True
+        if self.loop:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+        else:
+            self.event.set()
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+class LLMScheduler:
+    """
+    프로세스 공용 LLM 호출 스케줄러 (engine의 _invoke/_ainvoke/_batch/_abatch 앞단).
+    - max_concurrency: 동시에 진행 중인 LLM 요청 상한 (배치는 요청 수만큼 차지)
+    - rate_per_second / burst: 토큰 버킷 (0이면 제한 없음). 슬롯을 받은 순서(= 우선순위 순)로 토큰을 예약합니다.
+    - 우선순위: LIVE(관전 중인 경기) > NORMAL > BACKGROUND(NPC 시뮬레이션), 같은 우선순위는 도착 순
+    스레드(run_engine)와 이벤트 루프(arun_engine) 호출을 한 대기열에서 함께 처리합니다.
+    """
+
+    def __init__(self, max_concurrency: int = 16, rate_per_second: float = 0.0, burst: Optional[float] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self.max_concurrency = max_concurrency
+        self.rate_per_second = rate_per_second
+        self.burst = float(burst if burst is not None else max_concurrency)
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[int, int, _Waiter, LLMPriority]] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._tokens = self.burst
+        self._refilled = time.monotonic()
+        self._metrics = {p: {"requests": 0, "queued": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0} for p in LLMPriority}
+        self._rate_limited = 0
+
+    # --- Slots ---
+
+    def _weight(self, weight: int) -> int:
+        return max(1, min(weight, self.max_concurrency))
+
+    def _try_acquire(self, priority: LLMPriority, waiter: _Waiter) -> bool:
+        """바로 실행 가능하면 True, 아니면 대기열에 넣고 False"""
+        with self._lock:
+            self._metrics[priority]["requests"] += 1
+            if not self._queue and self._in_flight + waiter.weight <= self.max_concurrency:
+                self._in_flight += waiter.weight
+                return True
+            heapq.heappush(self._queue, (PRIORITY_RANK[priority], next(self._seq), waiter, priority))
+            self._metrics[priority]["queued"] += 1
+            return False
+
+    def _release(self, weight: int):
+        with self._lock:
+            self._in_flight -= weight
+            self._grant_waiting()
+
+    def _grant_waiting(self):
+        # 맨 앞 대기자가 들어갈 자리가 생길 때까지 뒤 순위는 기다립니다 (큰 배치의 기아 방지)
+        while self._queue:
+            _, _, waiter, priority = self._queue[0]
+            if waiter.cancelled:
+                heapq.heappop(self._queue)
+                self._metrics[priority]["queued"] -= 1
+                continue
+            if self._in_flight + waiter.weight > self.max_concurrency:
+                return
+            heapq.heappop(self._queue)
+            self._metrics[priority]["queued"] -= 1
+            self._in_flight += waiter.weight
+            waiter.grant()
+
+    def _cancel(self, waiter: _Waiter):
+        with self._lock:
+            if waiter.granted:
+                self._in_flight -= waiter.weight
+                self._grant_waiting()
+            else:
+                waiter.cancelled = True
+
+    # --- Token Bucket ---
+
+    def _reserve_tokens(self, count: int) -> float:
+        """토큰 count개를 예약하고 기다려야 할 시간(초)을 반환 (잔량이 음수면 빚으로 기록)"""
+        if self.rate_per_second <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate_per_second)
+            self._refilled = now
+            self._tokens -= count
+            if self._tokens >= 0:
+                return 0.0
+            self._rate_limited += 1
+            return -self._tokens / self.rate_per_second
+
+    def _record_wait(self, priority: LLMPriority, waited: float):
+        with self._lock:
+            stats = self._metrics[priority]
+            stats["wait_seconds"] += waited
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+
+    @contextmanager
+    def slot(self, priority: LLMPriority = LLMPriority.NORMAL, weight: int = 1):
+        """동기 호출용 (run_engine 스레드)"""
+        waiter = _Waiter(self._weight(weight))
+        start = time.perf_counter()
+        if not self._try_acquire(priority, waiter):
+            waiter.event.wait()
+        try:
+            delay = self._reserve_tokens(waiter.weight)
+            if delay:
+                time.sleep(delay)
+            self._record_wait(priority, time.perf_counter() - start)
+            yield
+        finally:
+            self._release(waiter.weight)
+
+    @asynccontextmanager
+    async def aslot(self, priority: LLMPriority = LLMPriority.NORMAL, weight: int = 1):
+        """비동기 호출용 (arun_engine 이벤트 루프)"""
+        waiter = _Waiter(self._weight(weight), loop=asyncio.get_running_loop())
+        start = time.perf_counter()
+        if not self._try_acquire(priority, waiter):
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                self._cancel(waiter)
+                raise
+        try:
+            delay = self._reserve_tokens(waiter.weight)
+            if delay:
+                await asyncio.sleep(delay)
+            self._record_wait(priority, time.perf_counter() - start)
+            yield
+        finally:
+            self._release(waiter.weight)
+
+    # --- Metrics ---
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 깊이 / 대기 시간 (우선순위별)"""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "rate_per_second": self.rate_per_second,
+                "in_flight": self._in_flight,
+                "queue_depth": sum(m["queued"] for m in self._metrics.values()),
+                "rate_limited": self._rate_limited,
+                "priorities": {
+                    p.value: {
+                        "requests": m["requests"],
+                        "queued": m["queued"],
+                        "avg_wait_seconds": round(m["wait_seconds"] / m["requests"], 4) if m["requests"] else 0.0,
+                        "max_wait_seconds": round(m["max_wait_seconds"], 4),
+                    }
+                    for p, m in self._metrics.items()
+                },
+            }
+
+def scheduler_from_env() -> LLMScheduler:
+    """
+    LLM_MAX_CONCURRENCY: 동시 요청 상한 (기본 16)
+    LLM_RATE_LIMIT_RPS: 초당 요청 수 (기본 0 = 제한 없음), LLM_RATE_LIMIT_BURST: 버킷 크기 (기본 동시 요청 상한)
+    """
+    max_concurrency = int(os.environ.get("LLM_MAX_CONCURRENCY", "16"))
+    burst = os.environ.get("LLM_RATE_LIMIT_BURST")
+    return LLMScheduler(
+        max_concurrency=max_concurrency,
+        rate_per_second=float(os.environ.get("LLM_RATE_LIMIT_RPS", "0")),
+        burst=float(burst) if burst else None
+    )
@@ -0,0 +1,73 @@
+from typing import Tuple
+
+from .models import GameState, Half, ManagerDecision, Team, TeamStrategy
+from .rule_engine import base_mask
+
+# 투수 교체 기준 (MANAGER_PROMPT의 "체력 30 이하" 기준과 동일)
+STAMINA_CHANGE_THRESHOLD = 30
+# update_state_node는 타석마다 pitch_count를 1 올리므로 사실상 상대한 타자 수 (타순 3바퀴)
+PITCH_COUNT_LIMIT = 27
+
+def _has_reliever(team: Team) -> bool:
+    return team.current_pitcher_index + 1 < len(team.get_pitchers())
+
+def pitcher_tired(stamina: int, pitch_count: int) -> bool:
+    return stamina <= STAMINA_CHANGE_THRESHOLD or pitch_count >= PITCH_COUNT_LIMIT
+
+def should_change_pitcher(team: Team) -> bool:
+    """체력 / 투구 수 기준 교체 (남은 투수가 있을 때만)"""
+    pitcher = team.get_pitcher()
+    if not pitcher or not _has_reliever(team):
+        return False
+    return pitcher_tired(pitcher.current_stamina, pitcher.pitch_count)
+
+def situational_offense(outs: int, bases: int, inning: int, score_diff: int) -> TeamStrategy:
+    """
+    번트: 무사 1루/2루/1,2루 + 7회 이후 + 1점 차 이내 (한 점을 짜내야 할 때)
+    장타 노림: 7회 이후 4점 이상 뒤질 때
+    (bases: rule_engine.base_mask와 같은 3비트 주자 마스크, score_diff: 공격 팀 기준)
+    """
+    if outs == 0 and bases & 3 and not bases & 4 and inning >= 7 and abs(score_diff) <= 1:
+        return TeamStrategy.BUNT
+    if inning >= 7 and score_diff <= -4:
+        return TeamStrategy.LONG_BALL
+    return TeamStrategy.NORMAL
+
+def offense_strategy(game: GameState, score_diff: int) -> TeamStrategy:
+    return situational_offense(game.outs, base_mask(game.bases), game.inning, score_diff)
+
+def defense_strategy(game: GameState, score_diff: int) -> TeamStrategy:
+    """전진 수비: 3루 주자 + 2아웃 미만 + 6회 이후 + 1점 차 이내 (홈 실점을 막아야 할 때)"""
+    if game.bases.basec3 and game.outs < 2 and game.inning >= 6 and abs(score_diff) <= 1:
+        return TeamStrategy.INFIELD_IN
+    return TeamStrategy.NORMAL
+
+def rule_manager_decision(game: GameState, team: Team, score_diff: int, defending: bool) -> ManagerDecision:
+    """한 팀 감독의 규칙 기반 결정 (score_diff: 해당 팀 기준)"""
+    reasons = []
+    change = defending and should_change_pitcher(team)
+    if change:
+        p = team.get_pitcher()
+        reasons.append(f"투수 교체 (체력 {p.current_stamina}, 투구수 {p.pitch_count})")
+
+    offense = TeamStrategy.NORMAL if defending else offense_strategy(game, score_diff)
+    defense = defense_strategy(game, score_diff) if defending else TeamStrategy.NORMAL
+    for strategy in (offense, defense):
+        if strategy != TeamStrategy.NORMAL:
+            reasons.append(strategy.value)
+
+    return ManagerDecision(
+        offense_strategy=offense,
+        defense_strategy=defense,
+        change_pitcher=change,
+        description="[Rule] " + (", ".join(reasons) if reasons else "정상 플레이")
+    )
+
+def rule_manager_decisions(game: GameState) -> Tuple[ManagerDecision, ManagerDecision]:
+    """(home, away) 규칙 기반 감독 결정"""
+    home_defending = game.half == Half.TOP
+    diff = game.home_score - game.away_score
+    return (
+        rule_manager_decision(game, game.home_team, diff, defending=home_defending),
+        rule_manager_decision(game, game.away_team, -diff, defending=not home_defending),
+    )
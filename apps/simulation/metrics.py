@@ -0,0 +1,197 @@
+"""
+Prometheus 텍스트 형식 메트릭 (외부 의존성 없는 최소 구현).
+엔진 노드 지연/오류, 검증 재시도, 경기별 타석 처리 속도, API의 타석 저장 시간을 기록하고
+`render()`가 /metrics 응답 본문을 만듭니다.
+"""
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+RATE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 50.0, 100.0, 1000.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+# 수집 시점에 값을 만드는 메트릭: (이름, 타입, 설명, [(라벨, 값)])
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+def _key(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+    return "{" + body + "}" if body else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    TYPE = ""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.TYPE}"]
+
+class Counter(_Metric):
+    TYPE = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        super().__init__(name, help_text)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = _key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_key(labels), 0.0)
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            return [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in sorted(self._values.items())]
+
+class Gauge(Counter):
+    TYPE = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[_key(labels)] = value
+
+    def remove(self, **labels):
+        with self._lock:
+            self._values.pop(_key(labels), None)
+
+class Histogram(_Metric):
+    TYPE = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._series: Dict[Labels, List[float]] = {} # 버킷별 개수 + [sum]
+
+    def observe(self, value: float, **labels):
+        key = _key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 1)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-1] += value
+
+    def count(self, **labels) -> int:
+        series = self._series.get(_key(labels))
+        return int(series[-2]) if series else 0
+
+    def lines(self) -> List[str]:
+        out = []
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    out.append(f"{self.name}_bucket{_format_labels(key + (('le', _format_value(bound)),))} {_format_value(count)}")
+                out.append(f"{self.name}_sum{_format_labels(key)} {_format_value(series[-1])}")
+                out.append(f"{self.name}_count{_format_labels(key)} {_format_value(series[-2])}")
+        return out
+
+# --- Engine Metrics ---
+
+NODE_LATENCY = Histogram("sim_node_latency_seconds", "Graph node latency (director, manager, pitcher, batter, resolver, validator, update_state, check_inning, ...)")
+NODE_ERRORS = Counter("sim_node_errors_total", "Graph node invocations that raised")
+VALIDATOR_RETRIES = Counter("sim_validator_retries_total", "Resolver retries requested by the validator")
+VALIDATOR_FAILURES = Counter("sim_validator_max_retries_total", "Plate appearances accepted after exhausting validator retries")
+PLATE_APPEARANCES = Counter("sim_plate_appearances_total", "Simulated plate appearances")
+MATCHES = Counter("sim_matches_total", "Finished matches")
+MATCH_PA_RATE = Histogram("sim_match_plate_appearances_per_second", "Plate appearances per second per finished match", RATE_BUCKETS)
+LIVE_PA_RATE = Gauge("sim_live_match_plate_appearances_per_second", "Plate appearances per second of matches in progress")
+STEP_CALLBACK = Histogram("sim_step_callback_seconds", "on_step_callback duration (API: broadcast log + DB commit)")
+STEP_DB_COMMIT = Histogram("sim_step_db_commit_seconds", "simulation_runner on_step DB commit duration")
+
+METRICS: List[_Metric] = [
+    NODE_LATENCY, NODE_ERRORS, VALIDATOR_RETRIES, VALIDATOR_FAILURES, PLATE_APPEARANCES, MATCHES,
+    MATCH_PA_RATE, LIVE_PA_RATE, STEP_CALLBACK, STEP_DB_COMMIT,
+]
+
+_collectors: List[Callable[[], List[Family]]] = []
+
+def register_collector(collector: Callable[[], List[Family]]):
+    """수집 시점에 값을 읽는 메트릭 (토큰 집계, 스케줄러 대기열 등)"""
+    _collectors.append(collector)
+
+def timed_node(name: str, fn: Callable) -> Callable:
+    """노드 함수(동기/비동기)를 감싸 지연 시간과 오류를 기록"""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def awrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            except Exception:
+                NODE_ERRORS.inc(node=name)
+                raise
+            finally:
+                NODE_LATENCY.observe(time.perf_counter() - start, node=name)
+        return awrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            NODE_ERRORS.inc(node=name)
+            raise
+        finally:
+            NODE_LATENCY.observe(time.perf_counter() - start, node=name)
+    return wrapper
+
+class MatchRate:
+    """경기별 타석 처리 속도 (진행 중 gauge, 종료 시 histogram)"""
+
+    def __init__(self, match_id: str):
+        self.match_id = str(match_id)
+        self.start = time.perf_counter()
+        self.count = 0
+
+    def step(self):
+        self.count += 1
+        PLATE_APPEARANCES.inc()
+        LIVE_PA_RATE.set(self.count / max(time.perf_counter() - self.start, 1e-9), match_id=self.match_id)
+
+    def finish(self) -> float:
+        rate = self.count / max(time.perf_counter() - self.start, 1e-9)
+        self.close()
+        MATCH_PA_RATE.observe(rate)
+        MATCHES.inc()
+        return rate
+
+    def close(self):
+        """진행 중 gauge 제거 (경기가 예외로 끝나도 호출)"""
+        LIVE_PA_RATE.remove(match_id=self.match_id)
+
+def render() -> str:
+    """Prometheus text exposition format (version 0.0.4)"""
+    lines: List[str] = []
+    for metric in METRICS:
+        lines.extend(metric.header())
+        lines.extend(metric.lines())
+    for collector in _collectors:
+        for name, kind, help_text, samples in collector():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(sorted(labels.items()))} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
@@ -1,6 +1,6 @@
 from enum import Enum
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 
 class Role(str, Enum):
@@ -57,6 +57,49 @@ class TeamStrategy(str, Enum):
     INFIELD_IN = "INFIELD_IN"   # 전진 수비
     LONG_BALL = "LONG_BALL"     # 장타 노림 (큰거 한방)
 
+class EngineMode(str, Enum):
+    MULTI_AGENT = "MULTI_AGENT" # 에이전트별 개별 호출 (Director -> Manager -> Pitcher -> Batter)
+    SINGLE_CALL = "SINGLE_CALL" # 타석 에이전트 1회 호출로 모든 의사결정
+    STATISTICAL = "STATISTICAL" # LLM 없이 통계 판정기만 사용 (NPC 경기, 관전자 없음)
+
+class ResolverBackend(str, Enum):
+    LLM = "LLM"   # LLM 심판/물리 엔진
+    STAT = "STAT" # 능력치 기반 odds-ratio 판정기 (stat_resolver)
+
+class DirectorSchedule(str, Enum):
+    EVERY_PA = "EVERY_PA"         # 매 타석 (기존 동작)
+    GAME_START = "GAME_START"     # 경기 시작 시 1회
+    HALF_INNING = "HALF_INNING"   # 경기 시작 + 매 이닝 초/말 교대 시
+    EVERY_N_PA = "EVERY_N_PA"     # N 타석마다
+
+class ValidatorMode(str, Enum):
+    LLM = "LLM"         # 매 타석 LLM 검증관 호출 (기존 동작)
+    HYBRID = "HYBRID"   # 규칙 기반 검증 우선, 애매할 때만 LLM 호출
+    LOCAL = "LOCAL"     # 규칙 기반 검증만 (애매하면 통과)
+
+class ManagerPolicy(str, Enum):
+    LLM = "LLM"         # 매 타석 LLM 감독 (기존 동작)
+    HYBRID = "HYBRID"   # 규칙 기반 감독, 레버리지 지수가 기준 이상일 때만 LLM 감독
+    RULE = "RULE"       # 규칙 기반 감독만
+
+class NarrationMode(str, Enum):
+    INLINE = "INLINE"   # 판정 LLM이 결과와 중계 멘트를 함께 작성 (기존 동작)
+    BATCHED = "BATCHED" # 결과(코드 + 짧은 요약)만 먼저 판정, 중계 멘트는 하프이닝 단위로 모아 백그라운드 생성
+
+class CheckpointSchedule(str, Enum):
+    HALF_INNING = "HALF_INNING" # 매 이닝 초/말 교대 시
+    EVERY_N_PA = "EVERY_N_PA"   # N 타석마다
+
+class LLMPriority(str, Enum):
+    LIVE = "LIVE"             # 관전 중인 경기 (가장 먼저 처리)
+    NORMAL = "NORMAL"
+    BACKGROUND = "BACKGROUND" # NPC/배치 시뮬레이션
+
+class GameEventType(str, Enum):
+    PLAY = "PLAY"                 # 타석 결과 (정규 결과 코드)
+    SUBSTITUTION = "SUBSTITUTION" # 투수 교체
+    DIRECTOR = "DIRECTOR"         # 경기 환경(날씨/심판 존 등) 변경
+
 # --- Decision Models (Thinking Agents) ---
 
 class DirectorContext(BaseModel):
@@ -86,6 +129,32 @@ class BatterDecision(BaseModel):
     style: BattingStyle
     description: str = Field(..., description="타격 전략 이유 (LLM 생각)")
 
+class PlateAppearancePlan(BaseModel):
+    """타석 에이전트(Single-Call)의 통합 의사결정"""
+    director: DirectorContext = Field(..., description="경기 환경 (날씨, 바람, 심판 존)")
+    home_manager: ManagerDecision = Field(..., description="홈 팀 감독의 작전")
+    away_manager: ManagerDecision = Field(..., description="원정 팀 감독의 작전")
+    pitcher: PitcherDecision = Field(..., description="투수의 투구 의도")
+    batter: BatterDecision = Field(..., description="타자의 타격 의도")
+
+class EngineConfig(BaseModel):
+    """경기별 엔진 실행 설정"""
+    mode: EngineMode = EngineMode.MULTI_AGENT
+    director_schedule: DirectorSchedule = DirectorSchedule.HALF_INNING # Director 호출 시점 (그 외에는 캐시된 DirectorContext 재사용)
+    director_every_n: int = Field(9, ge=1, description="EVERY_N_PA 스케줄의 타석 간격")
+    use_decision_cache: bool = False # 감독/투수/타자 결정을 상황 지문 캐시에서 재사용
+    validator_mode: ValidatorMode = ValidatorMode.HYBRID # 결과 검증 방식
+    resolver: ResolverBackend = ResolverBackend.LLM # 타석 판정기 (STATISTICAL 모드는 항상 STAT)
+    seed: Optional[int] = None # 통계 판정기 난수 시드 (재현용)
+    narration: NarrationMode = NarrationMode.INLINE # 중계 멘트 생성 방식
+    manager_policy: ManagerPolicy = ManagerPolicy.HYBRID # 감독 결정 방식
+    compact_prompts: bool = True # 판정/감독 프롬프트 압축 (짧은 지시문 + 압축 능력치 + 하프이닝 문맥 캐시)
+    manager_leverage_threshold: float = Field(2.0, ge=0, description="HYBRID에서 LLM 감독을 부르는 레버리지 지수 기준")
+    priority: LLMPriority = LLMPriority.NORMAL # LLM 스케줄러 우선순위
+    speculative_candidates: int = Field(1, ge=1, le=5, description="판정 후보 수 (2 이상이면 후보를 한 번에 받아 동시에 검증하고 첫 통과 후보 선택)")
+    checkpoint: CheckpointSchedule = CheckpointSchedule.HALF_INNING # on_checkpoint 호출 시점
+    checkpoint_every_n: int = Field(9, ge=1, description="EVERY_N_PA 체크포인트의 타석 간격")
+
 
 # --- Base Models (Mapped to DB Schema) ---
 
@@ -181,9 +250,34 @@ class Team(BaseModel):
     roster: List[PlayerState] = []
     current_pitcher_index: int = 0 # 현재 등판 중인 투수의 인덱스 (roster 내의 PITCHER 필터링 기준 아님, 전체 로스터 기준이 편함)
     # 하지만 roster엔 타자도 섞여있음. PITCHER 역할인 선수들만 모아놓은 인덱스 관리가 필요.
-    
-    def get_pitchers(self) -> List[PlayerState]:
-        return [p for p in self.roster if p.character.role == Role.PITCHER]
+
+    # 타순 / 투수진 인덱스 (타석마다 roster를 다시 거르지 않도록 캐시, 직렬화 제외): (roster, len(roster), 타순, 투수진)
+    # roster를 다른 리스트로 바꾸거나 길이가 바뀌면 자동 갱신. 원소를 제자리 교체했다면 invalidate_indexes() 호출.
+    _roster_index: Optional[Tuple[List[PlayerState], int, Tuple[PlayerState, ...], Tuple[PlayerState, ...]]] = PrivateAttr(default=None)
+
+    def _indexes(self) -> Tuple[List[PlayerState], int, Tuple[PlayerState, ...], Tuple[PlayerState, ...]]:
+        # private 속성은 __getattr__ 경유라 느림 -> __pydantic_private__에서 직접 읽음
+        cached = self.__pydantic_private__["_roster_index"]
+        roster = self.roster
+        if cached is None or cached[0] is not roster or cached[1] != len(roster):
+            cached = (
+                roster,
+                len(roster),
+                tuple(p for p in roster if p.character.role == Role.BATTER),
+                tuple(p for p in roster if p.character.role == Role.PITCHER),
+            )
+            self._roster_index = cached
+        return cached
+
+    def invalidate_indexes(self):
+        self._roster_index = None
+
+    def get_lineup(self) -> Tuple[PlayerState, ...]:
+        """타순 (roster 순서의 타자들)"""
+        return self._indexes()[2]
+
+    def get_pitchers(self) -> Tuple[PlayerState, ...]:
+        return self._indexes()[3]
 
     def get_pitcher(self) -> PlayerState:
         """현재 마운드에 있는 투수 반환"""
@@ -205,7 +299,7 @@ class Team(BaseModel):
 
     def get_batter(self, order: int) -> PlayerState:
         # 타순에 따른 타자 반환 (투수 제외한 선수들로 구성 가정)
-        batters = [p for p in self.roster if p.character.role == Role.BATTER]
+        batters = self.get_lineup()
         if not batters:
             return None
         return batters[(order - 1) % len(batters)]
@@ -246,6 +340,10 @@ class GameState(BaseModel):
     # Multi-Agent Context
     director: DirectorContext = Field(default_factory=DirectorContext)
 
+    # 승리 확률 / 레버리지 (expectancy 테이블 조회, 직전 타석 기준)
+    win_probability: Optional[float] = None # 직전 타석 이후 홈 팀 승리 확률
+    leverage_index: Optional[float] = None  # 직전 타석 직전 상황의 레버리지 지수 (평균 1.0)
+
     def get_current_pitcher(self) -> PlayerState:
         if self.half == Half.TOP:
             return self.home_team.get_pitcher() # 초 공격은 원정팀, 수비(투수)는 홈팀
@@ -306,6 +404,15 @@ class SimulationResult(BaseModel):
     pitch_desc: str = "" # 어떤 공을 던졌는지
     hit_desc: str = ""   # 어떻게 쳤는지
 
+class PlateOutcome(BaseModel):
+    """결과 우선 판정 (중계 멘트 없이 최소 토큰으로 결과만)"""
+    result_code: str = Field(..., description="1B, 2B, 3B, HR, BB, SO, GO, FO 중 하나")
+    summary: str = Field(..., description="10자 이내 결과 요약 (예: 중전 안타, 헛스윙 삼진)")
+
+class NarrationBatch(BaseModel):
+    """하프이닝 단위로 한 번에 생성한 중계 멘트"""
+    lines: List[str] = Field(..., description="타석별 중계 멘트 (입력 타석과 같은 순서/개수)")
+
 class ValidatorResult(BaseModel):
     """검증 에이전트(Rule Expert)의 판정 결과"""
     is_valid: bool = Field(..., description="야구 규칙 및 논리적 정합성 준수 여부")
@@ -326,3 +433,45 @@ class BroadcastData(BaseModel):
     runners: List[Optional[Dict[str, Any]]] # [1루주자, 2루주자, 3루주자] 정보 (없으면 None)
     result: SimulationResult
     next_batter: Dict[str, Any] # [Feature] 다음 타자 정보 포함
+    win_probability: Optional[float] = None # 홈 팀 승리 확률 (타석 결과 반영 후)
+    leverage_index: Optional[float] = None  # 타석 직전 상황의 레버리지 지수
+    leverage_label: Optional[str] = None    # LOW / MEDIUM / HIGH (HIGH = 승부처)
+
+class MatchCheckpoint(BaseModel):
+    """경기 중간 저장 (run_engine의 on_checkpoint로 전달, resume_from으로 이어서 진행)"""
+    version: int = 1
+    pa_count: int # 체크포인트까지 진행한 타석 수
+    game: GameState
+    director_ctx: DirectorContext
+    home_manager_decision: ManagerDecision
+    away_manager_decision: ManagerDecision
+    director_last_pa: Optional[int] = None
+    rng_state: Optional[List[Any]] = None # 통계 판정기 난수 상태 (seed 재현용)
+
+class GameEvent(BaseModel):
+    """경기 이벤트 로그 한 줄 (event_log.replay가 순서대로 적용)"""
+    seq: int # 로그 내 순번 (0부터)
+    pa: int  # 이벤트가 속한 타석 번호 (0부터, 체크포인트 pa_count 기준으로 잘라낼 때 사용)
+    type: GameEventType
+    code: Optional[str] = None # PLAY: 정규 결과 코드 (rule_engine.PLAYS)
+    stamina_cost: Optional[int] = None # PLAY: 투수 체력 소모 (None = 투구수 미반영)
+    team_id: Optional[str] = None # SUBSTITUTION: 투수를 바꾼 팀
+    director: Optional[DirectorContext] = None # DIRECTOR: 새 경기 환경
+
+class GameSnapshot(BaseModel):
+    """
+    이벤트 seq개를 적용한 직후의 경기 상태 (하프이닝 교대마다 저장).
+    game은 로스터/주자/logs를 뺀 GameState이고, 선수 상태와 주자는 GameEventLog.start 로스터 순서 기준으로 저장합니다.
+    """
+    seq: int
+    pa_count: int
+    game: GameState
+    players: List[List[Any]] # 홈 -> 원정 로스터 순서의 [pitch_count, current_stamina, condition]
+    runners: List[Optional[int]] # 1~3루 주자의 공격 팀 로스터 위치 (없으면 None)
+
+class GameEventLog(BaseModel):
+    """이벤트 소싱 경기 기록: 순서 있는 이벤트 + 주기적 스냅샷"""
+    version: int = 1
+    start: Optional[GameState] = None # 기록 시작 시점 GameState (로스터 포함, logs 제외)
+    events: List[GameEvent] = []
+    snapshots: List[GameSnapshot] = []
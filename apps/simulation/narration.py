@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Optional, Tuple
+
+from .models import BroadcastData, GameState, SimulationResult
+from .rule_validator import validate_locally
+
+# 중계 멘트 생성 전용 워커 (경기 진행 스레드 / 이벤트 루프를 막지 않음)
+NARRATION_WORKERS = int(os.environ.get("NARRATION_WORKERS", "4"))
+_executor = ThreadPoolExecutor(max_workers=NARRATION_WORKERS, thread_name_prefix="narration")
+
+class NarrationPlay:
+    """멘트를 기다리는 타석 1개 (BroadcastData + 로그 위치)"""
+
+    def __init__(self, seq: int, broadcast: BroadcastData, log_index: int, log_entry: str, runs_scored: int):
+        self.seq = seq
+        self.broadcast = broadcast
+        self.log_index = log_index
+        self.log_entry = log_entry
+        self.runs_scored = runs_scored
+
+    @property
+    def summary(self) -> str:
+        return self.broadcast.result.description
+
+    def describe(self) -> str:
+        """프롬프트용 한 줄 요약"""
+        b = self.broadcast
+        half = "초" if b.half == "TOP" else "말"
+        return (
+            f"[{b.inning}회{half}] 타자 {b.current_batter['name']} vs 투수 {b.current_pitcher['name']}: "
+            f"{b.result.result_code} ({self.summary}) -> {b.outs}아웃, 득점 {self.runs_scored}"
+        )
+
+class HalfInningNarrator:
+    """
+    결과와 중계 멘트를 분리하는 배치 내레이터.
+    - 엔진은 결과(코드 + 짧은 요약)만으로 즉시 다음 타석으로 진행하고, 타석을 add()로 쌓아 둡니다.
+    - flush() (하프이닝 종료 시) 때 쌓인 타석 전체를 LLM 1회 호출로 중계하도록 워커에 넘깁니다.
+    - drain()은 완성된 멘트를 BroadcastData / game.logs / broadcast_data.jsonl에 반영합니다 (엔진 스레드에서 호출).
+    """
+
+    def __init__(self, game: GameState, chain, broadcast_path: Optional[str] = "broadcast_data.jsonl"):
+        self.game = game
+        self.chain = chain
+        self.broadcast_path = broadcast_path
+        self._pending: List[NarrationPlay] = []
+        self._ready: List[Tuple[NarrationPlay, str]] = []
+        self._futures: List[Future] = []
+        self._lock = threading.Lock()
+
+    def add(self, play: NarrationPlay):
+        self._pending.append(play)
+
+    def flush(self):
+        """쌓인 타석을 백그라운드 중계 작업으로 제출"""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self._futures.append(_executor.submit(self._narrate, batch))
+
+    def close(self):
+        """남은 타석까지 제출하고 모든 중계 작업이 끝날 때까지 대기"""
+        self.flush()
+        wait(self._futures)
+        self._futures = []
+
+    def drain(self) -> List[Tuple[int, str]]:
+        """완성된 멘트 반영 -> [(seq, description), ...]"""
+        with self._lock:
+            ready, self._ready = self._ready, []
+        delivered = []
+        for play, text in sorted(ready, key=lambda item: item[0].seq):
+            old = play.summary
+            play.broadcast.result.description = text
+            if play.log_index < len(self.game.logs):
+                self.game.logs[play.log_index] = play.log_entry.replace(old, text, 1)
+            if self.broadcast_path:
+                with open(self.broadcast_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(play.broadcast.model_dump(), ensure_ascii=False) + "\n")
+            delivered.append((play.seq, text))
+        return delivered
+
+    def _narrate(self, batch: List[NarrationPlay]):
+        plays = "\n".join(f"{i + 1}. {play.describe()}" for i, play in enumerate(batch))
+        try:
+            lines = self.chain.invoke({"count": len(batch), "plays": plays}).lines
+        except Exception as e:
+            print(f"Error in narration: {e}")
+            lines = []
+
+        results = []
+        for i, play in enumerate(batch):
+            text = lines[i].strip() if i < len(lines) else ""
+            if text and not _consistent(play.broadcast.result, text):
+                text = ""
+            results.append((play, text or play.summary))
+        with self._lock:
+            self._ready.extend(results)
+
+def _consistent(result: SimulationResult, text: str) -> bool:
+    """멘트가 결과 코드와 모순되면 False (요약으로 대체)"""
+    check = validate_locally(result.model_copy(update={"description": text}))
+    return check is None or check.is_valid
@@ -0,0 +1,53 @@
+from typing import Any, Callable, Dict, List
+
+from .models import Character, Role, Team
+
+# 수비 요약에 이름을 올릴 약한 야수 수
+WEAK_FIELDERS = 2
+
+def _num(value: Any) -> str:
+    """능력치 표기 (XP 반영 소수점은 한 자리)"""
+    if isinstance(value, float) and not value.is_integer():
+        return f"{value:.1f}"
+    return str(int(value)) if isinstance(value, (int, float)) else str(value)
+
+def compact_batter_stats(character: Character) -> str:
+    """batter_stats dict(수비 포함 중첩) 대신 짧은 한 줄 (예: 컨택72 파워65 스피드50 선구안50 클러치50)"""
+    return (
+        f"컨택{_num(character.contact)} 파워{_num(character.power)} 스피드{_num(character.speed)} "
+        f"선구안{_num(character.eye)} 클러치{_num(character.clutch)}"
+    )
+
+def _fielders(team: Team) -> List[Character]:
+    return [p.character for p in team.roster if p.character.role == Role.BATTER]
+
+def defense_lineup(team: Team) -> str:
+    """기존 RESOLVER_PROMPT용 야수별 수비 능력 (한 줄에 한 명)"""
+    return "\n".join(
+        f"- {c.position_main} {c.name}: 범위 {c.defense_range}, 실책 {c.defense_error}, 어깨 {c.defense_arm}"
+        for c in _fielders(team)
+    )
+
+def defense_summary(team: Team) -> str:
+    """수비 평균 + 수비 범위가 가장 좁은 야수 (예: 평균 범위55 실책48 어깨60 | 약점 LF 김OO 범위32)"""
+    fielders = _fielders(team)
+    if not fielders:
+        return "평균"
+    n = len(fielders)
+    summary = (
+        f"평균 범위{sum(c.defense_range for c in fielders) // n} "
+        f"실책{sum(c.defense_error for c in fielders) // n} "
+        f"어깨{sum(c.defense_arm for c in fielders) // n}"
+    )
+    weak = sorted(fielders, key=lambda c: c.defense_range)[:WEAK_FIELDERS]
+    return summary + " | 약점 " + ", ".join(f"{c.position_main} {c.name} 범위{c.defense_range}" for c in weak)
+
+def half_inning_context(cache: Dict[str, str], key: str, build: Callable[[], str]) -> str:
+    """
+    하프이닝 동안 바뀌지 않는 문맥 문자열 캐시 (수비 라인업 등).
+    cache는 check_inning_node가 초/말 교대 시 비웁니다.
+    """
+    text = cache.get(key)
+    if text is None:
+        text = cache[key] = build()
+    return text
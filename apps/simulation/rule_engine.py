@@ -1,136 +1,172 @@
-from typing import List, Optional, Tuple
-from .models import GameState, SimulationResult, PlayerState, Role
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from .models import GameState, SimulationResult, BaseState, Half, PlayerState, SimulationStatus
+from .rule_validator import normalize_code
+
+# 주자 상태는 3비트 마스크 (bit0 = 1루, bit1 = 2루, bit2 = 3루)
+N_BASE_STATES = 8
+N_OUT_STATES = 3 # 타석 시작 시 아웃 수 (0-2)
+
+# 정규화된 타석 결과 코드 (전이 표의 행). NP = 진루/아웃 없음 (알 수 없는 코드)
+PLAYS: List[str] = ["1B", "2B", "3B", "HR", "BB", "IBB", "HBP", "SO", "GO", "FO", "LO", "OUT", "E", "NP"]
+PLAY_INDEX: Dict[str, int] = {code: i for i, code in enumerate(PLAYS)}
+
+# 정규 코드 -> 처리 규칙
+HIT_BASES: Dict[str, int] = {"1B": 1, "2B": 2, "3B": 3, "HR": 4, "E": 1} # 실책 출루: 타자 1루, 주자 1베이스씩 진루
+FORCED = ("BB", "IBB", "HBP") # 밀어내기 진루 (찬 베이스만)
+OUTS = ("SO", "GO", "FO", "LO", "OUT")
+
+class Transition(NamedTuple):
+    """(결과, 아웃, 주자 상태) 한 칸: 다음 주자 마스크 / 득점 / 추가 아웃 / 1~3루에 서는 선수의 출처"""
+    bases: int
+    runs: int
+    outs: int
+    # (1루, 2루, 3루) 각각 (타자, 1루, 2루, 3루) 중 어디서 왔는지의 인덱스 (0 = 타자), 비면 None
+    sources: Tuple[Optional[int], Optional[int], Optional[int]]
+    moves: bool # 주자가 바뀌는지 (False면 베이스를 건드리지 않아도 됨)
+
+def _legacy_play(code: str) -> str:
+    """코드 표에 없는 코드는 예전 부분 문자열 판별 순서대로 분류 (예: GO_DP -> GO)"""
+    if "1B" in code or code == "HIT":
+        return "1B"
+    if "2B" in code:
+        return "2B"
+    if "3B" in code:
+        return "3B"
+    if "HR" in code or "HOMERUN" in code:
+        return "HR"
+    if "BB" in code or "WALK" in code:
+        return "BB"
+    if "OUT" in code or "STRIKEOUT" in code or "SO" in code or "GO" in code or "FO" in code:
+        return "OUT"
+    return "NP"
+
+_PLAY_CACHE: Dict[str, int] = {}
+
+def play_index(code: str) -> int:
+    """결과 코드 -> 전이 표의 행 번호 (코드별 캐시)"""
+    index = _PLAY_CACHE.get(code)
+    if index is None:
+        normalized = normalize_code(code)
+        play = normalized[0] if normalized else _legacy_play(code.strip().upper())
+        index = _PLAY_CACHE[code] = PLAY_INDEX[play]
+    return index
+
+def base_mask(bases: BaseState) -> int:
+    return (1 if bases.basec1 else 0) | (2 if bases.basec2 else 0) | (4 if bases.basec3 else 0)
+
+def _transition(play: str, outs: int, mask: int) -> Transition:
+    # slots[b] = b루에 있는 선수의 출처 (0 = 타자, 1~3 = 원래 베이스), 0번 칸은 홈
+    slots: List[Optional[int]] = [None, 1 if mask & 1 else None, 2 if mask & 2 else None, 3 if mask & 4 else None]
+    runs = added_outs = 0
+    if play in HIT_BASES:
+        advance = HIT_BASES[play]
+        moved: List[Optional[int]] = [None] * 4
+        for base in (3, 2, 1, 0):
+            source = 0 if base == 0 else slots[base]
+            if source is None:
+                continue
+            target = base + advance
+            if target >= 4:
+                runs += 1
+            else:
+                moved[target] = source
+        slots = moved
+    elif play in FORCED:
+        # 1루부터 빈 베이스를 찾을 때까지 한 칸씩 밀어냄
+        carry: Optional[int] = 0
+        for base in (1, 2, 3):
+            carry, slots[base] = slots[base], carry
+            if carry is None:
+                break
+        if carry is not None:
+            runs += 1
+    elif play in OUTS:
+        added_outs = 1
+    sources = (slots[1], slots[2], slots[3])
+    next_mask = (1 if slots[1] is not None else 0) | (2 if slots[2] is not None else 0) | (4 if slots[3] is not None else 0)
+    unchanged = (1 if mask & 1 else None, 2 if mask & 2 else None, 3 if mask & 4 else None)
+    return Transition(next_mask, runs, added_outs, sources, sources != unchanged)
+
+def build_transitions() -> Tuple[Tuple[Tuple[Transition, ...], ...], ...]:
+    """TRANSITIONS[play][outs][mask] (현재 규칙은 아웃 수와 무관하지만 희생플라이/병살 규칙을 위해 축을 둠)"""
+    return tuple(
+        tuple(tuple(_transition(play, outs, mask) for mask in range(N_BASE_STATES)) for outs in range(N_OUT_STATES))
+        for play in PLAYS
+    )
+
+TRANSITIONS = build_transitions()
 
 class BaseballRuleEngine:
     """
     Deterministic Rule Engine for Baseball.
     Handles state transitions (Runner Advancement, Score, Outs) based on the Event (Result).
+    Every transition comes from the precomputed TRANSITIONS table.
     """
 
+    @staticmethod
+    def transition(game: GameState, result_code: str) -> Transition:
+        return TRANSITIONS[play_index(result_code)][min(game.outs, N_OUT_STATES - 1)][base_mask(game.bases)]
+
     @staticmethod
     def apply_result(game: GameState, result: SimulationResult) -> int:
         """
         Apply the simulation result to the game state.
         Returns the number of runs scored in this play.
         """
-        code = result.result_code.upper()
-        runs_this_play = 0
-        
-        current_batter = game.get_current_batter()
-        
-        # 1. Handle Hits (And Walks)
-        if "1B" in code or code == "HIT":
-            runs_this_play = BaseballRuleEngine._advance_runners(game, current_batter, bases_advanced=1)
-        elif "2B" in code:
-            runs_this_play = BaseballRuleEngine._advance_runners(game, current_batter, bases_advanced=2)
-        elif "3B" in code:
-            runs_this_play = BaseballRuleEngine._advance_runners(game, current_batter, bases_advanced=3)
-        elif "HR" in code or "HOMERUN" in code:
-            runs_this_play = BaseballRuleEngine._advance_runners(game, current_batter, bases_advanced=4)
-        elif "BB" in code or "WALK" in code:
-             # 볼넷은 밀어내기 로직이 다름 (무조건 진루가 아니라 1루가 차있을때만)
-             runs_this_play = BaseballRuleEngine._handle_walk(game, current_batter)
-        
-        # 2. Handle Outs
-        elif "OUT" in code or "STRIKEOUT" in code or "SO" in code or "GO" in code or "FO" in code:
-             runs_this_play = BaseballRuleEngine._handle_out(game)
-             
-        # 3. Update Score
+        return BaseballRuleEngine.apply_code(game, result.result_code)
+
+    @staticmethod
+    def apply_code(game: GameState, result_code: str) -> int:
+        move = BaseballRuleEngine.transition(game, result_code)
+        if move.moves:
+            bases = game.bases
+            runners = (game.get_current_batter(), bases.basec1, bases.basec2, bases.basec3)
+            s1, s2, s3 = move.sources
+            bases.basec1 = runners[s1] if s1 is not None else None
+            bases.basec2 = runners[s2] if s2 is not None else None
+            bases.basec3 = runners[s3] if s3 is not None else None
+        game.outs += move.outs
+
         if game.half == "TOP":
-            game.away_score += runs_this_play
+            game.away_score += move.runs
         else:
-            game.home_score += runs_this_play
-            
-        return runs_this_play
+            game.home_score += move.runs
 
-    @staticmethod
-    def _handle_out(game: GameState) -> int:
-        game.outs += 1
-        # Sacrifice Fly logic could be added here (if runner on 3rd and < 2 outs)
-        # For MVP, assume no advancement on outs (simple rule)
-        return 0
+        return move.runs
 
     @staticmethod
-    def _advance_runners(game: GameState, batter: PlayerState, bases_advanced: int) -> int:
+    def finish_plate_appearance(game: GameState, stamina_cost: Optional[int]) -> Optional[PlayerState]:
         """
-        Move all runners and the batter forward by `bases_advanced`.
-        Returns runs scored.
+        Next batter up, then count the pitch against the pitcher on the mound (stamina_cost None: not counted).
+        Returns that pitcher.
         """
-        runs = 0
-        
-        # Current Runners on bases (BEFORE result)
-        # We need to process them to avoid overwriting issues.
-        # But for n-base hit, it's simple: everyone moves n bases.
-        # Example: 1B -> Runner on 1st goes to 2nd. 2nd to 3rd. 3rd to Home. Batter to 1st.
-        
-        # Snapshot of current runners
-        r3 = game.bases.basec3
-        r2 = game.bases.basec2
-        r1 = game.bases.basec1
-        
-        # Reset Bases temporarily
-        game.bases.basec1 = None
-        game.bases.basec2 = None
-        game.bases.basec3 = None
-        
-        # Function to move a player
-        def place_runner(player: PlayerState, current_base: int):
-            nonlocal runs
-            target_base = current_base + bases_advanced
-            
-            if target_base >= 4:
-                runs += 1
-                # Log score?
-            else:
-                if target_base == 1: game.bases.basec1 = player
-                elif target_base == 2: game.bases.basec2 = player
-                elif target_base == 3: game.bases.basec3 = player
-
-        # Move existing runners
-        if r3: place_runner(r3, 3)
-        if r2: place_runner(r2, 2)
-        if r1: place_runner(r1, 1)
-        
-        # Move Batter
-        place_runner(batter, 0) # Batter starts at 0 (Home Plate)
-        
-        return runs
+        game.next_batter()
+        pitcher = game.get_current_pitcher()
+        if pitcher and stamina_cost is not None:
+            pitcher.pitch_count += 1
+            pitcher.current_stamina = max(0, pitcher.current_stamina - stamina_cost)
+        return pitcher
 
     @staticmethod
-    def _handle_walk(game: GameState, batter: PlayerState) -> int:
+    def check_inning(game: GameState) -> bool:
         """
-        Handle Base on Balls (Push logic only if forced).
+        Three outs: clear the bases and switch sides. Ends the game once a half-inning after the 9th
+        finishes with the scores apart. Returns True if the half changed.
         """
-        runs = 0
-        
-        # If 1st is empty, batter goes to 1st. Others stay.
-        if not game.bases.basec1:
-            game.bases.basec1 = batter
-            return 0
-            
-        # If 1st occupied...
-        # If 2nd is empty, 1st->2nd. Batter->1st. 3rd stays.
-        if not game.bases.basec2:
-            game.bases.basec2 = game.bases.basec1
-            game.bases.basec1 = batter
-            return 0
-            
-        # If 1st and 2nd occupied...
-        # If 3rd empty, 2nd->3rd, 1st->2nd, Batter->1st.
-        if not game.bases.basec3:
-            game.bases.basec3 = game.bases.basec2
-            game.bases.basec2 = game.bases.basec1
-            game.bases.basec1 = batter
-            return 0
-            
-        # If Loaded (1,2,3 all occupied) -> Everyone moves 1 base. Run scores.
-        runs += 1
-        # 3rd -> Home (Score)
-        # 2nd -> 3rd
-        # 1st -> 2nd
-        # Batter -> 1st
-        game.bases.basec3 = game.bases.basec2
-        game.bases.basec2 = game.bases.basec1
-        game.bases.basec1 = batter
-        
-        return runs
+        changed = game.outs >= 3
+        if changed:
+            game.outs = 0
+            game.bases.basec1 = None
+            game.bases.basec2 = None
+            game.bases.basec3 = None
+
+            if game.half == Half.TOP:
+                game.half = Half.BOTTOM
+            else:
+                game.half = Half.TOP
+                game.inning += 1
+
+        # 9이닝 이상 & 말 공격 종료 후 (inning이 올라가서 TOP) 점수가 다르면 종료
+        if game.inning > 9 and game.half == Half.TOP and game.home_score != game.away_score:
+            game.status = SimulationStatus.FINISHED
+        return changed
@@ -0,0 +1,91 @@
+from typing import Dict, Optional, Set, Tuple
+
+from .models import SimulationResult, ValidatorResult
+
+# 결과 코드 -> (정규 코드, 그룹)
+# 그룹이 같으면 같은 종류의 결과 (안타 / 사사구 / 아웃 / 실책)
+RESULT_CODES: Dict[str, Tuple[str, str]] = {
+    "1B": ("1B", "HIT"), "HIT": ("1B", "HIT"),
+    "2B": ("2B", "HIT"),
+    "3B": ("3B", "HIT"),
+    "HR": ("HR", "HIT"), "HOMERUN": ("HR", "HIT"),
+    "BB": ("BB", "WALK"), "WALK": ("BB", "WALK"),
+    "IBB": ("IBB", "WALK"),
+    "HBP": ("HBP", "WALK"),
+    "SO": ("SO", "OUT"), "STRIKEOUT": ("SO", "OUT"),
+    "GO": ("GO", "OUT"),
+    "FO": ("FO", "OUT"),
+    "LO": ("LO", "OUT"),
+    "OUT": ("OUT", "OUT"),
+    "E": ("E", "ERROR"),
+}
+
+# 중계 멘트 키워드 사전 (정규 코드별)
+KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "1B": ("1루타", "단타", "내야 안타", "중전 안타", "좌전 안타", "우전 안타"),
+    "2B": ("2루타",),
+    "3B": ("3루타",),
+    "HR": ("홈런", "담장을 넘", "넘어갑니다", "아치"),
+    "BB": ("볼넷", "포볼", "걸어서 1루", "걸어 나갑"),
+    "IBB": ("고의사구", "고의 4구", "고의 볼넷"),
+    "HBP": ("몸에 맞", "몸 맞는", "데드볼"),
+    "SO": ("삼진", "헛스윙", "루킹"),
+    "GO": ("땅볼", "병살", "내야 땅"),
+    "FO": ("뜬공", "플라이"),
+    "LO": ("직선타", "라인드라이브", "직선 타구"),
+    "E": ("실책", "에러", "포구 실수"),
+}
+
+# 특정 코드를 가리키지 않는 그룹 단위 키워드
+GROUP_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "HIT": ("안타",),
+    "OUT": ("아웃",),
+}
+
+def normalize_code(code: str) -> Optional[Tuple[str, str]]:
+    """결과 코드 -> (정규 코드, 그룹). 코드 표에 없으면 None"""
+    return RESULT_CODES.get(code.strip().upper())
+
+def _matched_codes(description: str) -> Tuple[Set[str], Set[str]]:
+    codes = {code for code, words in KEYWORDS.items() if any(w in description for w in words)}
+    groups = {group for group, words in GROUP_KEYWORDS.items() if any(w in description for w in words)}
+    return codes, groups
+
+def validate_locally(result: SimulationResult) -> Optional[ValidatorResult]:
+    """
+    코드 표 + 한국어 키워드 사전으로 `result_code`와 `description`의 일치 여부를 판정.
+    명확하면 ValidatorResult를, 애매하면 None을 반환합니다 (LLM 검증관으로 위임).
+    """
+    normalized = normalize_code(result.result_code)
+    if normalized is None:
+        return ValidatorResult(
+            is_valid=False,
+            reasoning=f"[Local] 알 수 없는 결과 코드: {result.result_code}",
+            error_type="RuleViolation",
+            correction_suggestion="result_code는 1B, 2B, 3B, HR, BB, IBB, HBP, SO, GO, FO, LO, E 중 하나여야 합니다."
+        )
+    code, group = normalized
+    matched, matched_groups = _matched_codes(result.description)
+
+    # 같은 그룹 안에서 다른 세부 코드를 가리키면 모순 (예: 1B인데 "2루타")
+    own_group_codes = {c for c in matched if RESULT_CODES[c][1] == group}
+    other_codes = {c for c in matched if RESULT_CODES[c][1] != group}
+    conflicting = other_codes | (own_group_codes - {code} if code != "OUT" else set())
+    supported = (code in matched) or (code == "OUT" and bool(own_group_codes)) or (group in matched_groups)
+    other_groups = matched_groups - {group}
+
+    if supported and not conflicting and not other_groups:
+        return ValidatorResult(
+            is_valid=True,
+            reasoning=f"[Local] 결과 코드 {code}와 중계 멘트가 일치합니다."
+        )
+    if not supported and (conflicting or other_groups):
+        described = ", ".join(sorted(conflicting | other_groups))
+        return ValidatorResult(
+            is_valid=False,
+            reasoning=f"[Local] 결과 코드 {code}인데 중계 멘트는 {described}를 묘사합니다.",
+            error_type="LogicError",
+            correction_suggestion=f"중계 멘트를 {code} 결과에 맞게 다시 작성하거나, 멘트에 맞는 result_code를 사용하세요."
+        )
+    # 키워드가 없거나 서로 상충 -> 판단 보류
+    return None
@@ -0,0 +1,226 @@
+import math
+import random
+from typing import Dict, List, Optional
+
+from .models import (
+    GameState, SimulationResult, Character, Team,
+    DirectorContext, PitcherDecision, BatterDecision,
+    UmpireZone, BattingStyle, TeamStrategy
+)
+
+# 타석 결과 코드 (rule_engine이 처리하는 기본 코드)
+OUTCOMES: List[str] = ["1B", "2B", "3B", "HR", "BB", "SO", "GO", "FO", "E"]
+
+# 리그 평균 타석당 결과 비율 (합계 1.0)
+LEAGUE_RATES: Dict[str, float] = {
+    "1B": 0.145, "2B": 0.045, "3B": 0.005, "HR": 0.030,
+    "BB": 0.085, "SO": 0.220, "GO": 0.240, "FO": 0.220,
+    "E": 0.010,
+}
+
+# 결과별 중계 멘트 템플릿 (LLM 없이 사용)
+DESCRIPTIONS: Dict[str, List[str]] = {
+    "1B": ["{batter}, 투수 옆을 빠져나가는 중전 안타!", "{batter}의 깔끔한 좌전 안타!", "{batter}, 밀어친 타구가 우전 안타가 됩니다."],
+    "2B": ["{batter}, 좌중간을 가르는 2루타!", "{batter}의 타구가 라인 선상에 떨어지는 2루타!"],
+    "3B": ["{batter}, 우중간 깊숙한 타구! 3루까지 내달리는 3루타!"],
+    "HR": ["{batter}, 담장을 넘어가는 홈런!", "{batter}의 큼지막한 타구, 그대로 홈런!"],
+    "BB": ["{pitcher}의 공이 빠지며 {batter} 볼넷으로 걸어 나갑니다.", "{batter}, 끈질기게 공을 골라내 볼넷!"],
+    "SO": ["{pitcher}의 결정구에 {batter} 헛스윙 삼진!", "{batter}, 바깥쪽 꽉 찬 공에 루킹 삼진."],
+    "GO": ["{batter}, 유격수 땅볼로 물러납니다.", "{batter}의 타구는 2루수 앞 땅볼, 아웃."],
+    "FO": ["{batter}, 중견수 플라이로 물러납니다.", "{batter}의 높이 뜬 타구, 좌익수가 잡아내는 플라이 아웃."],
+    "E": ["{batter}의 평범한 땅볼, 유격수 포구 실책으로 출루합니다.", "{batter}의 타구를 3루수가 놓칩니다. 실책!"],
+}
+
+def scale_rating(value: float) -> float:
+    """
+    기본 능력치(contact/power/speed, 투수는 제구/구위/구속)를 0-100 스케일로 환산.
+    DB 캐릭터의 기본 능력치는 1-10 스케일(훈련 XP 소수점 포함)이므로 10배 합니다.
+    """
+    return clamp_rating(float(value or 0) * 10)
+
+def clamp_rating(value: float) -> float:
+    """이미 0-100 스케일인 능력치(선구안/클러치, 좌/우 스플릿, 멘탈, 수비)는 범위만 자름"""
+    return max(0.0, min(100.0, float(value or 0)))
+
+def _factor(rating: float, weight: float) -> float:
+    """50을 평균으로 한 지수형 배율 (rating 100 -> e^weight, 0 -> e^-weight)"""
+    return math.exp(weight * (rating - 50) / 50)
+
+def _platoon(base: float, left: int, right: int) -> float:
+    """좌/우 투수 상대 능력치 반영 (캐릭터에 투구 손 정보가 없으므로 두 값의 평균, 0은 미입력)"""
+    splits = [v for v in (left, right) if v]
+    if not splits:
+        return base
+    return (base + clamp_rating(sum(splits) / len(splits))) / 2
+
+def odds_ratio(batter_rates: Dict[str, float], pitcher_rates: Dict[str, float], league_rates: Dict[str, float] = LEAGUE_RATES) -> Dict[str, float]:
+    """
+    Odds-ratio(log5 일반화): P(o) ∝ B(o) * P(o) / L(o), 전체 합 1로 정규화.
+    """
+    weights = {o: batter_rates[o] * pitcher_rates[o] / league_rates[o] for o in league_rates}
+    total = sum(weights.values())
+    return {o: w / total for o, w in weights.items()}
+
+def _normalize(rates: Dict[str, float]) -> Dict[str, float]:
+    total = sum(rates.values())
+    return {o: r / total for o, r in rates.items()}
+
+def batter_rates(character: Character, risp: bool = False) -> Dict[str, float]:
+    """타자 능력치 -> 결과별 비율"""
+    contact = _platoon(scale_rating(character.contact), character.contact_left, character.contact_right)
+    power = _platoon(scale_rating(character.power), character.power_left, character.power_right)
+    speed = scale_rating(character.speed)
+    eye = clamp_rating(character.eye)
+    if risp:
+        # 득점권 보정
+        contact += (clamp_rating(character.clutch) - 50) * 0.2
+
+    rates = dict(LEAGUE_RATES)
+    rates["1B"] *= _factor(contact, 0.5) * _factor(speed, 0.15)
+    rates["2B"] *= _factor(power, 0.4) * _factor(contact, 0.2) * _factor(speed, 0.2)
+    rates["3B"] *= _factor(speed, 0.8) * _factor(power, 0.2)
+    rates["HR"] *= _factor(power, 1.0)
+    rates["BB"] *= _factor(eye, 0.6)
+    rates["SO"] *= _factor(contact, -0.5) * _factor(eye, -0.2)
+    rates["GO"] *= _factor(power, -0.3) * _factor(speed, -0.1)
+    rates["FO"] *= _factor(power, 0.2)
+    return _normalize(rates)
+
+def pitcher_rates(character: Character) -> Dict[str, float]:
+    """투수 능력치 -> 결과별 비율 (control=contact, stuff=power, velocity=speed)"""
+    control = scale_rating(character.contact)
+    stuff = scale_rating(character.power)
+    velocity = scale_rating(character.speed)
+    mental = clamp_rating(character.mental)
+
+    rates = dict(LEAGUE_RATES)
+    hit_suppress = _factor(stuff, -0.3) * _factor(mental, -0.05)
+    rates["1B"] *= hit_suppress
+    rates["2B"] *= hit_suppress
+    rates["3B"] *= hit_suppress
+    rates["HR"] *= _factor(stuff, -0.5) * _factor(control, -0.2)
+    rates["BB"] *= _factor(control, -0.7)
+    rates["SO"] *= _factor(stuff, 0.4) * _factor(velocity, 0.4)
+    rates["GO"] *= _factor(stuff, 0.2)
+    return _normalize(rates)
+
+def defense_ratings(team: Team) -> Dict[str, float]:
+    """수비 팀 야수들의 평균 수비 능력 (range, error, arm; error는 높을수록 실책이 잦음)"""
+    fielders = [p.character for p in team.get_lineup()]
+    if not fielders:
+        return {"range": 50.0, "error": 50.0, "arm": 50.0}
+    n = len(fielders)
+    return {
+        "range": sum(clamp_rating(c.defense_range) for c in fielders) / n,
+        "error": sum(clamp_rating(c.defense_error) for c in fielders) / n,
+        "arm": sum(clamp_rating(c.defense_arm) for c in fielders) / n,
+    }
+
+def _apply_defense(probs: Dict[str, float], defense: Dict[str, float]) -> Dict[str, float]:
+    """수비 범위/송구가 좋으면 인플레이 안타 일부가 아웃으로 바뀜, 실책 빈도가 높으면 땅볼 아웃 일부가 실책 출루로 바뀜"""
+    probs = dict(probs)
+    range_factor = _factor(defense["range"], -0.25)
+    arm_factor = _factor(defense["arm"], -0.15)
+    for code, factor, out_code in (("1B", range_factor, "GO"), ("2B", range_factor * arm_factor, "FO"), ("3B", arm_factor, "FO")):
+        moved = max(probs[code] * (1 - factor), -probs[out_code])
+        probs[code] -= moved
+        probs[out_code] += moved
+    errors = min(probs["E"] * (_factor(defense["error"], 0.6) - 1), probs["GO"])
+    probs["E"] += errors
+    probs["GO"] -= errors
+    return _normalize(probs)
+
+def apply_decisions(
+    probs: Dict[str, float],
+    ctx: Optional[DirectorContext],
+    p_dec: Optional[PitcherDecision],
+    b_dec: Optional[BatterDecision],
+    offense_strategy: Optional[TeamStrategy]
+) -> Dict[str, float]:
+    """환경/작전/투타 의도 보정 (있는 경우에만)"""
+    probs = dict(probs)
+    if ctx:
+        if ctx.umpire_zone == UmpireZone.WIDE:
+            probs["SO"] *= 1.1; probs["BB"] *= 0.85
+        elif ctx.umpire_zone == UmpireZone.NARROW:
+            probs["SO"] *= 0.9; probs["BB"] *= 1.15
+    if p_dec:
+        if p_dec.effort == "Full_Power":
+            probs["SO"] *= 1.1; probs["BB"] *= 1.05
+        elif p_dec.effort == "Finesse":
+            probs["GO"] *= 1.1; probs["SO"] *= 0.95
+    if b_dec:
+        if b_dec.style == BattingStyle.AGGRESSIVE:
+            probs["SO"] *= 1.05; probs["BB"] *= 0.85; probs["HR"] *= 1.1
+        elif b_dec.style == BattingStyle.CAUTIOUS:
+            probs["BB"] *= 1.15; probs["SO"] *= 1.05
+    if offense_strategy == TeamStrategy.BUNT:
+        probs["GO"] *= 1.5; probs["HR"] *= 0.2; probs["2B"] *= 0.5
+    elif offense_strategy == TeamStrategy.LONG_BALL:
+        probs["HR"] *= 1.2; probs["FO"] *= 1.1; probs["SO"] *= 1.1
+    return _normalize(probs)
+
+def matchup_probabilities(
+    batter: Character,
+    pitcher: Character,
+    defense: Dict[str, float],
+    risp: bool = False
+) -> Dict[str, float]:
+    """타자 vs 투수 (+ 수비) 결과별 확률 (작전/환경 보정 전)"""
+    probs = odds_ratio(batter_rates(batter, risp), pitcher_rates(pitcher))
+    return _apply_defense(probs, defense)
+
+class StatResolver:
+    """
+    통계 기반 타석 판정기 (LLM 없이 마이크로초 단위).
+    선수 능력치 -> 타자/투수 결과 비율 -> odds-ratio 결합 -> 수비/작전 보정 -> 샘플링.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+
+    def outcome_probabilities(
+        self,
+        game: GameState,
+        ctx: Optional[DirectorContext] = None,
+        p_dec: Optional[PitcherDecision] = None,
+        b_dec: Optional[BatterDecision] = None,
+        offense_strategy: Optional[TeamStrategy] = None
+    ) -> Dict[str, float]:
+        pitcher = game.get_current_pitcher().character
+        batter = game.get_current_batter().character
+        risp = bool(game.bases.basec2 or game.bases.basec3)
+
+        probs = matchup_probabilities(batter, pitcher, defense_ratings(game.get_defense_team()), risp)
+        return apply_decisions(probs, ctx, p_dec, b_dec, offense_strategy)
+
+    def resolve(
+        self,
+        game: GameState,
+        ctx: Optional[DirectorContext] = None,
+        p_dec: Optional[PitcherDecision] = None,
+        b_dec: Optional[BatterDecision] = None,
+        offense_strategy: Optional[TeamStrategy] = None
+    ) -> SimulationResult:
+        probs = self.outcome_probabilities(game, ctx, p_dec, b_dec, offense_strategy)
+        code = self.rng.choices(OUTCOMES, weights=[probs[o] for o in OUTCOMES])[0]
+        return self.result(code, probs, game.get_current_batter().character, game.get_current_pitcher().character, p_dec, b_dec)
+
+    def result(
+        self,
+        code: str,
+        probs: Dict[str, float],
+        batter: Character,
+        pitcher: Character,
+        p_dec: Optional[PitcherDecision] = None,
+        b_dec: Optional[BatterDecision] = None
+    ) -> SimulationResult:
+        """샘플링된 결과 코드 -> SimulationResult (중계 멘트 템플릿도 이 판정기의 난수로 고름)"""
+        description = self.rng.choice(DESCRIPTIONS[code]).format(batter=batter.name, pitcher=pitcher.name)
+        return SimulationResult(
+            reasoning=f"[Stat] {code} (p={probs[code]:.3f}) | " + ", ".join(f"{o} {probs[o]:.3f}" for o in OUTCOMES),
+            result_code=code,
+            description=description,
+            pitch_desc=f"{p_dec.pitch_type.value}/{p_dec.location.value}" if p_dec else "",
+            hit_desc=b_dec.style.value if b_dec else ""
+        )
@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+def estimate_tokens(text: str) -> int:
+    """
+    프롬프트 토큰 수 추정 (오프라인, 토크나이저 없이).
+    한글 등 비 ASCII 문자는 약 0.7 토큰, ASCII는 약 4글자당 1 토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return int((len(text) - ascii_chars) * 0.7 + ascii_chars / 4) + 1
+
+class TokenMeter:
+    """
+    노드별 LLM 호출 / 토큰 / 지연 시간 집계.
+    - prompt_tokens / completion_tokens: LLM이 보고한 실제 사용량 (callback_handler로 수집)
+    - estimated_prompt_tokens: 렌더링한 프롬프트로 추정한 입력 토큰 (카세트/테스트 LLM에서도 측정 가능)
+    """
+
+    FIELDS = ("calls", "prompt_tokens", "completion_tokens", "estimated_prompt_tokens", "latency_seconds")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._nodes: Dict[str, Dict[str, float]] = {}
+        self._handler = None
+
+    def _node(self, node: str) -> Dict[str, float]:
+        if node not in self._nodes:
+            self._nodes[node] = {name: 0 for name in self.FIELDS}
+        return self._nodes[node]
+
+    def record_call(self, node: str, prompt_texts: List[str], latency: float):
+        """chokepoint(_invoke/_batch)에서 호출 1회(배치면 여러 건) 기록"""
+        estimated = sum(estimate_tokens(text) for text in prompt_texts)
+        with self._lock:
+            stats = self._node(node)
+            stats["calls"] += len(prompt_texts)
+            stats["estimated_prompt_tokens"] += estimated
+            stats["latency_seconds"] += latency
+
+    def record_usage(self, node: str, prompt_tokens: int, completion_tokens: int):
+        with self._lock:
+            stats = self._node(node)
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {node: dict(stats) for node, stats in self._nodes.items()}
+
+    def totals(self) -> Dict[str, float]:
+        totals = {name: 0 for name in self.FIELDS}
+        for stats in self.snapshot().values():
+            for name in self.FIELDS:
+                totals[name] += stats[name]
+        return totals
+
+    def reset(self):
+        with self._lock:
+            self._nodes.clear()
+
+    def callback_handler(self):
+        """LangChain 콜백: 체인 태그("node:<이름>")로 노드를 구분해 실제 토큰 사용량 수집"""
+        if self._handler is None:
+            from langchain_core.callbacks import BaseCallbackHandler
+
+            meter = self
+
+            class _TokenUsageHandler(BaseCallbackHandler):
+                def on_llm_end(self, response, *, tags: Optional[List[str]] = None, **kwargs: Any):
+                    node = next((t[5:] for t in tags or [] if t.startswith("node:")), "unknown")
+                    prompt_tokens, completion_tokens = _usage(response)
+                    if prompt_tokens or completion_tokens:
+                        meter.record_usage(node, prompt_tokens, completion_tokens)
+
+            self._handler = _TokenUsageHandler()
+        return self._handler
+
+def _usage(response: Any):
+    """LLMResult -> (prompt_tokens, completion_tokens)"""
+    usage = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+    if usage:
+        return usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+    prompt_tokens = completion_tokens = 0
+    for generations in getattr(response, "generations", []) or []:
+        for gen in generations:
+            meta = getattr(getattr(gen, "message", None), "usage_metadata", None) or {}
+            prompt_tokens += meta.get("input_tokens", 0)
+            completion_tokens += meta.get("output_tokens", 0)
+    return prompt_tokens, completion_tokens
@@ -213,6 +213,102 @@ CREATE TABLE matches (
     ON DELETE RESTRICT ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- =========================
+-- 6-1) Match Checkpoints (engine resume)
+-- =========================
+CREATE TABLE match_checkpoints (
+  checkpoint_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  match_id BIGINT UNSIGNED NOT NULL,
+
+  -- 체크포인트까지 진행한 타석 수 / 이닝 (하프이닝 교대 또는 N타석마다 저장)
+  pa_count INT NOT NULL,
+  inning INT NOT NULL,
+  half ENUM('TOP','BOTTOM') NOT NULL,
+
+  -- simulation MatchCheckpoint (GameState + director/manager 컨텍스트)
+  state JSON NOT NULL,
+
+  created_at DATETIME(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+
+  PRIMARY KEY (checkpoint_id),
+  KEY idx_checkpoints_match_pa (match_id, pa_count),
+
+  CONSTRAINT fk_checkpoints_match
+    FOREIGN KEY (match_id) REFERENCES matches(match_id)
+    ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- =========================
+-- 6-2) Match Jobs (simulation worker queue)
+-- =========================
+CREATE TABLE match_jobs (
+  job_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  match_id BIGINT UNSIGNED NOT NULL,
+
+  status ENUM('QUEUED','RUNNING','DONE','FAILED') NOT NULL DEFAULT 'QUEUED',
+  live TINYINT(1) NOT NULL DEFAULT 0,
+
+  -- 워커 lease: heartbeat가 끊겨 lease가 만료되면 다른 워커가 체크포인트부터 이어서 진행
+  attempts INT NOT NULL DEFAULT 0,
+  worker_id VARCHAR(128) NULL,
+  lease_expires_at DATETIME(3) NULL,
+  heartbeat_at DATETIME(3) NULL,
+  fast_forward_requested TINYINT(1) NOT NULL DEFAULT 0,
+  last_error VARCHAR(1024) NULL,
+
+  created_at DATETIME(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+
+  PRIMARY KEY (job_id),
+  UNIQUE KEY uk_match_jobs_match (match_id),
+  KEY idx_match_jobs_claim (status, live, lease_expires_at),
+
+  CONSTRAINT fk_match_jobs_match
+    FOREIGN KEY (match_id) REFERENCES matches(match_id)
+    ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- =========================
+-- 6-3) Match Events / Snapshots (event-sourced match record)
+-- =========================
+CREATE TABLE match_events (
+  event_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  match_id BIGINT UNSIGNED NOT NULL,
+
+  -- 이벤트 순번 / 속한 타석 번호 (체크포인트에서 이어서 진행하면 그 타석부터 다시 씀)
+  seq INT NOT NULL,
+  pa INT NOT NULL,
+
+  -- simulation GameEvent (PLAY: 정규 결과 코드 / SUBSTITUTION: 투수 교체 / DIRECTOR: 경기 환경)
+  event JSON NOT NULL,
+
+  PRIMARY KEY (event_id),
+  UNIQUE KEY uk_match_events_seq (match_id, seq),
+
+  CONSTRAINT fk_match_events_match
+    FOREIGN KEY (match_id) REFERENCES matches(match_id)
+    ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE match_snapshots (
+  snapshot_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  match_id BIGINT UNSIGNED NOT NULL,
+
+  -- 이벤트 seq개를 적용한 직후 (하프이닝 교대마다)
+  seq INT NOT NULL,
+  pa_count INT NOT NULL,
+
+  -- simulation GameSnapshot (로스터 제외) / 첫 스냅샷만: 로스터를 포함한 시작 GameState
+  state JSON NOT NULL,
+  start JSON NULL,
+
+  PRIMARY KEY (snapshot_id),
+  KEY idx_match_snapshots_seq (match_id, seq),
+
+  CONSTRAINT fk_match_snapshots_match
+    FOREIGN KEY (match_id) REFERENCES matches(match_id)
+    ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 -- =========================
 -- 7) Plate Appearances (At-bat log)
 -- =========================
@@ -0,0 +1,67 @@
+import sys
+import os
+import random
+import threading
+from collections import Counter
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from apps.simulation import engine
+from apps.simulation.models import (
+    DirectorContext, ManagerDecision, PitcherDecision, BatterDecision, SimulationResult, ValidatorResult,
+    PitchType, PitchLocation, BattingStyle
+)
+
+RESULT_TEXT = {"1B": "중전 안타", "HR": "홈런", "BB": "볼넷", "SO": "삼진", "GO": "땅볼", "FO": "플라이"}
+
+def random_result(rng: random.Random, codes=tuple(RESULT_TEXT)) -> SimulationResult:
+    """코드와 멘트가 일치하는 무작위 판정"""
+    code = rng.choice(list(codes))
+    return SimulationResult(reasoning="", result_code=code, description=RESULT_TEXT.get(code, code))
+
+DEFAULT_RESPONSES = {
+    DirectorContext: lambda rng: DirectorContext(),
+    ManagerDecision: lambda rng: ManagerDecision(description="작전"),
+    PitcherDecision: lambda rng: PitcherDecision(pitch_type=PitchType.FASTBALL, location=PitchLocation.LOW, description="투구"),
+    BatterDecision: lambda rng: BatterDecision(style=BattingStyle.CAUTIOUS, description="타격"),
+    SimulationResult: random_result,
+    ValidatorResult: lambda rng: ValidatorResult(is_valid=True, reasoning="ok"),
+}
+
+class FakeLLM:
+    """
+    네트워크 없는 LLM: 스키마별 응답 함수 fn(rng) (responses로 필요한 스키마만 바꿈).
+    calls[스키마] = 호출 수 (배치 호출은 스레드에서 실행되므로 잠금)
+    """
+    def __init__(self, responses=None, seed=0):
+        self.rng = random.Random(seed)
+        self.responses = {**DEFAULT_RESPONSES, **(responses or {})}
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def respond(self, schema):
+        with self._lock:
+            self.calls[schema] += 1
+        return self.responses[schema](self.rng)
+
+    def with_structured_output(self, schema, **kwargs):
+        return RunnableLambda(lambda _: self.respond(schema))
+
+@pytest.fixture
+def fake_llm():
+    """
+    fake_llm(responses=None, seed=0) -> engine.llm으로 설치한 FakeLLM.
+    테스트가 끝나면 engine.llm을 원래대로 돌려놓습니다 (테스트 안에서 직접 바꾼 engine.llm도).
+    """
+    previous = engine.llm
+
+    def install(responses=None, seed=0):
+        engine.llm = FakeLLM(responses, seed)
+        return engine.llm
+
+    yield install
+    engine.llm = previous
@@ -0,0 +1,44 @@
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+import numpy as np
+
+from apps.simulation.models import Half
+from apps.simulation.dummy_generator import init_dummy_game
+from apps.simulation.stat_resolver import OUTCOMES
+from apps.simulation.batch_sim import BatchSimulator, NEXT_BASES, RUNS, OUTS_ADDED, matchup_table
+
+def test_transition_tables_follow_rule_engine():
+    o = {code: i for i, code in enumerate(OUTCOMES)}
+    # 만루 홈런 / 만루 볼넷(밀어내기) / 1,3루 볼넷 / 2루 주자 단타
+    assert (RUNS[o["HR"], 7], NEXT_BASES[o["HR"], 7]) == (4, 0)
+    assert (RUNS[o["BB"], 7], NEXT_BASES[o["BB"], 7]) == (1, 7)
+    assert (RUNS[o["BB"], 5], NEXT_BASES[o["BB"], 5]) == (0, 7)
+    assert (RUNS[o["1B"], 2], NEXT_BASES[o["1B"], 2]) == (0, 5)
+    assert (RUNS[o["E"], 4], NEXT_BASES[o["E"], 4]) == (1, 1) # 3루 주자 + 실책 출루
+    assert OUTS_ADDED.tolist() == [0, 0, 0, 0, 0, 1, 1, 1, 0]
+
+def test_batch_games_finish():
+    random.seed(5)
+    game = init_dummy_game()
+    table = matchup_table(game.away_team, game.home_team)
+    assert np.allclose(table[:, -1], 1.0)
+
+    result = BatchSimulator.from_game(game, rng=np.random.default_rng(0)).simulate(2000)
+    assert len(result) == 2000
+    assert (result.innings >= 9).all()
+    decided = result.innings < 15
+    assert (result.home_scores[decided] != result.away_scores[decided]).all()
+    assert 1.0 < result.home_scores.mean() < 8.0
+
+def test_simulate_from_game_state():
+    random.seed(5)
+    game = init_dummy_game()
+    game.inning, game.half, game.outs = 9, Half.BOTTOM, 2
+    game.home_score, game.away_score = 0, 10
+    result = BatchSimulator.from_game(game, rng=np.random.default_rng(0)).simulate(1000, start=game)
+    assert result.home_win_rate < 0.01
@@ -0,0 +1,33 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+import pytest
+
+from apps.simulation import engine
+from apps.simulation.cassette import CassetteLLM, CassetteMiss
+from apps.simulation.benchmark import seeded_game
+from apps.simulation.models import EngineConfig, DirectorContext
+
+def _play(llm):
+    engine.llm = llm
+    game = seeded_game(3)
+    engine.run_engine(game, config=EngineConfig())
+    return game.logs
+
+def test_record_then_replay_is_identical(tmp_path, fake_llm):
+    path = str(tmp_path / "game.jsonl")
+    recorded = _play(CassetteLLM(path, mode="record", inner=fake_llm(seed=1)))
+
+    player = CassetteLLM(path, mode="replay", strict=True)
+    assert _play(player) == recorded
+    assert player.stats["fallback"] == 0
+
+def test_replay_miss(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_text("")
+    chain = CassetteLLM(str(path), strict=True).with_structured_output(DirectorContext)
+    with pytest.raises(CassetteMiss):
+        chain.invoke("unknown prompt")
@@ -0,0 +1,52 @@
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation import engine
+from apps.simulation.models import EngineConfig, EngineMode, CheckpointSchedule, Half, MatchCheckpoint
+from apps.simulation.dummy_generator import init_dummy_game
+
+def _game():
+    random.seed(11)
+    return init_dummy_game()
+
+def test_half_inning_checkpoints_resume_to_identical_game():
+    config = EngineConfig(mode=EngineMode.STATISTICAL, seed=5)
+    checkpoints, full_steps = [], []
+    full = engine.run_engine(_game(), config=config, on_checkpoint=checkpoints.append, on_step_callback=full_steps.append)
+
+    # 하프이닝 교대마다 1개 (경기 종료 시점 제외), 모두 이닝 시작 상태
+    assert len(checkpoints) >= 17
+    assert all(c.game.outs == 0 and c.game.bases.basec1 is None for c in checkpoints)
+    assert checkpoints[0].game.half == Half.BOTTOM and checkpoints[0].game.inning == 1
+
+    # DB(JSON) 저장 -> 복원 후 이어서 진행하면 끝난 이닝은 다시 돌지 않고 같은 결과
+    saved = checkpoints[9].model_dump(mode="json")
+    steps = []
+    resumed = engine.run_engine(
+        None, config=config, on_step_callback=steps.append, resume_from=MatchCheckpoint.model_validate(saved)
+    )
+    assert len(steps) == len(full_steps) - checkpoints[9].pa_count
+    assert (resumed.home_score, resumed.away_score) == (full.home_score, full.away_score)
+    assert resumed.logs == full.logs
+
+def test_every_n_pa_checkpoints():
+    config = EngineConfig(mode=EngineMode.STATISTICAL, seed=5, checkpoint=CheckpointSchedule.EVERY_N_PA, checkpoint_every_n=4)
+    checkpoints = []
+    engine.run_engine(_game(), config=config, on_checkpoint=checkpoints.append)
+    assert [c.pa_count for c in checkpoints[:3]] == [4, 8, 12]
+
+def test_mid_inning_checkpoint_with_runners_resumes_to_identical_game():
+    config = EngineConfig(mode=EngineMode.STATISTICAL, seed=5, checkpoint=CheckpointSchedule.EVERY_N_PA, checkpoint_every_n=1)
+    checkpoints = []
+    full = engine.run_engine(_game(), config=config, on_checkpoint=checkpoints.append)
+
+    # 주자가 있는 이닝 도중 체크포인트: JSON 복원본의 주자는 로스터 객체가 아니라 복사본
+    checkpoint = next(c for c in checkpoints if c.game.outs and c.game.bases.basec1 and c.game.bases.basec2)
+    saved = MatchCheckpoint.model_validate(checkpoint.model_dump(mode="json"))
+    resumed = engine.run_engine(None, config=config, resume_from=saved)
+    assert (resumed.home_score, resumed.away_score) == (full.home_score, full.away_score)
+    assert resumed.logs == full.logs
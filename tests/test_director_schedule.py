@@ -0,0 +1,47 @@
+import sys
+import os
+import itertools
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+import pytest
+
+from apps.simulation import engine
+from apps.simulation.models import EngineConfig, DirectorSchedule, DirectorContext
+from apps.simulation.dummy_generator import init_dummy_game
+
+def _run(fake_llm, **config):
+    """더미 경기 1회 진행: 타석별 (이닝, 초/말, 적용된 Director 번호)와 LLM 호출 수 반환"""
+    counter = itertools.count()
+    llm = fake_llm({DirectorContext: lambda rng: DirectorContext(wind_direction=f"call {next(counter)}")})
+    steps = []
+    engine.run_engine(
+        init_dummy_game(), config=EngineConfig(**config),
+        on_step_callback=lambda game: steps.append((game.inning, game.half, game.director.wind_direction))
+    )
+    return steps, llm.calls[DirectorContext]
+
+def test_every_pa_calls_director_each_plate_appearance(fake_llm):
+    steps, calls = _run(fake_llm, director_schedule=DirectorSchedule.EVERY_PA)
+    assert calls == len(steps)
+    assert [wind for _, _, wind in steps] == [f"call {pa}" for pa in range(len(steps))]
+
+def test_game_start_reuses_cached_context(fake_llm):
+    steps, calls = _run(fake_llm, director_schedule=DirectorSchedule.GAME_START)
+    assert calls == 1 and len(steps) >= 51
+    assert {wind for _, _, wind in steps} == {"call 0"}
+
+def test_half_inning_reevaluates_on_each_change(fake_llm):
+    steps, calls = _run(fake_llm, director_schedule=DirectorSchedule.HALF_INNING)
+    halves = list(dict.fromkeys((inning, half) for inning, half, _ in steps))
+    assert calls == len(halves) and len(halves) >= 18
+    # 하프이닝마다 새 환경 1개, 그 안의 타석은 모두 같은 환경 재사용
+    for i, half in enumerate(halves):
+        assert {wind for inning, h, wind in steps if (inning, h) == half} == {f"call {i}"}
+
+@pytest.mark.parametrize("n", [1, 5, 12])
+def test_every_n_pa_calls_director_every_n(fake_llm, n):
+    steps, calls = _run(fake_llm, director_schedule=DirectorSchedule.EVERY_N_PA, director_every_n=n)
+    assert calls == -(-len(steps) // n)
+    assert [wind for _, _, wind in steps] == [f"call {pa // n}" for pa in range(len(steps))]
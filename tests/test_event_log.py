@@ -0,0 +1,96 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation import engine, event_log
+from apps.simulation.benchmark import seeded_game
+from apps.simulation.models import (
+    EngineConfig, EngineMode, CheckpointSchedule, MatchCheckpoint, GameEventLog, GameEventType, SimulationStatus, DirectorContext, ManagerDecision,
+    PitcherDecision, SimulationResult, PitchType, PitchLocation, Weather
+)
+
+def _state(game):
+    """비교용 GameState (중계 텍스트 제외)"""
+    data = game.model_dump()
+    data.pop("logs")
+    data.pop("last_result")
+    return data
+
+def _statistical(log, **kwargs):
+    return engine.run_engine(seeded_game(3), config=EngineConfig(mode=EngineMode.STATISTICAL, seed=1), event_log=log, **kwargs)
+
+def test_replay_rebuilds_every_snapshot_and_the_final_state():
+    log = GameEventLog()
+    final = _statistical(log)
+    assert final.status == SimulationStatus.FINISHED
+    assert len(log.snapshots) >= 18 and log.snapshots[0].seq == 0
+    assert {e.code for e in log.events if e.type == GameEventType.PLAY} <= {"1B", "2B", "3B", "HR", "BB", "SO", "GO", "FO"}
+
+    # 첫 스냅샷만 두고 처음부터 재생해도 하프이닝 스냅샷과 같은 상태
+    first_only = GameEventLog(start=log.start, events=log.events, snapshots=log.snapshots[:1])
+    for snapshot in log.snapshots:
+        assert _state(event_log.replay(first_only, snapshot.seq)) == _state(event_log.restore_snapshot(log, snapshot))
+    assert _state(event_log.replay(log)) == _state(final)
+
+    # DB에서 읽듯 스냅샷 하나 + 그 뒤 이벤트만 있어도 재생 가능
+    snapshot = log.snapshots[10]
+    tail = GameEventLog(start=log.start, events=log.events[snapshot.seq:], snapshots=[snapshot])
+    target = snapshot.seq + 3
+    assert _state(event_log.replay(tail, target)) == _state(event_log.replay(log, target))
+
+    # 타석 번호로 찾기: pa번째 타석 직전 = 이벤트 pa개 (STATISTICAL은 타석당 PLAY 하나)
+    assert event_log.seq_at_pa(log, 40) == 40
+
+def _coded_result(rng):
+    code = rng.choice(["1B", "BB", "GO", "FO", "SO", "HBP", "E", "LO"])
+    return SimulationResult(reasoning="", result_code=code, description=code)
+
+# 매 호출 날씨가 바뀌고 감독이 자주 투수 교체를 요청하는 LLM 응답
+EVENTFUL = {
+    DirectorContext: lambda rng: DirectorContext(weather=rng.choice(list(Weather))),
+    ManagerDecision: lambda rng: ManagerDecision(description="작전", change_pitcher=rng.random() < 0.1),
+    PitcherDecision: lambda rng: PitcherDecision(pitch_type=PitchType.FASTBALL, location=PitchLocation.LOW, description="투구",
+                                                 effort=rng.choice(["Normal", "Full_Power"])),
+    SimulationResult: _coded_result,
+}
+
+def test_substitutions_and_director_changes_replay(fake_llm):
+    fake_llm(EVENTFUL, seed=2)
+    log = GameEventLog()
+    final = engine.run_engine(seeded_game(5), config=EngineConfig(manager_policy="LLM"), event_log=log)
+
+    types = {e.type for e in log.events}
+    assert types == {GameEventType.PLAY, GameEventType.SUBSTITUTION, GameEventType.DIRECTOR}
+    assert {e.stamina_cost for e in log.events if e.type == GameEventType.PLAY} == {1, 3}
+    assert _state(event_log.replay(log)) == _state(final)
+
+def test_resume_truncates_the_interrupted_run():
+    checkpoints = []
+    full = GameEventLog()
+    _statistical(full, on_checkpoint=checkpoints.append)
+
+    # 중단된 실행이 체크포인트 뒤까지 남긴 기록을 넘겨도 잘라내고 같은 기록을 다시 씀
+    checkpoint = checkpoints[7]
+    resumed = full.model_copy(deep=True)
+    engine.run_engine(seeded_game(3), config=EngineConfig(mode=EngineMode.STATISTICAL, seed=1), event_log=resumed, resume_from=checkpoint)
+    assert resumed.events == full.events
+    assert [s.seq for s in resumed.snapshots] == [s.seq for s in full.snapshots]
+
+    cut = event_log.truncate(full.model_copy(deep=True), checkpoint.pa_count)
+    assert all(e.pa < checkpoint.pa_count for e in cut.events) and cut.snapshots[-1].pa_count == checkpoint.pa_count
+
+def test_snapshot_of_a_json_restored_state_keeps_runners():
+    checkpoints = []
+    config = EngineConfig(mode=EngineMode.STATISTICAL, seed=1, checkpoint=CheckpointSchedule.EVERY_N_PA, checkpoint_every_n=1)
+    engine.run_engine(seeded_game(3), config=config, on_checkpoint=checkpoints.append)
+
+    # 기록 없이 이닝 도중(주자 있음)에서 이어가면 JSON 복원 상태에서 첫 스냅샷을 찍음
+    checkpoint = next(c for c in checkpoints if c.game.bases.basec1 and c.game.bases.basec2)
+    log = GameEventLog()
+    final = engine.run_engine(None, config=config, event_log=log, resume_from=MatchCheckpoint.model_validate(checkpoint.model_dump(mode="json")))
+
+    assert log.snapshots[0].pa_count == checkpoint.pa_count and None not in log.snapshots[0].runners[:2]
+    assert _state(event_log.restore_snapshot(log, log.snapshots[0])) == _state(checkpoint.game)
+    assert _state(event_log.replay(log)) == _state(final)
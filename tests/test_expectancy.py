@@ -0,0 +1,59 @@
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation import expectancy
+from apps.simulation.models import Half, EngineConfig, EngineMode
+from apps.simulation.dummy_generator import init_dummy_game
+
+def test_run_expectancy_is_monotonic(tmp_path):
+    tables = expectancy.get_tables(str(tmp_path))
+    re24 = tables.re24
+    assert re24.shape == (3, 8)
+    assert (re24[0] > re24[1]).all() and (re24[1] > re24[2]).all()
+    assert re24[0, 7] > re24[0, 1] > re24[0, 0] > 0
+
+def test_win_expectancy_lookups(tmp_path):
+    tables = expectancy.get_tables(str(tmp_path))
+    assert abs(tables.win_probability(1, Half.TOP, 0, 0, 0) - 0.5) < 0.01
+    # 9회말 종료 시점에 앞서 있으면 승리 확정
+    assert tables.win_probability(9, Half.BOTTOM, 3, 0, 1) == 1.0
+    assert tables.win_probability(9, Half.BOTTOM, 0, 0, 3) > tables.win_probability(5, Half.TOP, 0, 0, 3)
+    # 9회말 2아웃 만루 1점 차 = 승부처, 8점 차 = 낮은 레버리지
+    assert expectancy.leverage_label(tables.leverage_index(9, Half.BOTTOM, 2, 7, -1)) == "HIGH"
+    assert expectancy.leverage_label(tables.leverage_index(5, Half.TOP, 0, 0, 8)) == "LOW"
+
+def test_tables_saved_and_versioned(tmp_path):
+    tables = expectancy.ExpectancyTables(expectancy.build_tables(), "abc")
+    path = str(tmp_path / "t.npz")
+    tables.save(path)
+    loaded = expectancy.ExpectancyTables.load(path, "abc")
+    assert loaded is not None and (loaded.we == tables.we).all()
+    assert expectancy.ExpectancyTables.load(path, "other") is None
+
+def test_tables_memoized_per_cache_dir(tmp_path):
+    first, second = tmp_path / "a", tmp_path / "b"
+    tables = expectancy.get_tables(str(first))
+    assert expectancy.get_tables(str(first)) is tables
+    assert expectancy.get_tables(str(second)) is not tables
+    assert len(os.listdir(first)) == len(os.listdir(second)) == 1
+
+def test_default_cache_dir_is_configurable(monkeypatch, tmp_path):
+    monkeypatch.setenv("EXPECTANCY_CACHE_DIR", str(tmp_path))
+    assert expectancy.default_cache_dir() == str(tmp_path)
+    monkeypatch.delenv("EXPECTANCY_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert expectancy.default_cache_dir() == str(tmp_path / "xdg" / "baseball-sim")
+
+def test_engine_reports_win_probability():
+    from apps.simulation.engine import run_engine
+    random.seed(2)
+    game = init_dummy_game()
+    frames = []
+    run_engine(game, config=EngineConfig(mode=EngineMode.STATISTICAL, seed=2), on_step_callback=lambda g: frames.append((g.win_probability, g.leverage_index)))
+    assert all(0.0 <= wp <= 1.0 and li >= 0 for wp, li in frames)
+    home_won = game.home_score > game.away_score
+    assert frames[-1][0] == (1.0 if home_won else 0.0)
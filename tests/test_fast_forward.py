@@ -0,0 +1,57 @@
+import sys
+import os
+import asyncio
+import threading
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation import engine
+from apps.simulation.benchmark import seeded_game
+from apps.simulation.manager_policy import PITCH_COUNT_LIMIT
+from apps.simulation.models import EngineConfig, EngineMode, NarrationMode, SimulationResult, SimulationStatus
+
+def _fast_forward_after(fake_llm, n_steps, run_async=False):
+    llm = fake_llm(seed=1)
+    fast_forward = threading.Event()
+    steps = []
+
+    def on_step(game):
+        steps.append(game.logs[-1])
+        if len(steps) == n_steps:
+            fast_forward.set()
+
+    game = seeded_game(4)
+    game.match_id = "match-4" # 빨리 감기 seed는 경기 ID + 타석 번호로 결정
+    config = EngineConfig()
+    if run_async:
+        asyncio.run(engine.arun_engine(game, config=config, on_step_callback=on_step, fast_forward=fast_forward))
+    else:
+        engine.run_engine(game, config=config, on_step_callback=on_step, fast_forward=fast_forward)
+    return game, steps, llm
+
+def test_fast_forward_finishes_without_llm(fake_llm):
+    game, steps, llm = _fast_forward_after(fake_llm, 5)
+    assert game.status == SimulationStatus.FINISHED
+    assert len(steps) >= 51
+    assert llm.calls[SimulationResult] == 5 # 요청 이후 타석은 통계 판정기
+
+    # 같은 시점에서 빨리 감으면 같은 결과 (sync / async 동일)
+    again, _, _ = _fast_forward_after(fake_llm, 5, run_async=True)
+    assert again.logs == game.logs
+
+def test_fast_forward_changes_tired_pitchers(fake_llm):
+    game, _, _ = _fast_forward_after(fake_llm, 5)
+    changes = [log for log in game.logs if "[투수 교체]" in log]
+    assert changes # 감독 노드가 없는 통계 그래프에서도 규칙 기반 감독이 투수를 바꿈
+    # 교체된 투수는 투구 수 기준에 닿는 즉시 내려감
+    for team in (game.home_team, game.away_team):
+        for pitcher in team.get_pitchers()[:team.current_pitcher_index]:
+            assert pitcher.pitch_count <= PITCH_COUNT_LIMIT
+
+def test_fast_forward_config_is_seeded_by_match_and_pa():
+    config = engine.fast_forward_config(EngineConfig(narration=NarrationMode.BATCHED), "m-1", 12)
+    assert config.mode == EngineMode.STATISTICAL and config.narration == NarrationMode.INLINE
+    assert config.seed == engine.fast_forward_config(EngineConfig(), "m-1", 12).seed
+    assert config.seed != engine.fast_forward_config(EngineConfig(), "m-1", 13).seed
+    assert engine.fast_forward_config(EngineConfig(seed=7), "m-1", 12).seed == 7
@@ -0,0 +1,77 @@
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation import engine
+from apps.simulation.fast_state import FastGame, EMPTY, HOME
+from apps.simulation.rule_engine import BaseballRuleEngine
+from apps.simulation.stat_resolver import OUTCOMES
+from apps.simulation.models import EngineConfig, EngineMode, GameEventLog, Half, SimulationResult, SimulationStatus
+from apps.simulation.dummy_generator import init_dummy_game
+
+def _game():
+    random.seed(5)
+    return init_dummy_game()
+
+def test_apply_matches_rule_engine_for_every_base_state():
+    for half in (Half.TOP, Half.BOTTOM):
+        for code in OUTCOMES + ["LO", "HBP", "IBB", "HIT", "STRIKEOUT", "GO_DP", "XX"]:
+            for mask in range(8):
+                game = _game()
+                game.half = half
+                runners = game.get_offense_team().roster[3:6]
+                for bit, attr in enumerate(("basec1", "basec2", "basec3")):
+                    setattr(game.bases, attr, runners[bit] if mask >> bit & 1 else None)
+
+                fast = FastGame.from_game(game)
+                runs = fast.apply(code)
+                expected = BaseballRuleEngine.apply_result(game, SimulationResult(reasoning="", result_code=code, description=""))
+
+                players = fast.roster.players
+                assert runs == expected, (code, mask)
+                assert [players[b] if b != EMPTY else None for b in (fast.b1, fast.b2, fast.b3)] == \
+                    [game.bases.basec1, game.bases.basec2, game.bases.basec3], (code, mask)
+                assert (fast.outs, fast.score) == (game.outs, [game.away_score, game.home_score])
+
+def test_clone_is_independent_and_write_back_round_trips():
+    game = _game()
+    game.inning, game.half, game.outs = 7, Half.BOTTOM, 2
+    game.bases.basec2 = game.home_team.roster[7]
+    before = game.model_dump()
+
+    fast = FastGame.from_game(game)
+    assert fast.write_to(game).model_dump() == before
+
+    branch = fast.clone()
+    branch.apply("HR")
+    branch.finish_plate_appearance()
+    branch.change_pitcher(branch.defense)
+    assert fast.score == [0, 0] and branch.score[HOME] == 2
+    assert fast.pitch_count != branch.pitch_count and fast.pitcher_index != branch.pitcher_index
+    assert fast.write_to(game).model_dump() == before
+
+    branch.write_to(game)
+    assert game.home_score == 2 and game.bases.basec2 is None
+    assert game.current_batter_index_home == 2 and game.away_team.current_pitcher_index == 1
+    assert game.away_team.get_pitchers()[0].pitch_count == 1
+
+def test_stat_loop_plays_the_same_game_as_the_statistical_graph():
+    config = EngineConfig(mode=EngineMode.STATISTICAL, seed=4)
+    start = _game()
+    finals, logs = [], []
+    for run in (lambda state: engine.get_graph(EngineMode.STATISTICAL).stream(state), engine._stat_stream):
+        log = GameEventLog()
+        state = engine._start_match(start.model_copy(deep=True), None, config, log=log)
+        for _ in run(state):
+            pass
+        finals.append(state["game"])
+        logs.append(log)
+
+    graph_game, fast_game = finals
+    assert fast_game.status == SimulationStatus.FINISHED
+    assert fast_game.model_dump() == graph_game.model_dump()
+    assert logs[1].model_dump() == logs[0].model_dump()
+    assert any("투수 교체" in line for line in fast_game.logs)
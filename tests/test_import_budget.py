@@ -0,0 +1,45 @@
+import sys
+import os
+import json
+import subprocess
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+# import 시간 예산 (초). CI 머신 사양에 따라 IMPORT_BUDGET_SECONDS로 조정
+IMPORT_BUDGET_SECONDS = float(os.environ.get("IMPORT_BUDGET_SECONDS", "1.5"))
+
+# 첫 사용 시에만 로드되어야 하는 무거운 모듈
+HEAVY_MODULES = ("langchain_core", "langchain_openai", "langgraph", "openai", "faker", "dotenv", "numpy")
+
+def _measure_import(setup: str, statement: str) -> dict:
+    """새 인터프리터에서 statement의 import 시간과 로드된 무거운 모듈 측정"""
+    script = (
+        "import sys, time, json\n"
+        f"{setup}\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'seconds': elapsed, 'heavy': heavy}))\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "OPENAI_API_KEY"}
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, cwd=os.getcwd(), env=env, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def test_engine_import_is_lazy():
+    # OPENAI_API_KEY 없이도 import 가능해야 함
+    result = _measure_import("sys.path.append('.')", "import apps.simulation.engine")
+    assert result["heavy"] == []
+    assert result["seconds"] < IMPORT_BUDGET_SECONDS
+
+def test_simulation_runner_import_is_lazy():
+    # Docker에서는 apps/simulation이 simulation_module로 마운트됨
+    setup = (
+        "sys.path.append('.'); sys.path.append('apps/api')\n"
+        "import apps.simulation\n"
+        "sys.modules['simulation_module'] = apps.simulation"
+    )
+    result = _measure_import(setup, "import src.simulation_runner")
+    assert result["heavy"] == []
+    assert result["seconds"] < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,98 @@
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation.models import ManagerDecision, TeamStrategy
+from apps.simulation.dummy_generator import init_dummy_game
+from apps.simulation.llm_cache import DecisionCache, situation_fingerprint, score_diff_band
+from apps.simulation import engine
+
+def _decision(text: str) -> ManagerDecision:
+    return ManagerDecision(description=text, offense_strategy=TeamStrategy.BUNT)
+
+def test_fingerprint_normalizes_similar_situations():
+    game = init_dummy_game()
+    base = situation_fingerprint(game, perspective="home", contact=61)
+    
+    # 같은 능력치 구간 / 같은 이닝 구간이면 같은 키
+    game.inning = 2
+    assert situation_fingerprint(game, perspective="home", contact=63) == base
+    
+    # 주자 상황이 바뀌면 다른 키
+    game.bases.basec1 = game.get_current_batter()
+    assert situation_fingerprint(game, perspective="home", contact=63) != base
+    
+    assert score_diff_band(0) == "0"
+    assert score_diff_band(-3) == "-2-3"
+    assert score_diff_band(7) == "+4+"
+
+def test_matchup_keys_separate_batters_on_db_rating_scale():
+    game = init_dummy_game()
+    batter = game.get_current_batter().character
+    
+    # DB 능력치(1-10) 3 vs 9: 같은 상황이어도 다른 키
+    batter.power = 3
+    weak = engine._batter_cache_key(game, TeamStrategy.NORMAL), engine._pitcher_cache_key(game, TeamStrategy.NORMAL), engine._manager_cache_keys(game)
+    batter.power = 9
+    strong = engine._batter_cache_key(game, TeamStrategy.NORMAL), engine._pitcher_cache_key(game, TeamStrategy.NORMAL), engine._manager_cache_keys(game)
+    assert all(a != b for a, b in zip(weak, strong))
+    
+    # 비슷한 능력치(같은 구간)는 같은 키
+    batter.power = 8
+    assert engine._batter_cache_key(game, TeamStrategy.NORMAL) == strong[0]
+
+def test_cache_hit_miss_and_lru_eviction():
+    cache = DecisionCache(max_entries=2, explore_rate=0.0)
+    assert cache.get("manager", "a", ManagerDecision) is None
+    
+    cache.put("manager", "a", _decision("A"))
+    cache.put("manager", "b", _decision("B"))
+    hit = cache.get("manager", "a", ManagerDecision)
+    assert hit.description == "A"
+    assert hit.offense_strategy == TeamStrategy.BUNT
+    
+    # "b"가 가장 오래 사용되지 않았으므로 밀려남
+    cache.put("manager", "c", _decision("C"))
+    assert cache.get("manager", "b", ManagerDecision) is None
+    assert cache.stats["evictions"] == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2
+
+def test_cache_ttl_and_disk_spill(tmp_path):
+    expired = DecisionCache(ttl_seconds=0.01, explore_rate=0.0)
+    expired.put("pitcher", "k", _decision("old"))
+    time.sleep(0.02)
+    assert expired.get("pitcher", "k", ManagerDecision) is None
+    assert expired.stats["expired"] == 1
+    
+    path = str(tmp_path / "cache.sqlite")
+    cache = DecisionCache(max_entries=1, explore_rate=0.0, disk_path=path)
+    cache.put("batter", "x", _decision("X"))
+    cache.put("batter", "y", _decision("Y")) # "x" spills to disk
+    assert cache.get("batter", "x", ManagerDecision).description == "X"
+    assert cache.stats["disk_hits"] == 1
+    
+    # persist() 후 새 프로세스(인스턴스)에서도 읽힘
+    cache.persist()
+    reloaded = DecisionCache(explore_rate=0.0, disk_path=path)
+    assert reloaded.get("batter", "y", ManagerDecision).description == "Y"
+
+def test_cache_samples_from_collected_variants():
+    cache = DecisionCache(max_variants=2, explore_rate=0.0)
+    cache.put("manager", "k", _decision("A"))
+    cache.put("manager", "k", _decision("B"))
+    cache.put("manager", "k", _decision("C")) # 가장 오래된 "A" 교체
+    seen = {cache.get("manager", "k", ManagerDecision).description for _ in range(50)}
+    assert seen == {"B", "C"}
+
+def test_put_appends_to_spilled_variants(tmp_path):
+    cache = DecisionCache(max_entries=1, max_variants=3, explore_rate=0.0, disk_path=str(tmp_path / "cache.sqlite"))
+    cache.put("manager", "k", _decision("A"))
+    cache.put("manager", "k", _decision("B"))
+    cache.put("manager", "other", _decision("X")) # "k" spills to disk
+    cache.put("manager", "k", _decision("C"))
+    seen = {cache.get("manager", "k", ManagerDecision).description for _ in range(50)}
+    assert seen == {"A", "B", "C"}
@@ -0,0 +1,70 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+import asyncio
+import threading
+import time
+
+from apps.simulation.models import LLMPriority
+from apps.simulation.llm_scheduler import LLMScheduler
+
+def test_live_requests_are_served_before_background():
+    scheduler = LLMScheduler(max_concurrency=1)
+    order = []
+    holder = scheduler.slot(LLMPriority.NORMAL)
+    holder.__enter__()
+
+    def call(priority):
+        with scheduler.slot(priority):
+            order.append(priority)
+
+    threads = []
+    for priority in (LLMPriority.BACKGROUND, LLMPriority.BACKGROUND, LLMPriority.LIVE):
+        t = threading.Thread(target=call, args=(priority,))
+        t.start()
+        threads.append(t)
+        while scheduler.stats()["queue_depth"] < len(threads):
+            time.sleep(0.001)
+
+    holder.__exit__(None, None, None)
+    for t in threads:
+        t.join(timeout=5)
+    assert order == [LLMPriority.LIVE, LLMPriority.BACKGROUND, LLMPriority.BACKGROUND]
+    stats = scheduler.stats()
+    assert stats["queue_depth"] == 0 and stats["in_flight"] == 0
+    assert stats["priorities"]["BACKGROUND"]["max_wait_seconds"] > 0
+
+def test_async_concurrency_cap():
+    scheduler = LLMScheduler(max_concurrency=2)
+    running, peak = 0, 0
+
+    async def call():
+        nonlocal running, peak
+        async with scheduler.aslot(LLMPriority.NORMAL):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    async def main():
+        await asyncio.gather(*[call() for _ in range(8)])
+        # 배치(요청 2개)는 슬롯 2개를 차지
+        async with scheduler.aslot(LLMPriority.NORMAL, weight=2):
+            assert scheduler.stats()["in_flight"] == 2
+
+    asyncio.run(main())
+    assert peak == 2
+    assert scheduler.stats()["priorities"]["NORMAL"]["requests"] == 9
+
+def test_token_bucket_limits_request_rate():
+    scheduler = LLMScheduler(max_concurrency=4, rate_per_second=50, burst=1)
+    start = time.perf_counter()
+    for _ in range(6):
+        with scheduler.slot():
+            pass
+    # 버킷 1개 + 나머지 5건은 초당 50건 -> 최소 0.1초
+    assert time.perf_counter() - start >= 0.09
+    assert scheduler.stats()["rate_limited"] >= 4
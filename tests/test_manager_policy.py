@@ -0,0 +1,41 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation.models import Half, TeamStrategy, EngineConfig, ManagerPolicy
+from apps.simulation.dummy_generator import init_dummy_game
+from apps.simulation.manager_policy import rule_manager_decisions
+
+def test_tired_pitcher_is_changed_only_on_defense():
+    game = init_dummy_game() # 1회초: 홈 팀 수비
+    game.home_team.get_pitcher().current_stamina = 20
+    game.away_team.get_pitcher().current_stamina = 20
+    home, away = rule_manager_decisions(game)
+    assert home.change_pitcher and not away.change_pitcher
+
+def test_bunt_and_infield_in_in_close_late_game():
+    game = init_dummy_game()
+    game.inning, game.half, game.outs = 8, Half.BOTTOM, 0
+    game.home_score, game.away_score = 2, 2
+    game.bases.basec1 = game.home_team.get_batter(1)
+    home, away = rule_manager_decisions(game)
+    assert home.offense_strategy == TeamStrategy.BUNT
+    assert away.defense_strategy == TeamStrategy.NORMAL
+
+    game.bases.basec1, game.bases.basec3 = None, game.home_team.get_batter(1)
+    home, away = rule_manager_decisions(game)
+    assert away.defense_strategy == TeamStrategy.INFIELD_IN
+
+def test_llm_manager_only_in_high_leverage():
+    from apps.simulation.engine import _rule_managers
+    game = init_dummy_game()
+    state = {"game": game, "config": EngineConfig(manager_policy=ManagerPolicy.HYBRID)}
+    assert _rule_managers(state) is not None # 1회초 무사 무주자
+
+    game.inning, game.half, game.outs = 9, Half.BOTTOM, 2
+    game.home_score, game.away_score = 3, 4
+    game.bases.basec1, game.bases.basec2, game.bases.basec3 = (game.home_team.get_batter(i) for i in (1, 2, 3))
+    assert _rule_managers(state) is None
+    assert _rule_managers({"game": game, "config": EngineConfig(manager_policy=ManagerPolicy.RULE)}) is not None
@@ -0,0 +1,64 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "apps", "api"))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src import crud_game
+from src.models import Base, World, Team, Match
+from apps.simulation import engine, event_log
+from apps.simulation.benchmark import seeded_game
+from apps.simulation.models import EngineConfig, EngineMode, GameEventLog
+
+def _session(tmp_path):
+    db_engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+    Base.metadata.create_all(db_engine)
+    db = sessionmaker(bind=db_engine, autoflush=False, autocommit=False)()
+    world = World(world_name="w")
+    db.add(world)
+    db.commit()
+    home, away = Team(world_id=world.world_id, team_name="h"), Team(world_id=world.world_id, team_name="a")
+    db.add_all([home, away])
+    db.commit()
+    match = Match(world_id=world.world_id, home_team_id=home.team_id, away_team_id=away.team_id)
+    db.add(match)
+    db.commit()
+    return db, match.match_id
+
+def _stored_log(db, match_id):
+    snapshots = crud_game.get_match_snapshots(db, match_id)
+    return GameEventLog(
+        start=snapshots[0].start if snapshots else None,
+        events=[row.event for row in crud_game.get_match_events(db, match_id)],
+        snapshots=[row.state for row in snapshots]
+    )
+
+def test_stored_rows_replay_and_truncate_like_the_engine_log(tmp_path):
+    db, match_id = _session(tmp_path)
+    log = GameEventLog()
+    engine.run_engine(seeded_game(3), config=EngineConfig(mode=EngineMode.STATISTICAL, seed=1), event_log=log)
+
+    # runner처럼 나눠서 저장 (start는 첫 스냅샷 행에만)
+    dump = log.model_dump(mode="json")
+    half = len(dump["snapshots"]) // 2
+    cut = dump["snapshots"][half]["seq"]
+    crud_game.add_match_events(db, match_id, dump["events"][:cut], dump["snapshots"][:half], start=dump["start"])
+    crud_game.add_match_events(db, match_id, dump["events"][cut:], dump["snapshots"][half:])
+    db.commit()
+
+    stored = _stored_log(db, match_id)
+    assert stored.model_dump(mode="json") == dump
+    assert crud_game.count_match_events(db, match_id, before_pa=40) == event_log.seq_at_pa(log, 40)
+    first, latest = crud_game.get_replay_start(db, match_id, cut + 2)
+    assert first.start is not None and latest.seq == cut and latest.start is None
+
+    crud_game.truncate_match_events(db, match_id, 40)
+    assert _stored_log(db, match_id).model_dump(mode="json") == event_log.truncate(log.model_copy(deep=True), 40).model_dump(mode="json")
+
+    # 스냅샷이 하나도 안 남으면 기록 전체를 비움
+    crud_game.truncate_match_events(db, match_id, -1)
+    assert crud_game.count_match_events(db, match_id) == 0 and crud_game.get_match_snapshots(db, match_id) == []
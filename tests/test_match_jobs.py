@@ -0,0 +1,77 @@
+import sys
+import os
+import threading
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "apps", "api"))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src import crud_game
+from src.models import Base, World, Team, Match, JobStatus
+
+def _sessions(tmp_path, matches=4):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"timeout": 30})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    db = Session()
+    world = World(world_name="w")
+    db.add(world)
+    db.commit()
+    home, away = Team(world_id=world.world_id, team_name="h"), Team(world_id=world.world_id, team_name="a")
+    db.add_all([home, away])
+    db.commit()
+    db.add_all([Match(world_id=world.world_id, home_team_id=home.team_id, away_team_id=away.team_id) for _ in range(matches)])
+    db.commit()
+    db.close()
+    return Session
+
+def test_concurrent_play_and_claims_never_share_a_match(tmp_path):
+    Session = _sessions(tmp_path)
+    queued, claimed = [], []
+
+    def play():
+        db = Session()
+        job = crud_game.enqueue_next_scheduled_match(db)
+        queued.append(job.match_id if job else None)
+        db.close()
+
+    def work(worker_id):
+        db = Session()
+        while True:
+            job = crud_game.claim_match_job(db, worker_id, 60)
+            if not job:
+                break
+            claimed.append(job.match_id)
+        db.close()
+
+    for target, args in ((play, [()] * 6), (work, [(f"w{i}",) for i in range(3)])):
+        threads = [threading.Thread(target=target, args=a) for a in args]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert sorted(m for m in queued if m) == [1, 2, 3, 4] and queued.count(None) == 2
+    assert sorted(claimed) == [1, 2, 3, 4]
+
+def test_expired_lease_is_reclaimed_and_old_worker_loses_it(tmp_path):
+    db = _sessions(tmp_path, matches=1)()
+    crud_game.enqueue_match_job(db, 1)
+    job = crud_game.claim_match_job(db, "w1", 60)
+    assert crud_game.claim_match_job(db, "w2", 60) is None
+    assert crud_game.heartbeat_match_job(db, job.job_id, "w1", 60) is not None
+
+    job.lease_expires_at = datetime.utcnow() - timedelta(seconds=1) # w1 stopped heartbeating
+    db.commit()
+    taken = crud_game.claim_match_job(db, "w2", 60)
+    assert (taken.worker_id, taken.attempts) == ("w2", 2)
+    assert crud_game.heartbeat_match_job(db, job.job_id, "w1", 60) is None
+    assert not crud_game.complete_match_job(db, job.job_id, "w1", JobStatus.DONE)
+
+    assert crud_game.request_fast_forward(db, 1).fast_forward_requested
+    assert crud_game.complete_match_job(db, job.job_id, "w2", JobStatus.DONE)
+    assert crud_game.enqueue_match_job(db, 1).status == JobStatus.QUEUED # 끝난 작업은 다시 큐에
@@ -0,0 +1,49 @@
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation import engine, metrics
+from apps.simulation.models import EngineConfig, EngineMode, ValidatorResult
+from apps.simulation.dummy_generator import init_dummy_game
+
+def test_histogram_and_counter_text_format():
+    hist = metrics.Histogram("t_latency_seconds", "test", buckets=(0.1, 1.0))
+    hist.observe(0.05, node="a")
+    hist.observe(0.5, node="a")
+    counter = metrics.Counter("t_calls_total", "test")
+    counter.inc(node='x"y')
+
+    assert hist.lines() == [
+        't_latency_seconds_bucket{node="a",le="0.1"} 1',
+        't_latency_seconds_bucket{node="a",le="1"} 2',
+        't_latency_seconds_bucket{node="a",le="+Inf"} 2',
+        't_latency_seconds_sum{node="a"} 0.55',
+        't_latency_seconds_count{node="a"} 2',
+    ]
+    assert counter.lines() == ['t_calls_total{node="x\\"y"} 1']
+
+def test_engine_records_node_latency_and_match_rate():
+    before_resolver = metrics.NODE_LATENCY.count(node="resolver")
+    before_matches = metrics.MATCHES.value()
+    random.seed(2)
+    steps = []
+    engine.run_engine(init_dummy_game(), config=EngineConfig(mode=EngineMode.STATISTICAL, seed=1), on_step_callback=steps.append)
+
+    assert metrics.NODE_LATENCY.count(node="resolver") - before_resolver == len(steps)
+    assert metrics.NODE_LATENCY.count(node="check_inning") >= len(steps)
+    assert metrics.MATCHES.value() == before_matches + 1
+    assert metrics.LIVE_PA_RATE.lines() == [] # 끝난 경기는 진행 중 gauge에서 제거
+
+    text = metrics.render()
+    assert "# TYPE sim_node_latency_seconds histogram" in text
+    assert 'sim_node_latency_seconds_count{node="update_state"}' in text
+    assert "# TYPE sim_llm_calls_total counter" in text
+
+def test_validator_retries_are_counted():
+    before = metrics.VALIDATOR_RETRIES.value()
+    invalid = ValidatorResult(is_valid=False, reasoning="mismatch", error_type="LogicError")
+    engine._validator_update({"retry_count": 0}, invalid)
+    assert metrics.VALIDATOR_RETRIES.value() == before + 1
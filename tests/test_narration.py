@@ -0,0 +1,46 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from langchain_core.runnables import RunnableLambda
+
+from apps.simulation.models import NarrationBatch, SimulationResult, BroadcastData
+from apps.simulation.dummy_generator import init_dummy_game
+from apps.simulation.narration import HalfInningNarrator, NarrationPlay
+
+def _play(game, seq, code, summary):
+    result = SimulationResult(reasoning="", result_code=code, description=summary)
+    game.logs.append(f"[1회초] {summary} (주자: 없음, 득점: 0)")
+    broadcast = BroadcastData(
+        match_id=game.match_id, inning=1, half="TOP", outs=seq, home_score=0, away_score=0,
+        current_batter={"name": "타자"}, current_pitcher={"name": "투수"},
+        runners=[None, None, None], result=result, next_batter={}
+    )
+    return NarrationPlay(seq, broadcast, len(game.logs) - 1, game.logs[-1], 0)
+
+def test_half_inning_is_narrated_in_one_call():
+    calls = []
+    def narrate(inputs):
+        calls.append(inputs)
+        return NarrationBatch(lines=["좌중간을 가르는 2루타!", "높이 뜬 공, 중견수 플라이 아웃."])
+
+    game = init_dummy_game()
+    narrator = HalfInningNarrator(game, RunnableLambda(narrate), broadcast_path=None)
+    narrator.add(_play(game, 0, "2B", "2루타"))
+    narrator.add(_play(game, 1, "FO", "중견수 플라이"))
+    narrator.close()
+
+    assert len(calls) == 1 and calls[0]["count"] == 2
+    assert narrator.drain() == [(0, "좌중간을 가르는 2루타!"), (1, "높이 뜬 공, 중견수 플라이 아웃.")]
+    assert game.logs[0].startswith("[1회초] 좌중간을 가르는 2루타!")
+
+def test_failed_or_contradicting_narration_keeps_summary():
+    game = init_dummy_game()
+    # 멘트 개수 부족 + 결과 코드와 모순되는 멘트
+    narrator = HalfInningNarrator(game, RunnableLambda(lambda _: NarrationBatch(lines=["헛스윙 삼진!"])), broadcast_path=None)
+    narrator.add(_play(game, 0, "HR", "홈런"))
+    narrator.add(_play(game, 1, "SO", "삼진"))
+    narrator.close()
+    assert narrator.drain() == [(0, "홈런"), (1, "삼진")]
@@ -0,0 +1,86 @@
+import sys
+import os
+import json
+import asyncio
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from apps.simulation import engine
+from apps.simulation.models import (
+    EngineConfig, EngineMode, DirectorContext, PitcherDecision, BatterDecision, SimulationResult,
+    PitchType, PitchLocation, BattingStyle
+)
+from apps.simulation.dummy_generator import init_dummy_game
+
+DESCRIPTION = "바깥쪽 꽉 찬 직구에 헛스윙 삼진! 타자 고개를 떨굽니다."
+CONTENT = json.dumps({"reasoning": "투수 우세", "result_code": "SO", "description": DESCRIPTION}, ensure_ascii=False)
+
+def _sse(request: httpx.Request) -> httpx.Response:
+    """OpenAI 스트리밍 응답 흉내: JSON 본문을 6글자씩 delta로 전송"""
+    assert json.loads(request.content)["stream"]
+    events = []
+    for i in range(0, len(CONTENT), 6):
+        delta = {"content": CONTENT[i:i + 6]}
+        if i == 0:
+            delta["role"] = "assistant"
+        events.append({"id": "x", "object": "chat.completion.chunk", "created": 0, "model": "gpt-4o-mini",
+                       "choices": [{"index": 0, "delta": delta, "finish_reason": None}]})
+    events.append({"id": "x", "object": "chat.completion.chunk", "created": 0, "model": "gpt-4o-mini",
+                   "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+    body = "".join("data: " + json.dumps(e, ensure_ascii=False) + "\n\n" for e in events) + "data: [DONE]\n\n"
+    return httpx.Response(200, content=body.encode(), headers={"content-type": "text/event-stream"})
+
+def _llm():
+    return ChatOpenAI(
+        model="gpt-4o-mini", api_key="sk-test",
+        http_client=httpx.Client(transport=httpx.MockTransport(_sse)),
+        http_async_client=httpx.AsyncClient(transport=httpx.MockTransport(_sse)),
+    )
+
+def _state(frames):
+    return {
+        "game": init_dummy_game(),
+        "config": EngineConfig(),
+        "director_ctx": DirectorContext(),
+        "pitcher_decision": PitcherDecision(pitch_type=PitchType.FASTBALL, location=PitchLocation.MIDDLE, description="-"),
+        "batter_decision": BatterDecision(style=BattingStyle.CAUTIOUS, description="-"),
+        "validator_result": None,
+        "retry_count": 0,
+        "prompt_context": {},
+        "live_sink": frames.append
+    }
+
+def test_resolver_streams_description_tokens():
+    engine.llm = _llm()
+    try:
+        frames = []
+        result = engine.resolver_node(_state(frames))["last_result"]
+        assert result == SimulationResult(reasoning="투수 우세", result_code="SO", description=DESCRIPTION)
+
+        texts = [f["text"] for f in frames]
+        assert len(texts) > 3 and texts[-1] == DESCRIPTION
+        assert all(DESCRIPTION.startswith(t) for t in texts) # 점점 길어지는 접두사
+        assert all(f["type"] == "NARRATION_PARTIAL" and not f["final"] and f["seq"] == 0 for f in frames)
+
+        frames.clear()
+        result = asyncio.run(engine.aresolver_node(_state(frames)))["last_result"]
+        assert result.result_code == "SO" and frames[-1]["text"] == DESCRIPTION
+    finally:
+        engine.llm = None
+
+def test_stream_chain_requires_chat_model():
+    engine.llm = object() # 카세트 / 테스트용 LLM -> 일반 체인으로 폴백
+    try:
+        assert engine.get_stream_chain("resolver") is None
+    finally:
+        engine.llm = None
+
+def test_update_state_publishes_final_frame_per_plate_appearance():
+    frames = []
+    engine.run_engine(init_dummy_game(), config=EngineConfig(mode=EngineMode.STATISTICAL, seed=3), on_live_callback=frames.append)
+    assert len(frames) >= 51 and [f["seq"] for f in frames] == list(range(len(frames)))
+    assert all(f["type"] == "NARRATION_FINAL" and f["final"] and f["data"]["result"]["description"] == f["text"] for f in frames)
@@ -5,7 +5,7 @@ import os
 sys.path.append(os.getcwd())
 
 from apps.simulation.models import GameState, SimulationResult, PlayerState, Role, Character
-from apps.simulation.rule_engine import BaseballRuleEngine
+from apps.simulation.rule_engine import BaseballRuleEngine, TRANSITIONS, PLAYS, PLAY_INDEX, play_index
 from apps.simulation.engine import run_engine
 from apps.simulation.dummy_generator import init_dummy_game
 
@@ -56,6 +56,46 @@ def test_loaded_bases_scoring():
     
     print("✅ Loaded Bases Single Test Passed!")
 
+def _runners(game, mask):
+    runners = game.get_offense_team().roster[3:6]
+    game.bases.basec1, game.bases.basec2, game.bases.basec3 = (runners[i] if mask >> i & 1 else None for i in range(3))
+    return runners
+
+def _play(game, code):
+    return BaseballRuleEngine.apply_result(game, SimulationResult(result_code=code, description="", reasoning=""))
+
+def test_codes_outside_the_basic_set_are_explicit_table_entries():
+    game = init_dummy_game()
+    r1, r2, r3 = _runners(game, 0b101) # 1, 3루
+    batter = game.get_current_batter()
+
+    # 몸에 맞는 공 / 고의사구: 밀어내기만 (3루 주자는 그대로)
+    assert _play(game, "HBP") == 0 and game.outs == 0
+    assert (game.bases.basec1, game.bases.basec2, game.bases.basec3) == (batter, r1, r3)
+    assert _play(game, "IBB") == 1 and game.away_score == 1 # 만루 밀어내기
+
+    # 직선타: 아웃 1개, 진루 없음
+    _runners(game, 0b011)
+    assert _play(game, "LO") == 0 and game.outs == 1 and game.bases.basec3 is None
+
+    # 실책 출루: 타자 1루, 주자 한 베이스씩
+    _runners(game, 0b110)
+    assert _play(game, "E") == 1
+    assert (game.bases.basec1, game.bases.basec2, game.bases.basec3) == (batter, None, r2)
+
+    # 코드 표에 없는 코드: 예전 부분 문자열 판별, 그래도 모르면 아무 일도 없음
+    assert PLAYS[play_index("GO_DP")] == "OUT" and PLAYS[play_index("lo")] == "LO"
+    before = (game.outs, game.away_score, game.bases.model_dump())
+    assert _play(game, "???") == 0 and (game.outs, game.away_score, game.bases.model_dump()) == before
+
+def test_transition_table_shape():
+    assert len(TRANSITIONS) == len(PLAYS)
+    assert all(len(row) == 3 and all(len(cells) == 8 for cells in row) for row in TRANSITIONS)
+    hr = TRANSITIONS[PLAY_INDEX["HR"]][2][7]
+    assert (hr.bases, hr.runs, hr.outs, hr.sources) == (0, 4, 0, (None, None, None))
+    so = TRANSITIONS[PLAY_INDEX["SO"]][0][5]
+    assert (so.bases, so.outs, so.moves) == (5, 1, False)
+
 def test_full_simulation_integration():
     print("\n>>> Testing Full Simulation Integration...")
     game = init_dummy_game()
@@ -0,0 +1,42 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation.models import SimulationResult
+from apps.simulation.rule_validator import validate_locally, normalize_code
+
+def _result(code: str, description: str) -> SimulationResult:
+    return SimulationResult(reasoning="Test", result_code=code, description=description)
+
+def test_matching_description_is_valid():
+    for code, desc in [
+        ("1B", "이정후가 투수 옆을 스치는 강한 타구로 중전 1루타를 만들어냅니다!"),
+        ("SO", "바깥쪽 꽉 찬 직구에 방망이가 헛돌며 삼진 아웃!"),
+        ("2B", "좌중간을 완전히 가르는 타구! 타자 주자는 여유 있게 2루까지 들어갑니다. 2루타!"),
+        ("HR", "담장을 넘어가는 큼지막한 홈런!"),
+        ("strikeout", "루킹 삼진으로 물러납니다."),
+    ]:
+        res = validate_locally(_result(code, desc))
+        assert res is not None and res.is_valid, (code, desc)
+
+def test_contradiction_is_invalid():
+    res = validate_locally(_result("GO", "담장을 넘깁니다! 홈런!"))
+    assert res is not None and not res.is_valid
+    assert res.error_type == "LogicError"
+    
+    res = validate_locally(_result("1B", "우중간을 가르는 2루타!"))
+    assert res is not None and not res.is_valid
+
+def test_unknown_code_is_invalid():
+    res = validate_locally(_result("DOUBLE_PLAY_MAYBE", "병살타"))
+    assert res is not None and not res.is_valid
+    assert res.error_type == "RuleViolation"
+    assert normalize_code(" hr ") == ("HR", "HIT")
+
+def test_ambiguous_description_escalates():
+    # 키워드 없음
+    assert validate_locally(_result("FO", "타구가 높이 떠오릅니다...")) is None
+    # 상충 (플라이 아웃이지만 "홈런성" 언급)
+    assert validate_locally(_result("FO", "홈런성 타구를 중견수가 펜스 앞에서 잡아내는 플라이 아웃!")) is None
@@ -0,0 +1,79 @@
+import sys
+import os
+import asyncio
+import itertools
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation import engine
+from apps.simulation.models import (
+    EngineConfig, EngineMode, DirectorSchedule, DirectorContext, ManagerDecision, PitcherDecision, BatterDecision,
+    PlateAppearancePlan, SimulationResult, PitchType, PitchLocation, BattingStyle, Half
+)
+from apps.simulation.dummy_generator import init_dummy_game
+
+def _plan_responses():
+    """PlateAppearancePlan 응답: n번째 호출의 Director는 wind_direction = "call n" (어느 호출의 환경인지 구분)"""
+    counter = itertools.count()
+    def plan(rng):
+        return PlateAppearancePlan(
+            director=DirectorContext(wind_direction=f"call {next(counter)}"),
+            home_manager=ManagerDecision(description="홈 작전"),
+            away_manager=ManagerDecision(description="원정 작전"),
+            pitcher=PitcherDecision(pitch_type=PitchType.SLIDER, location=PitchLocation.LOW, description="투구"),
+            batter=BatterDecision(style=BattingStyle.AGGRESSIVE, description="타격")
+        )
+    return {PlateAppearancePlan: plan}
+
+def _state(**updates):
+    state = {
+        "game": init_dummy_game(), "config": EngineConfig(mode=EngineMode.SINGLE_CALL),
+        "director_ctx": DirectorContext(), "pa_count": 0, "director_pending": False, "director_last_pa": 0
+    }
+    state.update(updates)
+    return state
+
+def test_plan_sets_decisions_and_director_only_when_due(fake_llm):
+    llm = fake_llm(_plan_responses())
+
+    update = engine.plate_appearance_node(_state())
+    assert update["pitcher_decision"].pitch_type == PitchType.SLIDER
+    assert update["batter_decision"].style == BattingStyle.AGGRESSIVE
+    assert update["home_manager_decision"].description == "홈 작전"
+    assert "director_ctx" not in update # 하프이닝 도중: 캐시된 환경 유지
+
+    update = asyncio.run(engine.aplate_appearance_node(_state(director_pending=True, pa_count=3)))
+    assert update["director_ctx"].wind_direction == "call 1"
+    assert update["director_last_pa"] == 3 and not update["director_pending"]
+    assert llm.calls[PlateAppearancePlan] == 2
+
+def test_single_call_game_makes_one_plan_call_per_plate_appearance(fake_llm):
+    llm = fake_llm(_plan_responses())
+    steps = []
+    def on_step(game):
+        steps.append((game.inning, game.half, game.director.wind_direction))
+
+    final = engine.run_engine(init_dummy_game(), config=EngineConfig(mode=EngineMode.SINGLE_CALL), on_step_callback=on_step)
+
+    assert final.inning >= 10 and len(steps) >= 51
+    assert llm.calls[PlateAppearancePlan] == len(steps)
+    for schema in (DirectorContext, ManagerDecision, PitcherDecision, BatterDecision):
+        assert llm.calls[schema] == 0
+    assert llm.calls[SimulationResult] >= len(steps)
+
+    # HALF_INNING 스케줄: 하프이닝 첫 타석의 계획만 환경을 바꾸고, 나머지 타석은 그 환경을 재사용
+    first_pa = {}
+    for pa, (inning, half, wind) in enumerate(steps):
+        first_pa.setdefault((inning, half), pa)
+        assert wind == f"call {first_pa[(inning, half)]}", (pa, inning, half)
+    assert len(first_pa) >= 18 and (1, Half.TOP) in first_pa
+
+def test_every_pa_schedule_applies_every_plan(fake_llm):
+    fake_llm(_plan_responses())
+    winds = []
+    engine.run_engine(
+        init_dummy_game(), config=EngineConfig(mode=EngineMode.SINGLE_CALL, director_schedule=DirectorSchedule.EVERY_PA),
+        on_step_callback=lambda game: winds.append(game.director.wind_direction)
+    )
+    assert winds == [f"call {pa}" for pa in range(len(winds))]
@@ -0,0 +1,81 @@
+import sys
+import os
+import itertools
+import threading
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation import engine
+from apps.simulation.models import (
+    EngineConfig, DirectorContext, PitcherDecision, BatterDecision, SimulationResult, ValidatorResult,
+    PitchType, PitchLocation, BattingStyle
+)
+from apps.simulation.dummy_generator import init_dummy_game
+
+def _one_good_candidate():
+    """판정 요청 중 두 번째 응답만 코드/멘트가 일치 (나머지는 1B인데 '삼진')"""
+    calls = itertools.count()
+    lock = threading.Lock()
+
+    def respond(rng):
+        with lock:
+            n = next(calls)
+        if n == 1:
+            return SimulationResult(reasoning="", result_code="SO", description="헛스윙 삼진!")
+        return SimulationResult(reasoning="", result_code="1B", description="헛스윙 삼진!")
+    return {SimulationResult: respond}
+
+def _state(k: int):
+    return {
+        "game": init_dummy_game(),
+        "config": EngineConfig(speculative_candidates=k),
+        "director_ctx": DirectorContext(),
+        "pitcher_decision": PitcherDecision(pitch_type=PitchType.FASTBALL, location=PitchLocation.MIDDLE, description="-"),
+        "batter_decision": BatterDecision(style=BattingStyle.CAUTIOUS, description="-"),
+        "validator_result": None,
+        "retry_count": 0,
+        "prompt_context": {}
+    }
+
+def test_first_passing_candidate_is_taken_without_retry(fake_llm):
+    llm = fake_llm(_one_good_candidate())
+    state = _state(3)
+    state.update(engine.resolver_node(state))
+    assert state["last_result"].result_code == "SO"
+    assert state["prevalidated"]
+
+    state.update(engine.validator_node(state))
+    assert engine.route_validator(state) == "continue"
+    assert not state["prevalidated"] and state["retry_count"] == 0
+    assert llm.calls[ValidatorResult] == 0 # 로컬 검증으로 충분
+
+AMBIGUOUS = SimulationResult(reasoning="", result_code="1B", description="타구가 날아갑니다") # 로컬 판단 보류
+LOCAL_PASS = SimulationResult(reasoning="", result_code="SO", description="헛스윙 삼진!")
+
+def test_ambiguous_candidate_before_a_local_pass_is_validated_first(fake_llm):
+    llm = fake_llm()
+    state = _state(3)
+    verdicts, pending = engine._speculative_local(state, [AMBIGUOUS, LOCAL_PASS, AMBIGUOUS])
+    assert pending == [0] # 로컬 통과 뒤의 애매한 후보는 검증하지 않음
+    assert verdicts[1].is_valid
+
+    # 순차 재시도처럼 LLM이 0번을 승인하면 0번 채택
+    picked = engine._speculative_resolve(state, [AMBIGUOUS, LOCAL_PASS, AMBIGUOUS])
+    assert picked["last_result"] is AMBIGUOUS and picked["validator_result"].is_valid
+    assert llm.calls[ValidatorResult] == 1
+
+    # 거절하면 다음 후보
+    fake_llm({ValidatorResult: lambda rng: ValidatorResult(is_valid=False, reasoning="불일치")})
+    assert engine._speculative_resolve(state, [AMBIGUOUS, LOCAL_PASS])["last_result"] is LOCAL_PASS
+
+def test_all_candidates_rejected_falls_back_to_retry():
+    candidates = [SimulationResult(reasoning="", result_code="1B", description="헛스윙 삼진!") for _ in range(2)]
+    state = _state(2)
+    verdicts, pending = engine._speculative_local(state, candidates)
+    assert pending == [] and all(not v.is_valid for v in verdicts)
+
+    state.update(engine._speculative_pick(candidates, verdicts))
+    state.update(engine.validator_node(state))
+    assert engine.route_validator(state) == "retry"
+    assert state["retry_count"] == 1
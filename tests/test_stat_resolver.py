@@ -0,0 +1,77 @@
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation.models import EngineConfig, EngineMode, SimulationStatus
+from apps.simulation.dummy_generator import init_dummy_game
+from apps.simulation.stat_resolver import StatResolver, OUTCOMES, scale_rating, clamp_rating
+
+def test_probabilities_are_normalized():
+    game = init_dummy_game()
+    probs = StatResolver().outcome_probabilities(game)
+    assert set(probs) == set(OUTCOMES)
+    assert abs(sum(probs.values()) - 1.0) < 1e-9
+    assert all(p > 0 for p in probs.values())
+
+def test_ratings_shift_outcomes():
+    game = init_dummy_game()
+    batter = game.get_current_batter().character
+    resolver = StatResolver()
+    
+    batter.power, batter.power_left, batter.power_right = 3, 30, 30
+    weak = resolver.outcome_probabilities(game)
+    batter.power, batter.power_left, batter.power_right = 10, 95, 95
+    strong = resolver.outcome_probabilities(game)
+    assert strong["HR"] > weak["HR"] * 2
+    
+    # DB 캐릭터의 1-10 스케일 기본 능력치 정규화
+    assert scale_rating(7.5) == 75.0
+    assert scale_rating(12) == 100.0
+
+def test_error_prone_defense_allows_more_errors():
+    game = init_dummy_game()
+    resolver = StatResolver()
+    fielders = [p.character for p in game.get_defense_team().get_lineup()]
+    for c in fielders:
+        c.defense_error = 20
+    sure_handed = resolver.outcome_probabilities(game)
+    for c in fielders:
+        c.defense_error = 90
+    error_prone = resolver.outcome_probabilities(game)
+    assert error_prone["E"] > sure_handed["E"] * 2
+    assert error_prone["GO"] < sure_handed["GO"]
+
+def test_ratings_keep_their_own_scale():
+    # 0-100 능력치는 환산하지 않음: 선구안 8은 80이 아니라 아주 낮은 값
+    assert clamp_rating(8) == 8.0 and clamp_rating(120) == 100.0
+    game = init_dummy_game()
+    resolver = StatResolver()
+    batter = game.get_current_batter().character
+    walks = []
+    for eye in (8, 12, 80):
+        batter.eye = eye
+        walks.append(resolver.outcome_probabilities(game)["BB"])
+    assert walks[0] < walks[1] < walks[2]
+
+    # 좌/우 스플릿도 0-100: 10 이하라도 10배 하지 않으므로 능력치 순서가 유지됨
+    contact = []
+    for split in (10, 12):
+        batter.contact_left = batter.contact_right = split
+        contact.append(resolver.outcome_probabilities(game)["1B"])
+    assert contact[0] < contact[1]
+
+def test_seeded_resolver_is_deterministic():
+    game = init_dummy_game()
+    r1, r2 = StatResolver(random.Random(7)), StatResolver(random.Random(7))
+    assert [r1.resolve(game).result_code for _ in range(20)] == [r2.resolve(game).result_code for _ in range(20)]
+
+def test_statistical_mode_finishes_without_llm():
+    from apps.simulation.engine import run_engine
+    game = init_dummy_game()
+    final_state = run_engine(game, config=EngineConfig(mode=EngineMode.STATISTICAL, seed=1))
+    assert final_state.status == SimulationStatus.FINISHED
+    assert final_state.inning >= 10
+    assert final_state.home_score != final_state.away_score
@@ -0,0 +1,47 @@
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from apps.simulation.models import Role
+from apps.simulation.dummy_generator import init_dummy_game
+
+def _team():
+    random.seed(2)
+    return init_dummy_game().home_team
+
+def _filtered(team, role):
+    return [p for p in team.roster if p.character.role == role]
+
+def test_indexes_match_roster_filter_and_follow_roster_changes():
+    team = _team()
+    assert list(team.get_lineup()) == _filtered(team, Role.BATTER)
+    assert list(team.get_pitchers()) == _filtered(team, Role.PITCHER)
+    assert team.get_lineup() is team.get_lineup() # 매 호출 새 리스트를 만들지 않음
+    assert team.get_batter(len(team.get_lineup()) + 1) is team.get_lineup()[0]
+
+    # 다른 리스트로 교체 / 추가 -> 자동 갱신
+    team.roster = [p for p in team.roster if p is not team.get_lineup()[0]]
+    assert list(team.get_lineup()) == _filtered(team, Role.BATTER)
+    team.roster.append(team.get_pitchers()[0].model_copy(deep=True))
+    assert len(team.get_pitchers()) == len(_filtered(team, Role.PITCHER))
+
+    # 제자리 교체는 invalidate_indexes()
+    sub = team.get_lineup()[0].model_copy(deep=True)
+    team.roster[team.roster.index(team.get_lineup()[0])] = sub
+    team.invalidate_indexes()
+    assert team.get_batter(1) is sub
+
+def test_copies_get_their_own_indexes_and_pitching_changes_still_work():
+    team = _team()
+    team.get_lineup()
+    copy = team.model_copy(deep=True)
+    assert all(any(p is q for q in copy.roster) for p in copy.get_lineup())
+    assert not any(p is q for p in copy.get_lineup() for q in team.roster)
+    assert "_roster_index" not in team.model_dump()
+
+    starter = team.get_pitcher()
+    assert team.change_pitcher() and team.get_pitcher() is team.get_pitchers()[1] is not starter
+    assert copy.get_pitcher() is copy.get_pitchers()[0]
@@ -0,0 +1,67 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from types import SimpleNamespace
+
+from apps.simulation import engine
+from apps.simulation.models import (
+    EngineConfig, DirectorContext, PitcherDecision, BatterDecision, PitchType, PitchLocation, BattingStyle
+)
+from apps.simulation.dummy_generator import init_dummy_game
+from apps.simulation.telemetry import TokenMeter, estimate_tokens
+
+def _state(compact: bool):
+    return {
+        "game": init_dummy_game(),
+        "config": EngineConfig(compact_prompts=compact),
+        "director_ctx": DirectorContext(),
+        "pitcher_decision": PitcherDecision(pitch_type=PitchType.FASTBALL, location=PitchLocation.MIDDLE, description="-"),
+        "batter_decision": BatterDecision(style=BattingStyle.CAUTIOUS, description="-"),
+        "validator_result": None,
+        "prompt_context": {}
+    }
+
+def _prompt_tokens(call, state) -> int:
+    name, inputs = call(state)
+    if not isinstance(inputs, list):
+        inputs = [inputs]
+    return sum(estimate_tokens(engine.CHAIN_SPECS[name][0].format(**i)) for i in inputs)
+
+def test_compact_prompts_are_much_smaller(monkeypatch):
+    # 체인 대신 이름만 돌려받아 렌더링한 프롬프트 크기를 비교
+    monkeypatch.setattr(engine, "get_chain", lambda name: name)
+    for call in (engine._resolver_call, engine._manager_call):
+        full = _prompt_tokens(call, _state(False))
+        compact = _prompt_tokens(call, _state(True))
+        assert compact <= full * 0.6, (call.__name__, full, compact)
+
+def test_defense_context_is_cached_per_half_inning(monkeypatch):
+    monkeypatch.setattr(engine, "get_chain", lambda name: name)
+    state = _state(True)
+    _, first = engine._resolver_call(state)
+    assert "defense_summary" in state["prompt_context"]
+
+    state["prompt_context"]["defense_summary"] = "cached"
+    _, second = engine._resolver_call(state)
+    assert second["defense_lineup"] == "cached" != first["defense_lineup"]
+
+def test_token_meter_collects_estimates_and_reported_usage():
+    meter = TokenMeter()
+    meter.record_call("resolver", ["타석 판정 prompt"], latency=0.5)
+    meter.record_call("manager", ["a" * 40, "b" * 40], latency=0.25)
+
+    message = SimpleNamespace(usage_metadata={"input_tokens": 120, "output_tokens": 30})
+    response = SimpleNamespace(llm_output=None, generations=[[SimpleNamespace(message=message)]])
+    meter.callback_handler().on_llm_end(response, run_id=None, tags=["node:resolver"])
+    meter.callback_handler().on_llm_end(
+        SimpleNamespace(llm_output={"token_usage": {"prompt_tokens": 80, "completion_tokens": 20}}, generations=[]),
+        run_id=None, tags=["node:manager"]
+    )
+
+    stats = meter.snapshot()
+    assert stats["resolver"]["calls"] == 1 and stats["resolver"]["prompt_tokens"] == 120
+    assert stats["manager"]["calls"] == 2 and stats["manager"]["estimated_prompt_tokens"] == 22
+    assert meter.totals()["completion_tokens"] == 50